@@ -1,30 +1,68 @@
 """Job Scrapers API - FastAPI application for job listings."""
 
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from src.core.auth import api_key_cache
+from src.core.conditional import CacheHeadersMiddleware
 from src.core.config import settings
-from src.core.database import close_repository, init_repository
+from src.core.database import (
+    close_async_repository,
+    close_repository,
+    init_async_repository,
+    init_repository,
+)
 from src.core.exceptions import (
+    ChangeFeedExpiredError,
     DatabaseError,
     InvalidInputError,
     JobNotFoundError,
+    NotModifiedError,
+    RateLimitExceededError,
     UnauthorizedError,
 )
-from src.routers import favorites, jobs
+from src.core.instrumentation import InstrumentationMiddleware
+from src.core.metrics import MetricsMiddleware, cache_samples, track_repository
+from src.core.metrics import registry as metrics_registry
+from src.core.rate_limit import RateLimitHeadersMiddleware
+from src.core.response_cache import response_cache
+from src.core.usage import usage_buffer
+from src.routers import admin, favorites, jobs, metrics
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
     # Startup
-    init_repository()
+    # The sync repository also backs authentication and usage tracking
+    repository = init_repository()
+    if not settings.allow_legacy_api_keys:
+        legacy_keys = len(repository.get_legacy_api_keys())
+        if legacy_keys:
+            logger.warning(
+                f"{legacy_keys} API key(s) have no lookup_id and will be rejected; "
+                "set ALLOW_LEGACY_API_KEYS=true until they have been used once"
+            )
+    if settings.metrics_enabled:
+        track_repository(repository)
+    if settings.async_database:
+        async_repository = await init_async_repository()
+        if settings.metrics_enabled:
+            track_repository(async_repository.repository, prefix="async_")
+    usage_buffer.start(repository)
+    metrics_registry.start()
     yield
     # Shutdown
+    metrics_registry.stop()
+    usage_buffer.stop()
+    await close_async_repository()
     close_repository()
 
 
@@ -42,10 +80,31 @@ app.add_middleware(
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_allow_methods,
     allow_headers=settings.cors_allow_headers,
+    expose_headers=settings.cors_expose_headers,
 )
+app.add_middleware(RateLimitHeadersMiddleware)
+app.add_middleware(CacheHeadersMiddleware)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+    metrics_registry.add_collector(
+        "cache:response", lambda: cache_samples("response", response_cache.stats())
+    )
+    metrics_registry.add_collector(
+        "cache:api_key", lambda: cache_samples("api_key", api_key_cache.stats())
+    )
+# Outermost, so the timings cover the other middleware as well
+if settings.request_instrumentation:
+    app.add_middleware(InstrumentationMiddleware)
 
-app.include_router(jobs.router)
-app.include_router(favorites.router)
+if settings.async_database:
+    app.include_router(jobs.async_router)
+    app.include_router(favorites.async_router)
+else:
+    app.include_router(jobs.router)
+    app.include_router(favorites.router)
+app.include_router(admin.router)
 
 
 # Exception handlers
@@ -57,6 +116,12 @@ async def job_not_found_handler(
     return JSONResponse(status_code=404, content={"error": str(exc)})
 
 
+@app.exception_handler(NotModifiedError)
+async def not_modified_handler(request: Request, exc: NotModifiedError) -> Response:
+    """Answer a matching conditional GET with an empty 304."""
+    return Response(status_code=304, headers=exc.headers)
+
+
 @app.exception_handler(InvalidInputError)
 async def invalid_input_handler(
     request: Request, exc: InvalidInputError
@@ -65,6 +130,14 @@ async def invalid_input_handler(
     return JSONResponse(status_code=400, content={"error": str(exc)})
 
 
+@app.exception_handler(ChangeFeedExpiredError)
+async def change_feed_expired_handler(
+    request: Request, exc: ChangeFeedExpiredError
+) -> JSONResponse:
+    """Handle change feed positions that were pruned from the log."""
+    return JSONResponse(status_code=410, content={"error": str(exc)})
+
+
 @app.exception_handler(UnauthorizedError)
 async def unauthorized_handler(
     request: Request, exc: UnauthorizedError
@@ -73,6 +146,20 @@ async def unauthorized_handler(
     return JSONResponse(status_code=401, content={"error": str(exc)})
 
 
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_handler(
+    request: Request, exc: RateLimitExceededError
+) -> JSONResponse:
+    """Handle rate limit errors."""
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": f"Rate limit exceeded. Retry in {exc.status.retry_after} seconds."
+        },
+        headers={"Retry-After": str(exc.status.retry_after), **exc.status.headers()},
+    )
+
+
 @app.exception_handler(DatabaseError)
 async def database_error_handler(request: Request, exc: DatabaseError) -> JSONResponse:
     """Handle database errors."""
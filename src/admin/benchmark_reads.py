@@ -0,0 +1,195 @@
+"""CLI tool to benchmark read throughput with and without the SQLite profile."""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.database import sqlite_pragmas
+from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import SQLiteRepository
+
+CLASSIFICATIONS = ["IT", "Sales", "Healthcare", "Education", "Finance"]
+ARRANGEMENTS = ["Remote", "Hybrid", "On-site"]
+
+
+def _seed(db_path: Path, jobs: int) -> None:
+    """Create a database with synthetic listings and details."""
+    repository = SQLiteRepository(f"sqlite:///{db_path}")
+    started = datetime(2025, 1, 1)
+    with Session(repository.engine) as session:
+        for index in range(jobs):
+            job_id = f"job-{index:07d}"
+            session.add(
+                JobListingModel(
+                    job_id=job_id,
+                    title=f"Software Engineer {index}",
+                    job_details_url="https://example.com",
+                    job_summary="Build and run services",
+                    company_name=f"Company {index % 500}",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=started + timedelta(minutes=index),
+                    job_classification=CLASSIFICATIONS[index % len(CLASSIFICATIONS)],
+                    work_arrangements=ARRANGEMENTS[index % len(ARRANGEMENTS)],
+                )
+            )
+            session.add(JobDetailsModel(job_id=job_id, details="Details " * 50))
+        session.commit()
+    repository.close()
+
+
+def _read(repository: SQLiteRepository, jobs: int) -> None:
+    """Run one request-shaped read query."""
+    choice = random.random()
+    if choice < 0.4:
+        repository.get_all_jobs(
+            job_classification=random.choice(CLASSIFICATIONS), limit=50
+        )
+    elif choice < 0.8:
+        repository.get_job_by_id(f"job-{random.randrange(jobs):07d}")
+    else:
+        repository.get_all_jobs(skip=random.randrange(0, jobs // 2), limit=50)
+
+
+def _write_loop(db_path: Path, stop: threading.Event, interval: float) -> None:
+    """Simulate the scraper: short write transactions on a plain connection."""
+    engine = create_engine(f"sqlite:///{db_path}")
+    while not stop.is_set():
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "UPDATE job_listings SET job_summary = job_summary "
+                    "WHERE job_id IN (SELECT job_id FROM job_listings "
+                    "ORDER BY random() LIMIT 200)"
+                )
+            )
+        stop.wait(interval)
+    engine.dispose()
+
+
+def _run(
+    db_path: Path,
+    pragmas: dict,
+    read_only_pool: bool,
+    args: argparse.Namespace,
+) -> dict:
+    """Measure reads/sec and latency for one repository configuration."""
+    repository = SQLiteRepository(
+        f"sqlite:///{db_path}",
+        sqlite_pragmas=pragmas,
+        read_only_pool=read_only_pool,
+    )
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop = threading.Event()
+    deadline = time.perf_counter() + args.seconds
+
+    def reader() -> None:
+        nonlocal errors
+        local, failed = [], 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                _read(repository, args.jobs)
+                local.append(time.perf_counter() - started)
+            except Exception:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    writer = threading.Thread(
+        target=_write_loop, args=(db_path, stop, args.write_interval)
+    )
+    if args.write_interval > 0:
+        writer.start()
+    readers = [threading.Thread(target=reader) for _ in range(args.threads)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    stop.set()
+    if writer.is_alive():
+        writer.join()
+    repository.close()
+
+    latencies.sort()
+    return {
+        "reads_per_second": len(latencies) / args.seconds,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    """Compare read throughput of the default and tuned SQLite settings."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark read throughput with and without the SQLite profile"
+    )
+    parser.add_argument("--jobs", type=int, default=20000, help="Jobs to generate")
+    parser.add_argument("--threads", type=int, default=8, help="Reader threads")
+    parser.add_argument(
+        "--seconds", type=float, default=10.0, help="Duration of each run"
+    )
+    parser.add_argument(
+        "--write-interval",
+        type=float,
+        default=0.05,
+        help="Seconds between simulated scraper writes (0 disables writes)",
+    )
+
+    args = parser.parse_args()
+
+    # Settings may disable tuning; the benchmark always compares the full profile
+    pragmas = sqlite_pragmas() or {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+    profiles = [
+        ("default", {}, False),
+        ("tuned", pragmas, False),
+        ("tuned + read-only pool", pragmas, True),
+    ]
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"\nSeeding {args.jobs} jobs...")
+            _seed(Path(directory) / "seed.db", args.jobs)
+            seed = (Path(directory) / "seed.db").read_bytes()
+
+            print(f"\n{'Profile':<24} {'reads/s':>10} {'p50 ms':>8} {'p95 ms':>8}")
+            print("-" * 60)
+            for name, profile, read_only_pool in profiles:
+                # Fresh copy per run: journal_mode=WAL persists in the file
+                db_path = Path(directory) / f"{name.replace(' ', '')}.db"
+                db_path.write_bytes(seed)
+                result = _run(db_path, profile, read_only_pool, args)
+                print(
+                    f"{name:<24} {result['reads_per_second']:>10.0f} "
+                    f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f}"
+                    + (f"  ({result['errors']} errors)" if result["errors"] else "")
+                )
+            print()
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
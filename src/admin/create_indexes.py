@@ -0,0 +1,56 @@
+"""CLI tool to create missing database indexes."""
+
+import argparse
+import sys
+import time
+
+from src.core.config import settings
+from src.core.repositories import SQLiteRepository
+
+
+def main() -> None:
+    """Create declared indexes missing from the database and refresh statistics."""
+    parser = argparse.ArgumentParser(
+        description="Create missing indexes for Jobs Scraper API"
+    )
+    parser.add_argument(
+        "--skip-analyze",
+        action="store_true",
+        help="Do not run ANALYZE after creating indexes",
+    )
+
+    args = parser.parse_args()
+    repo = None
+
+    try:
+        # Open the database without creating indexes at startup
+        repo = SQLiteRepository(
+            settings.database_url,
+            full_text_search=settings.full_text_search,
+            create_indexes=False,
+        )
+
+        started = time.perf_counter()
+        created = repo.ensure_indexes()
+        if not args.skip_analyze:
+            repo.analyze()
+        elapsed = time.perf_counter() - started
+
+        if created:
+            print(f"\n✅ Created {len(created)} index(es) in {elapsed:.2f}s:")
+            for name in created:
+                print(f"   {name}")
+            print()
+        else:
+            print("\n✅ All indexes already exist.\n")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        if repo is not None:
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,12 @@ import argparse
 import sys
 
 from src.core.database import close_repository, init_repository
-from src.core.security import generate_api_key, get_key_prefix, hash_api_key
+from src.core.security import (
+    generate_api_key,
+    get_key_lookup_id,
+    get_key_prefix,
+    hash_api_key,
+)
 
 
 def main() -> None:
@@ -48,6 +53,7 @@ def main() -> None:
         created_key = repo.create_api_key(
             key_hash=key_hash,
             key_prefix=key_prefix,
+            lookup_id=get_key_lookup_id(api_key),
             name=args.name,
             email=args.email,
             company=args.company,
@@ -0,0 +1,80 @@
+"""CLI tool to bulk ingest jobs-scraper output into the jobs database."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.core.database import close_repository, init_repository
+from src.core.ingest import ingest_records, read_jsonl, read_sqlite
+
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+# Validation errors printed before the rest are only counted
+MAX_REPORTED_ERRORS = 10
+
+
+def main() -> None:
+    """Upsert listings and details from a JSONL export or another SQLite file."""
+    parser = argparse.ArgumentParser(
+        description="Ingest jobs-scraper output (JSONL or SQLite) without downtime"
+    )
+    parser.add_argument("source", type=Path, help="JSONL file or SQLite database")
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "sqlite"],
+        help="Input format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help="Jobs per transaction (default: 5000)",
+    )
+
+    args = parser.parse_args()
+    input_format = args.format or (
+        "sqlite" if args.source.suffix.lower() in SQLITE_SUFFIXES else "jsonl"
+    )
+
+    reported = 0
+
+    def report(number: int, message: str) -> None:
+        nonlocal reported
+        if reported < MAX_REPORTED_ERRORS:
+            first_line = message.splitlines()[0]
+            print(f"⚠️  Record {number} skipped: {first_line}")
+        reported += 1
+
+    try:
+        if not args.source.exists():
+            print(f"❌ Error: {args.source} not found")
+            sys.exit(1)
+
+        # Initialize database
+        repo = init_repository()
+
+        records = (
+            read_sqlite(args.source, args.batch_size)
+            if input_format == "sqlite"
+            else read_jsonl(args.source)
+        )
+        stats = ingest_records(
+            repo, records, batch_size=max(args.batch_size, 1), on_error=report
+        )
+
+        print(f"\n✅ Ingested {stats.read} record(s) in {stats.elapsed_seconds:.2f}s")
+        print(f"   Rows/sec:  {stats.rows_per_second:,.0f}")
+        print(f"   Inserted:  {stats.inserted}")
+        print(f"   Updated:   {stats.updated}")
+        print(f"   Unchanged: {stats.unchanged}")
+        print(f"   Invalid:   {stats.invalid}\n")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        close_repository()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""CLI tool to prune old entries from the job change log."""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from src.core.database import close_repository, init_repository
+
+
+def main() -> None:
+    """Delete change-log entries older than the retention period."""
+    parser = argparse.ArgumentParser(
+        description="Prune the job change log behind /jobs/changes"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Keep changes from the last N days (default: 30)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        # Initialize database
+        repo = init_repository()
+
+        if not repo.change_feed:
+            print("❌ Error: The change feed needs a SQLite database")
+            sys.exit(1)
+
+        # changed_at is recorded by SQLite's CURRENT_TIMESTAMP, in UTC
+        before = datetime.utcnow() - timedelta(days=args.days)
+        deleted = repo.prune_job_changes(before)
+        oldest, latest = repo.get_change_feed_bounds()
+
+        print(f"\n✅ Pruned {deleted} change(s) older than {args.days} day(s).")
+        print(f"   Consumers behind seq {oldest - 1} must resync (latest: {latest}).\n")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        close_repository()
+
+
+if __name__ == "__main__":
+    main()
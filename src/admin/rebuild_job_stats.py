@@ -0,0 +1,33 @@
+"""CLI tool to recount the materialized job statistics."""
+
+import sys
+import time
+
+from src.core.database import close_repository, init_repository
+
+
+def main() -> None:
+    """Rebuild the hourly job count buckets from job_listings."""
+    try:
+        # Initialize database
+        repo = init_repository()
+
+        if not repo.job_stats:
+            print("❌ Error: Materialized job statistics need a SQLite database")
+            sys.exit(1)
+
+        started = time.perf_counter()
+        buckets = repo.rebuild_job_stats()
+        elapsed = time.perf_counter() - started
+
+        print(f"\n✅ Recounted {buckets} hourly bucket(s) in {elapsed:.2f}s.\n")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        close_repository()
+
+
+if __name__ == "__main__":
+    main()
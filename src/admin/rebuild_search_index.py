@@ -0,0 +1,33 @@
+"""CLI tool to rebuild the full-text search index."""
+
+import sys
+import time
+
+from src.core.database import close_repository, init_repository
+
+
+def main() -> None:
+    """Rebuild the FTS5 index from job_listings and job_details."""
+    try:
+        # Initialize database
+        repo = init_repository()
+
+        if not repo.full_text_search:
+            print("❌ Error: Full-text search (SQLite FTS5) is not available")
+            sys.exit(1)
+
+        started = time.perf_counter()
+        indexed = repo.rebuild_search_index()
+        elapsed = time.perf_counter() - started
+
+        print(f"\n✅ Indexed {indexed} job(s) in {elapsed:.2f}s.\n")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        close_repository()
+
+
+if __name__ == "__main__":
+    main()
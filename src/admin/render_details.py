@@ -0,0 +1,84 @@
+"""CLI tool to pre-render job details markdown into the HTML cache."""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.core.database import close_repository, init_repository
+from src.core.rendering import details_hash, render_batch
+
+
+def _save(repo, future) -> int:
+    """Store one finished rendering batch, return rows saved."""
+    rows = future.result()
+    repo.save_rendered_details(rows)
+    return len(rows)
+
+
+def main() -> None:
+    """Render all stale or missing job details HTML using a process pool."""
+    parser = argparse.ArgumentParser(description="Pre-render job details HTML")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of rendering processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Jobs per rendering batch (default: 500)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-render details that are up to date"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        # Initialize database
+        repo = init_repository()
+
+        existing = {} if args.force else repo.get_rendered_details_hashes()
+        started = time.perf_counter()
+        rendered = skipped = 0
+
+        with ProcessPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+            pending = []
+            for batch in repo.iter_job_details(args.batch_size):
+                stale = [
+                    (job_id, details)
+                    for job_id, details in batch
+                    if existing.get(job_id) != details_hash(details)
+                ]
+                skipped += len(batch) - len(stale)
+                if stale:
+                    pending.append(executor.submit(render_batch, stale))
+
+                # Bound memory by keeping only a few batches in flight
+                while len(pending) > args.workers * 2:
+                    rendered += _save(repo, pending.pop(0))
+
+            for future in pending:
+                rendered += _save(repo, future)
+
+        pruned = repo.delete_orphaned_rendered_details()
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"\n✅ Rendered {rendered} job(s), {skipped} already up to date, "
+            f"{pruned} orphaned row(s) removed in {elapsed:.2f}s.\n"
+        )
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        close_repository()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 import argparse
 import sys
 
+from src.core.config import settings
 from src.core.database import close_repository, init_repository
 
 
@@ -21,7 +22,11 @@ def main() -> None:
         success = repo.deactivate_api_key(args.id)
 
         if success:
-            print(f"\n✅ API key #{args.id} has been revoked successfully.\n")
+            print(f"\n✅ API key #{args.id} has been revoked successfully.")
+            print(
+                "   Running servers drop cached credentials within "
+                f"{settings.api_key_revocation_check_seconds:g}s.\n"
+            )
         else:
             print(f"\n❌ API key #{args.id} not found.\n")
             sys.exit(1)
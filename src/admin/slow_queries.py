@@ -0,0 +1,91 @@
+"""CLI tool to show (or clear) the slow query log of a running API server."""
+
+import argparse
+import json
+import sys
+import urllib.error
+import urllib.request
+
+from src.core.config import settings
+
+
+def fetch_slow_queries(url: str, token: str, clear: bool = False) -> dict:
+    """Call /admin/slow-queries on a server and return the decoded response."""
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/admin/slow-queries",
+        method="DELETE" if clear else "GET",
+        headers={"X-Admin-Token": token},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def main() -> None:
+    """Print the slow query log, slowest statements first."""
+    parser = argparse.ArgumentParser(
+        description="Show the slow query log of a running Jobs Scraper API server"
+    )
+    parser.add_argument(
+        "--url",
+        default="http://localhost:8000",
+        help="Server base URL (default: http://localhost:8000)",
+    )
+    parser.add_argument(
+        "--token",
+        default=settings.admin_token,
+        help="Admin token (default: ADMIN_TOKEN)",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Show at most N statements (default: 20)"
+    )
+    parser.add_argument(
+        "--clear", action="store_true", help="Clear the log after showing it"
+    )
+
+    args = parser.parse_args()
+
+    if not args.token:
+        print("❌ Error: No admin token. Pass --token or set ADMIN_TOKEN.")
+        sys.exit(1)
+
+    try:
+        log = fetch_slow_queries(args.url, args.token)
+        if args.clear:
+            fetch_slow_queries(args.url, args.token, clear=True)
+    except urllib.error.HTTPError as e:
+        print(f"❌ Error: {e.code} {e.read().decode(errors='replace')}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if not log["enabled"]:
+        print(
+            "⚠️  The slow query log is disabled on this server (SLOW_QUERY_LOG=false)."
+        )
+    entries = sorted(log["entries"], key=lambda entry: entry["max_ms"], reverse=True)
+    if not entries:
+        print(f"No statements slower than {log['threshold_ms']:g} ms.")
+        return
+
+    for entry in entries[: args.limit]:
+        scan = "  ⚠️  FULL TABLE SCAN" if entry["full_scan"] else ""
+        print(
+            f"\n[{entry['fingerprint']}] max {entry['max_ms']:.1f} ms, "
+            f"avg {entry['total_ms'] / entry['count']:.1f} ms, "
+            f"{entry['count']} time(s), last {entry['last_seen']}{scan}"
+        )
+        print(f"  {' '.join(entry['statement'].split())}")
+        if entry["parameters"]:
+            print(f"  parameters: {entry['parameters']}")
+        for line in entry["plan"]:
+            print(f"    {line}")
+
+    print(f"\nTotal: {len(entries)} statement(s) over {log['threshold_ms']:g} ms")
+    if args.clear:
+        print("✅ Slow query log cleared.")
+    print()
+
+
+if __name__ == "__main__":
+    main()
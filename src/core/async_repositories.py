@@ -0,0 +1,170 @@
+"""Coroutine repositories running SQLiteRepository queries without blocking the loop."""
+
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from itertools import islice
+from typing import Any, Optional, TypeVar, Union
+
+from sqlalchemy import make_url
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.util import greenlet_spawn
+from starlette.concurrency import run_in_threadpool
+
+from src.core.exceptions import DatabaseError
+from src.core.repositories import SQLiteRepository, export_jobs_statement
+from src.core.sqlite_profile import is_sqlite_file_url, read_only_url
+
+T = TypeVar("T")
+
+# Async DBAPI driver used for each database backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(db_url: str) -> str:
+    """Swap the driver of a database URL for its async counterpart."""
+    url = make_url(db_url)
+    if url.drivername in ASYNC_DRIVERS.values():
+        return db_url
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise DatabaseError(f"No async driver for database '{url.drivername}'")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _coroutine_method(
+    owner: str, name: str, run: Callable[..., Awaitable[Any]]
+) -> Callable[..., Any]:
+    """Build an async wrapper for a SQLiteRepository method, called through run."""
+
+    async def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return await run(getattr(self.repository, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"{owner}.{name}"
+    method.__doc__ = getattr(SQLiteRepository, name).__doc__
+    return method
+
+
+class AsyncRepository:
+    """Coroutine version of SQLiteRepository on an async engine.
+
+    The wrapped repository is bound to the sync facade of an async engine
+    (aiosqlite or asyncpg), the same way AsyncSession works: each method runs
+    in a greenlet and every database round trip is awaited on the event loop,
+    so requests never wait for a worker thread.
+    """
+
+    def __init__(
+        self,
+        repository: SQLiteRepository,
+        async_engine: AsyncEngine,
+        async_read_engine: Optional[AsyncEngine] = None,
+    ):
+        """Wrap a repository already bound to the sync facades of the engines."""
+        self.repository = repository
+        self.async_engine = async_engine
+        self.async_read_engine = async_read_engine
+
+    @classmethod
+    async def connect(cls, db_url: str, **options: Any) -> "AsyncRepository":
+        """Create the async engines and initialize the schema through them."""
+        read_engine = None
+        try:
+            async_engine = create_async_engine(async_database_url(db_url))
+            if options.get("read_only_pool") and is_sqlite_file_url(db_url):
+                read_engine = create_async_engine(
+                    async_database_url(read_only_url(db_url))
+                )
+        except Exception as e:
+            raise DatabaseError(f"Failed to create async engine for {db_url}") from e
+        repository = await greenlet_spawn(
+            SQLiteRepository,
+            db_url,
+            engine=async_engine.sync_engine,
+            read_engine=read_engine.sync_engine if read_engine else None,
+            **options,
+        )
+        return cls(repository, async_engine, read_engine)
+
+    async def close(self) -> None:
+        """Close database connections."""
+        if self.async_read_engine is not None:
+            await self.async_read_engine.dispose()
+        await self.async_engine.dispose()
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(repository, *args, **kwargs)`` with async database I/O."""
+        return await greenlet_spawn(fn, self.repository, *args, **kwargs)
+
+    async def iter_jobs(
+        self,
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        """Stream filtered job listing rows (EXPORT_COLUMNS), newest first."""
+        statement = export_jobs_statement(
+            job_classification, job_sub_classification, work_arrangements
+        )
+        engine = self.async_read_engine or self.async_engine
+        async with engine.connect() as connection:
+            result = await connection.stream(
+                statement, execution_options={"yield_per": batch_size}
+            )
+            async for row in result:
+                yield row
+
+
+class ThreadpoolRepository:
+    """Coroutine version of SQLiteRepository on the sync engine.
+
+    Each method runs the blocking repository call in the worker thread pool,
+    so routes written against AsyncRepository also serve the sync driver.
+    """
+
+    def __init__(self, repository: SQLiteRepository):
+        """Wrap a sync repository."""
+        self.repository = repository
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(repository, *args, **kwargs)`` in the thread pool."""
+        return await run_in_threadpool(fn, self.repository, *args, **kwargs)
+
+    async def iter_jobs(
+        self,
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        """Stream filtered job listing rows, one thread pool call per batch."""
+        rows = self.repository.iter_jobs(
+            job_classification, job_sub_classification, work_arrangements, batch_size
+        )
+        try:
+            while batch := await run_in_threadpool(list, islice(rows, batch_size)):
+                for row in batch:
+                    yield row
+        finally:
+            await run_in_threadpool(rows.close)
+
+
+# Either repository serves the routes; they share every coroutine method
+RepositoryAdapter = Union[AsyncRepository, ThreadpoolRepository]
+
+# Expose every other public SQLiteRepository method as a coroutine; closing
+# stays with the owner of the wrapped repository
+for _name, _member in inspect.getmembers(SQLiteRepository, inspect.isfunction):
+    if _name.startswith("_") or _name == "close":
+        continue
+    for _cls, _run in (
+        (AsyncRepository, greenlet_spawn),
+        (ThreadpoolRepository, run_in_threadpool),
+    ):
+        if not hasattr(_cls, _name):
+            setattr(_cls, _name, _coroutine_method(_cls.__name__, _name, _run))
@@ -1,36 +1,224 @@
 """FastAPI dependencies for API key authentication."""
 
-from fastapi import Depends, Header
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from fastapi import Depends, Header, Request
 from fastapi.security import APIKeyHeader
 
+from src.core.config import settings
 from src.core.database import get_repository
 from src.core.exceptions import UnauthorizedError
+from src.core.instrumentation import timed
+from src.core.metrics import auth_total
 from src.core.models import APIKeyModel
+from src.core.rate_limit import rate_limiter
 from src.core.repositories import SQLiteRepository
-from src.core.security import verify_api_key
+from src.core.security import get_key_lookup_id, verify_api_key
+from src.core.usage import usage_buffer
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+class VerifiedKeyCache:
+    """Bounded LRU cache of verified API keys, keyed by a SHA-256 digest of the key.
+
+    Entries expire after ``ttl_seconds``. The whole cache is dropped as soon as a
+    revocation is observed, either in-process through
+    ``SQLiteRepository.api_key_revision`` or from another process (such as the
+    ``revoke_key`` CLI) through the polled count of revoked keys.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        revocation_check_seconds: float,
+    ) -> None:
+        """Initialize an empty cache with the given bounds."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.revocation_check_seconds = revocation_check_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, APIKeyModel]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._revision: int | None = None
+        self._revoked_count: int | None = None
+        self._last_revocation_check = 0.0
+
+    def get(self, digest: str) -> APIKeyModel | None:
+        """Return the cached key for a digest, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, digest: str, api_key_model: APIKeyModel) -> None:
+        """Cache a verified key, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = (
+                time.monotonic() + self.ttl_seconds,
+                api_key_model,
+            )
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, api_key_id: int) -> None:
+        """Drop every cached entry belonging to the given key ID."""
+        with self._lock:
+            for digest, (_, api_key_model) in list(self._entries.items()):
+                if api_key_model.id == api_key_id:
+                    del self._entries[digest]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def sync_revocations(self, repository: SQLiteRepository) -> None:
+        """Clear the cache if any key was revoked since the last check."""
+        now = time.monotonic()
+        if (
+            repository.api_key_revision == self._revision
+            and now - self._last_revocation_check < self.revocation_check_seconds
+        ):
+            return
+
+        revoked_count = repository.count_revoked_api_keys()
+        if (
+            repository.api_key_revision != self._revision
+            or revoked_count != self._revoked_count
+        ):
+            self.clear()
+        self._revision = repository.api_key_revision
+        self._revoked_count = revoked_count
+        self._last_revocation_check = now
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+api_key_cache = VerifiedKeyCache(
+    max_size=settings.api_key_cache_size,
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    revocation_check_seconds=settings.api_key_revocation_check_seconds,
+)
+
+
+def _is_expired(api_key_model: APIKeyModel) -> bool:
+    """Check whether the key's expires_at has passed (naive values are UTC)."""
+    expires_at = api_key_model.expires_at
+    if expires_at is None:
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(timezone.utc)
+
+
+def _find_legacy_api_key(
+    x_api_key: str, lookup_id: str, repository: SQLiteRepository
+) -> APIKeyModel | None:
+    """Verify against keys without a lookup identifier and backfill on match."""
+    for api_key_model in repository.get_legacy_api_keys():
+        if verify_api_key(x_api_key, str(api_key_model.key_hash)):
+            repository.set_api_key_lookup_id(api_key_model.id, lookup_id)
+            return api_key_model
+    return None
+
+
+def _verify_api_key(x_api_key: str, repository: SQLiteRepository) -> APIKeyModel:
+    """Resolve the presented key against the database with one hash check."""
+    lookup_id = get_key_lookup_id(x_api_key)
+    api_key_model = repository.get_api_key_by_lookup_id(lookup_id)
+
+    if api_key_model is not None:
+        if not verify_api_key(x_api_key, str(api_key_model.key_hash)):
+            raise UnauthorizedError("Invalid API key")
+    elif settings.allow_legacy_api_keys:
+        api_key_model = _find_legacy_api_key(x_api_key, lookup_id, repository)
+
+    if api_key_model is None:
+        raise UnauthorizedError("Invalid API key")
+    return api_key_model
+
+
+def authenticate_api_key(x_api_key: str, repository: SQLiteRepository) -> APIKeyModel:
+    """Resolve a presented API key, using the verified-key cache when possible."""
+    digest = hashlib.sha256(x_api_key.encode()).hexdigest()
+    api_key_cache.sync_revocations(repository)
+
+    api_key_model = api_key_cache.get(digest)
+    if api_key_model is None:
+        try:
+            api_key_model = _verify_api_key(x_api_key, repository)
+        except UnauthorizedError:
+            auth_total.inc(result="rejected")
+            raise
+        auth_total.inc(result="verified")
+        api_key_cache.put(digest, api_key_model)
+    else:
+        auth_total.inc(result="cache_hit")
+
+    if not api_key_model.is_active:
+        api_key_cache.invalidate(api_key_model.id)
+        raise UnauthorizedError("Invalid API key")
+    if _is_expired(api_key_model):
+        api_key_cache.invalidate(api_key_model.id)
+        raise UnauthorizedError("API key has expired")
+
+    return api_key_model
+
+
 def get_api_key(
+    request: Request,
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
     repository: SQLiteRepository = Depends(get_repository),
 ) -> APIKeyModel:
     """Validate and return API key from X-API-Key header."""
+    # Authenticate, rate-limit and count each request only once even when
+    # both get_api_key and get_optional_api_key are used by a route
+    api_key_model = getattr(request.state, "api_key", None)
+    if api_key_model is not None:
+        return api_key_model
+
     if not x_api_key:
         raise UnauthorizedError("API key is required. Include X-API-Key header.")
 
-    api_keys = repository.get_all_active_api_keys()
+    with timed("auth"):
+        api_key_model = authenticate_api_key(x_api_key, repository)
+    request.state.rate_limit = rate_limiter.check(
+        api_key_model.id, api_key_model.rate_limit
+    )
+    usage_buffer.record(api_key_model.id)
 
-    for api_key_model in api_keys:
-        if verify_api_key(x_api_key, str(api_key_model.key_hash)):
-            repository.update_api_key_last_used(api_key_model.id)
-            return api_key_model
-
-    raise UnauthorizedError("Invalid API key")
+    request.state.api_key = api_key_model
+    return api_key_model
 
 
 def get_optional_api_key(
+    request: Request,
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
     repository: SQLiteRepository = Depends(get_repository),
 ) -> APIKeyModel | None:
@@ -39,6 +227,18 @@ def get_optional_api_key(
         return None
 
     try:
-        return get_api_key(x_api_key, repository)
+        return get_api_key(request, x_api_key, repository)
     except UnauthorizedError:
         return None
+
+
+def require_admin_token(
+    x_admin_token: str | None = Header(default=None, alias="X-Admin-Token"),
+) -> None:
+    """Allow a request only if it carries the configured admin token."""
+    if not settings.admin_token:
+        raise UnauthorizedError("Admin endpoints are disabled. Set ADMIN_TOKEN.")
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise UnauthorizedError("Invalid admin token")
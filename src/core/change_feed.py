@@ -0,0 +1,68 @@
+"""Change log of job writes, maintained by SQLite triggers, behind /jobs/changes."""
+
+import logging
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+CHANGES_TABLE = "job_changes"
+
+# AUTOINCREMENT so sequence numbers are never reused, even after pruning
+_CREATE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id VARCHAR NOT NULL,
+    change VARCHAR NOT NULL,
+    changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+_CREATE_INDEX = f"""
+CREATE INDEX IF NOT EXISTS ix_{CHANGES_TABLE}_changed_at
+ON {CHANGES_TABLE} (changed_at)
+"""
+
+
+def _trigger_ddl(table: str, operation: str, change: str) -> str:
+    """Build a trigger logging one row per write to a job table."""
+    row = "old" if operation == "DELETE" else "new"
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS {CHANGES_TABLE}_{table}_{operation.lower()}
+    AFTER {operation} ON {table} BEGIN
+        INSERT INTO {CHANGES_TABLE} (job_id, change) VALUES ({row}.job_id, '{change}');
+    END
+    """
+
+
+# Expiry and removal are derived when the feed is read (see get_job_changes)
+_TRIGGERS = [
+    _trigger_ddl("job_listings", "INSERT", "insert"),
+    _trigger_ddl("job_listings", "UPDATE", "update"),
+    _trigger_ddl("job_listings", "DELETE", "delete"),
+    _trigger_ddl("job_details", "INSERT", "update"),
+    _trigger_ddl("job_details", "UPDATE", "update"),
+    _trigger_ddl("job_details", "DELETE", "update"),
+]
+
+
+def ensure_change_feed(engine: Engine) -> bool:
+    """Create the change log and its triggers if missing, return True if usable.
+
+    Writes made before the log existed are not recorded; consumers start
+    from a full export and then follow the feed.
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+
+    try:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(_CREATE_TABLE)
+            connection.exec_driver_sql(_CREATE_INDEX)
+            for trigger in _TRIGGERS:
+                connection.exec_driver_sql(trigger)
+    except DBAPIError as e:
+        logger.error(f"Failed to create job change log: {e}")
+        return False
+    return True
@@ -0,0 +1,125 @@
+"""HTTP conditional requests (ETag / 304) for job reads."""
+
+import hashlib
+import time
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.exceptions import NotModifiedError
+
+
+def normalized_query(request: Request) -> str:
+    """Return the query string with parameters sorted and empty values dropped."""
+    params = sorted(
+        (name, value) for name, value in request.query_params.multi_items() if value
+    )
+    return urlencode(params)
+
+
+def make_etag(request: Request, versions: tuple) -> str:
+    """Build a weak ETag from the path, normalized query and data versions."""
+    key = f"{request.url.path}?{normalized_query(request)}|{versions!r}"
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Compare If-None-Match against an ETag using weak comparison."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_conditional_get(
+    request: Request,
+    versions: tuple,
+    private: bool,
+    per_user: bool = False,
+) -> None:
+    """Answer a matching conditional GET with 304, else stash the cache headers.
+
+    Raises NotModifiedError before the route touches the database or the
+    serializer. Otherwise the headers are left on request.state for
+    CacheHeadersMiddleware to add to the 200 response.
+    """
+    max_age = settings.http_cache_max_age_seconds
+    if per_user:
+        # is_favorite differs per key and changes outside the dataset version
+        cache_control = "private, no-cache"
+    else:
+        cache_control = f"{'private' if private else 'public'}, max-age={max_age}"
+
+    headers = {
+        "ETag": make_etag(request, versions),
+        "Cache-Control": cache_control,
+    }
+    if per_user:
+        headers["Vary"] = "X-API-Key"
+
+    # No Last-Modified/If-Modified-Since: a date from this process's clock,
+    # at one-second resolution, could validate a stale copy after a write in
+    # the same second or one another worker noticed first
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, headers["ETag"]):
+        raise NotModifiedError(headers)
+    request.state.cache_headers = headers
+
+
+def validator_versions(
+    dataset_version: Optional[int],
+    favorites_version: Optional[int],
+    api_key_id: Optional[int],
+    per_user: bool,
+    time_bucket_seconds: int,
+) -> Optional[tuple]:
+    """Return the versions the ETag is built from, or None if untracked."""
+    if dataset_version is None:
+        return None
+
+    versions: tuple = (dataset_version,)
+    if per_user and api_key_id is not None:
+        if favorites_version is None:
+            return None
+        versions += (api_key_id, favorites_version)
+    if time_bucket_seconds:
+        # Time-windowed results (e.g. new_jobs in /jobs/stats) age without writes
+        versions += (int(time.time() // time_bucket_seconds),)
+    return versions
+
+
+class CacheHeadersMiddleware:
+    """Add the ETag and Cache-Control headers to 200 responses."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Copy the headers stored on request.state into the response headers."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_headers(message: Message) -> None:
+            cache_headers = state.get("cache_headers")
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] == 200
+                and cache_headers is not None
+            ):
+                headers = MutableHeaders(scope=message)
+                for name, value in cache_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
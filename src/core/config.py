@@ -1,5 +1,7 @@
 """Application configuration settings."""
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,15 +15,92 @@ class Settings(BaseSettings):
     )
 
     database_url: str = "sqlite:///jobs.db"
+    # Serve /jobs and /favorites from async routes on an async engine
+    async_database: bool = False
+    # Defaults to database_url with its async driver (aiosqlite/asyncpg)
+    async_database_url: Optional[str] = None
+    # Use the SQLite FTS5 index for /jobs/search when available
+    full_text_search: bool = True
+    # SQLite connection profile, applied to every new connection
+    sqlite_tuning: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size: int = -65536  # negative = KiB, i.e. 64 MiB per connection
+    sqlite_mmap_size: int = 268435456  # bytes (256 MiB)
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout_ms: int = 5000
+    # Serve read queries from a separate read-only (mode=ro) connection pool
+    sqlite_read_only_pool: bool = False
+    # Add missing secondary indexes to existing tables at startup
+    auto_create_indexes: bool = True
+    # Upper bound on how long cached read results (e.g. facets) are reused
+    read_cache_ttl_seconds: float = 300.0
+    # How often read caches re-check whether job data has changed
+    dataset_version_check_seconds: float = 1.0
+
+    # Serialized /jobs/ and /jobs/search pages shared by all callers (0 disables)
+    response_cache_max_bytes: int = 33554432  # 32 MiB
+    response_cache_max_entries: int = 10000
+    response_cache_ttl_seconds: float = 60.0
+    # ETag validators and 304 responses on job read endpoints
+    http_caching: bool = True
+    # max-age of shared (non per-user) job responses
+    http_cache_max_age_seconds: int = 5
+
+    # Server-Timing header, SQL query accounting and a JSON log record per request
+    request_instrumentation: bool = False
+
+    # Prometheus /metrics endpoint
+    metrics_enabled: bool = True
+    # Shared directory for per-worker snapshots when running several workers
+    metrics_multiprocess_dir: Optional[str] = None
+    metrics_flush_interval_seconds: float = 1.0
+
+    # Record statements slower than the threshold, with their SQLite plans
+    slow_query_log: bool = False
+    slow_query_threshold_ms: float = 100.0
+    slow_query_log_size: int = 100
+    slow_query_explain: bool = True
+    # X-Admin-Token value for /admin endpoints (unset disables them)
+    admin_token: Optional[str] = None
 
     # CORS settings
     cors_origins: list[str] = ["*"]
     cors_allow_credentials: bool = True
     cors_allow_methods: list[str] = ["*"]
     cors_allow_headers: list[str] = ["*"]
+    cors_expose_headers: list[str] = [
+        "X-Next-Cursor",
+        "ETag",
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+        "X-RateLimit-Reset",
+        "Retry-After",
+        "Server-Timing",
+    ]
 
     # API Key authentication
     require_api_key: bool = False
+    # Fall back to scanning keys created before lookup identifiers existed.
+    # Every unknown key then costs one bcrypt check per legacy key, so only
+    # enable it until those keys have been used once (or reissued)
+    allow_legacy_api_keys: bool = False
+
+    # Verified API key cache (0 entries disables caching)
+    api_key_cache_size: int = 1024
+    api_key_cache_ttl_seconds: float = 300.0
+    # How often to poll the database for keys revoked by another process
+    api_key_revocation_check_seconds: float = 1.0
+
+    # Write-behind API key usage counters
+    usage_flush_interval_seconds: float = 5.0
+    usage_flush_max_events: int = 1000
+
+    # Per-key rate limiting ("memory" per worker, "sqlite" shared across workers)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_window_seconds: int = 3600
+    rate_limit_sqlite_path: str = "rate_limits.db"
 
 
 settings = Settings()
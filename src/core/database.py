@@ -1,20 +1,52 @@
 """Database repository initialization and FastAPI dependency."""
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
+
+from fastapi import Depends
 
 from src.core.config import settings
 from src.core.exceptions import DatabaseError
 
+from .async_repositories import AsyncRepository, ThreadpoolRepository
 from .repositories import SQLiteRepository
 
-# Global repository instance
+# Global repository instances
 _repository: SQLiteRepository | None = None
+_async_repository: AsyncRepository | None = None
+
+
+def _repository_options() -> dict:
+    """Repository settings shared by the sync and async repositories."""
+    return {
+        "full_text_search": settings.full_text_search,
+        "create_indexes": settings.auto_create_indexes,
+        "cache_ttl_seconds": settings.read_cache_ttl_seconds,
+        "version_check_seconds": settings.dataset_version_check_seconds,
+        "sqlite_pragmas": sqlite_pragmas(),
+        "read_only_pool": settings.sqlite_read_only_pool,
+        "instrument_queries": settings.request_instrumentation,
+        "log_slow_queries": settings.slow_query_log,
+    }
+
+
+def sqlite_pragmas() -> dict:
+    """SQLite PRAGMAs from settings, empty when tuning is disabled."""
+    if not settings.sqlite_tuning:
+        return {}
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+    }
 
 
 def init_repository() -> SQLiteRepository:
     """Initialize and return global repository instance."""
     global _repository
-    _repository = SQLiteRepository(settings.database_url)
+    _repository = SQLiteRepository(settings.database_url, **_repository_options())
     return _repository
 
 
@@ -27,9 +59,42 @@ def get_repository() -> Generator[SQLiteRepository, None, None]:
     yield _repository
 
 
+def get_threadpool_repository(
+    repository: SQLiteRepository = Depends(get_repository),
+) -> ThreadpoolRepository:
+    """FastAPI dependency serving the sync repository to coroutine routes."""
+    return ThreadpoolRepository(repository)
+
+
 def close_repository() -> None:
     """Close repository and cleanup global instance."""
     global _repository
     if _repository:
         _repository.close()
         _repository = None
+
+
+async def init_async_repository() -> AsyncRepository:
+    """Initialize and return global async repository instance."""
+    global _async_repository
+    _async_repository = await AsyncRepository.connect(
+        settings.async_database_url or settings.database_url, **_repository_options()
+    )
+    return _async_repository
+
+
+async def get_async_repository() -> AsyncGenerator[AsyncRepository, None]:
+    """FastAPI dependency for async repository injection."""
+    if _async_repository is None:
+        raise DatabaseError(
+            "Async repository not initialized. Set ASYNC_DATABASE=true to enable it."
+        )
+    yield _async_repository
+
+
+async def close_async_repository() -> None:
+    """Close async repository and cleanup global instance."""
+    global _async_repository
+    if _async_repository:
+        await _async_repository.close()
+        _async_repository = None
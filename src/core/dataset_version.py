@@ -0,0 +1,136 @@
+"""Cheap detection of changes to the job tables, including external writes."""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+VERSION_TABLE = "dataset_version"
+
+# Tables whose contents are served by the read caches
+TRACKED_TABLES = ("job_listings", "job_details")
+
+# Favorites change per-user payloads (is_favorite) but not the shared caches
+FAVORITES_VERSION_TABLE = "favorites_version"
+FAVORITES_TRACKED_TABLES = ("favorite_jobs",)
+
+
+def _create_table_ddl(version_table: str) -> str:
+    """Build the single-row counter table."""
+    return f"""
+    CREATE TABLE IF NOT EXISTS {version_table} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    """
+
+
+def _trigger_ddl(version_table: str, table: str, operation: str) -> str:
+    """Build a trigger that bumps the version on every write to a table."""
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS {version_table}_{table}_{operation.lower()}
+    AFTER {operation} ON {table} BEGIN
+        UPDATE {version_table} SET version = version + 1 WHERE id = 1;
+    END
+    """
+
+
+class DatasetVersionProbe:
+    """Throttled reader of a trigger-maintained dataset version counter.
+
+    SQLite triggers on the tracked tables (job_listings/job_details unless
+    told otherwise) bump a single-row counter on
+    every write, whichever process makes it (the API or jobs-scraper), so
+    writes to unrelated tables such as api_keys never invalidate read caches.
+    The counter is read at most once per ``check_interval_seconds``.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        check_interval_seconds: float,
+        version_table: str = VERSION_TABLE,
+        tracked_tables: tuple[str, ...] = TRACKED_TABLES,
+    ) -> None:
+        """Initialize the probe; call install() before use."""
+        self.engine = engine
+        self.version_table = version_table
+        self.tracked_tables = tracked_tables
+        self.check_interval_seconds = check_interval_seconds
+        self.enabled = False
+        self._version: Optional[int] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def install(self) -> bool:
+        """Create the counter table and triggers, return True if tracking works."""
+        if self.engine.dialect.name != "sqlite":
+            return False
+
+        try:
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(_create_table_ddl(self.version_table))
+                connection.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO {self.version_table} (id, version) "
+                    "VALUES (1, 0)"
+                )
+                for table in self.tracked_tables:
+                    for operation in ("INSERT", "UPDATE", "DELETE"):
+                        connection.exec_driver_sql(
+                            _trigger_ddl(self.version_table, table, operation)
+                        )
+        except DBAPIError as e:
+            logger.error(f"Failed to install {self.version_table} tracking: {e}")
+            return False
+
+        self.enabled = True
+        self.invalidate()
+        return True
+
+    def invalidate(self) -> None:
+        """Force the next call to current() to read the counter."""
+        self._next_check = 0.0
+
+    def current(self) -> Optional[int]:
+        """Return the dataset version, or None if changes cannot be tracked."""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._version
+
+        # Read without the lock: under AsyncRepository the query yields to the
+        # event loop, and another request on that loop would block on the lock
+        version = self._read()
+        with self._lock:
+            # A slower concurrent read must not move the version backwards
+            if version is None or self._version is None or version > self._version:
+                self._version = version
+            self._next_check = max(self._next_check, now + self.check_interval_seconds)
+            return self._version
+
+    def _read(self) -> Optional[int]:
+        """Read the counter, reinstalling tracking if the table has disappeared."""
+        query = f"SELECT version FROM {self.version_table} WHERE id = 1"
+        try:
+            with self.engine.connect() as connection:
+                return connection.exec_driver_sql(query).scalar()
+        except OperationalError:
+            # jobs.db was replaced by a copy without our table and triggers
+            logger.warning(f"{self.version_table} table missing, reinstalling triggers")
+            if not self.install():
+                return None
+            # Move past the last version seen so caches of the old file are dropped
+            version = (self._version or 0) + 1
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(
+                    f"UPDATE {self.version_table} SET version = ? WHERE id = 1",
+                    (version,),
+                )
+            return version
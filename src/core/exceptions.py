@@ -23,3 +23,27 @@ class UnauthorizedError(Exception):
     """Raised when API key authentication fails."""
 
     pass
+
+
+class RateLimitExceededError(Exception):
+    """Raised when an API key exceeds its request rate limit."""
+
+    def __init__(self, status) -> None:
+        """Store the limiter status used to build the 429 response."""
+        super().__init__("Rate limit exceeded")
+        self.status = status
+
+
+class NotModifiedError(Exception):
+    """Raised when a conditional GET matches the client's cached representation."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        """Store the validator headers repeated on the 304 response."""
+        super().__init__("Not modified")
+        self.headers = headers
+
+
+class ChangeFeedExpiredError(Exception):
+    """Raised when a change feed position is older than the retained log."""
+
+    pass
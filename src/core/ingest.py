@@ -0,0 +1,221 @@
+"""Bulk ingest of jobs-scraper output into job_listings and job_details."""
+
+import hashlib
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Row
+
+from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import DETAILS_COLUMNS, EXPORT_COLUMNS, SQLiteRepository
+from src.core.schemas import JobDetailsSchema, JobListingSchema
+
+LISTING_FIELDS = tuple(JobListingSchema.model_fields)
+DETAILS_FIELDS = tuple(
+    name for name in JobDetailsSchema.model_fields if name != "job_id"
+)
+
+# Called with (record number, message) for every record that is skipped
+ErrorCallback = Callable[[int, str], None]
+
+
+class IngestStats:
+    """Counters reported by ingest_records."""
+
+    def __init__(self) -> None:
+        """Start all counters at zero."""
+        self.read = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.invalid = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Records processed per second of wall time."""
+        return self.read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def read_jsonl(path: Path) -> Iterator[Any]:
+    """Yield one record per non-empty line; unparseable lines yield None."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+
+
+def read_sqlite(path: Path, batch_size: int = 5000) -> Iterator[dict]:
+    """Yield listings joined with their details from another jobs database."""
+    engine = create_engine(f"sqlite:///{path}")
+    statement = select(*EXPORT_COLUMNS, *DETAILS_COLUMNS).outerjoin(
+        JobDetailsModel, JobDetailsModel.job_id == JobListingModel.job_id
+    )
+    try:
+        with engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(statement)
+            for row in result:
+                record = row._asdict()
+                # Listings without a job_details row carry no details fields
+                if record["status"] is None and record["details"] is None:
+                    for name in DETAILS_FIELDS:
+                        record.pop(name)
+                yield record
+    finally:
+        engine.dispose()
+
+
+def _naive_utc(model: BaseModel) -> BaseModel:
+    """Store aware datetimes as naive UTC, like the rest of the database."""
+    changes = {
+        name: value.astimezone(timezone.utc).replace(tzinfo=None)
+        for name, value in model
+        if isinstance(value, datetime) and value.tzinfo is not None
+    }
+    return model.model_copy(update=changes) if changes else model
+
+
+def _content_hash(model: Optional[BaseModel]) -> Optional[str]:
+    """Hash the canonical JSON of a validated listing or details record."""
+    if model is None:
+        return None
+    return hashlib.sha256(model.model_dump_json().encode()).hexdigest()
+
+
+def _parse(record: Any) -> tuple[JobListingSchema, Optional[JobDetailsSchema]]:
+    """Validate one flat record into a listing and, if present, its details."""
+    if not isinstance(record, dict):
+        raise ValueError("record is not a JSON object")
+    listing = JobListingSchema.model_validate(
+        {name: record[name] for name in LISTING_FIELDS if name in record}
+    )
+    details = None
+    if any(name in record for name in DETAILS_FIELDS):
+        details = JobDetailsSchema.model_validate(
+            {
+                "job_id": listing.job_id,
+                **{name: record[name] for name in DETAILS_FIELDS if name in record},
+            }
+        )
+        details = _naive_utc(details)
+    return _naive_utc(listing), details
+
+
+def _stored_records(
+    row: Row,
+) -> tuple[Optional[JobListingSchema], Optional[JobDetailsSchema]]:
+    """Validate a stored job like incoming records; None where invalid."""
+    values = row._asdict()
+    try:
+        listing = JobListingSchema.model_validate(
+            {name: values[name] for name in LISTING_FIELDS}
+        )
+    except ValidationError:
+        listing = None
+    try:
+        details = (
+            JobDetailsSchema.model_validate(
+                {name: values[name] for name in DETAILS_FIELDS}
+                | {"job_id": values["job_id"]}
+            )
+            if values["has_details"]
+            else None
+        )
+    except ValidationError:
+        details = None
+    return listing, details
+
+
+def _is_changed(record: BaseModel, stored: Optional[BaseModel]) -> bool:
+    """Check whether writing a record's supplied fields would change the stored one."""
+    if stored is None:
+        return True
+    merged = stored.model_copy(update=record.model_dump(exclude_unset=True))
+    return _content_hash(merged) != _content_hash(stored)
+
+
+def _write_batch(
+    repository: SQLiteRepository,
+    batch: dict[str, tuple[JobListingSchema, Optional[JobDetailsSchema]]],
+    stats: IngestStats,
+) -> None:
+    """Upsert the records of a batch whose content differs from the database."""
+    stored = {
+        row.job_id: _stored_records(row)
+        for row in repository.get_job_snapshots(list(batch))
+    }
+
+    listings, details = [], []
+    for job_id, (listing, job_details) in batch.items():
+        stored_listing, stored_details = stored.get(job_id, (None, None))
+        listing_changed = _is_changed(listing, stored_listing)
+        details_changed = job_details is not None and _is_changed(
+            job_details, stored_details
+        )
+        # Only fields present in the record are written, so a partial record
+        # does not clear the optional columns it leaves out
+        if listing_changed:
+            listings.append(listing.model_dump(exclude_unset=True))
+        if details_changed:
+            details.append(job_details.model_dump(exclude_unset=True))
+
+        if job_id not in stored:
+            stats.inserted += 1
+        elif listing_changed or details_changed:
+            stats.updated += 1
+        else:
+            stats.unchanged += 1
+
+    repository.upsert_jobs(listings, details)
+
+
+def ingest_records(
+    repository: SQLiteRepository,
+    records: Iterable[Any],
+    batch_size: int = 5000,
+    on_error: Optional[ErrorCallback] = None,
+) -> IngestStats:
+    """Validate and upsert records in transactions of ``batch_size`` jobs.
+
+    Records are flat objects with JobListingSchema fields plus, optionally,
+    JobDetailsSchema fields. Jobs whose stored listing and details already
+    hash the same are not written, so re-ingesting a scrape only touches
+    what changed (and only those writes bump the dataset version).
+    """
+    stats = IngestStats()
+    started = time.perf_counter()
+    batch: dict[str, tuple[JobListingSchema, Optional[JobDetailsSchema]]] = {}
+
+    for number, record in enumerate(records, start=1):
+        stats.read += 1
+        try:
+            listing, details = _parse(record)
+        except ValueError as e:  # includes pydantic's ValidationError
+            stats.invalid += 1
+            if on_error:
+                on_error(number, str(e))
+            continue
+
+        # A later record for the same job within a batch replaces the earlier one
+        batch[listing.job_id] = (listing, details)
+        if len(batch) >= batch_size:
+            _write_batch(repository, batch, stats)
+            batch = {}
+
+    if batch:
+        _write_batch(repository, batch, stats)
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
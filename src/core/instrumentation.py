@@ -0,0 +1,149 @@
+"""Opt-in per-request timing: SQL query accounting, Server-Timing and a log record."""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_QUERY_STARTS = "instrumentation_query_starts"
+
+
+class RequestTimings:
+    """Time spent in SQL and in named phases while serving one request."""
+
+    def __init__(self) -> None:
+        """Start the request clock with no queries or phases recorded."""
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase; phases may overlap (e.g. render includes its SQL)."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Format the timings as a Server-Timing header value (milliseconds)."""
+        entries = [
+            f"total;dur={self.elapsed() * 1000:.1f}",
+            f'sql;dur={self.sql_seconds * 1000:.1f};desc="{self.query_count} queries"',
+        ]
+        entries.extend(
+            f"{phase};dur={seconds * 1000:.1f}"
+            for phase, seconds in self.phases.items()
+        )
+        return ", ".join(entries)
+
+    def log_record(self, scope: Scope, status: int) -> dict:
+        """Summarize the request as a flat, JSON-serializable record."""
+        route = scope.get("route")
+        return {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status,
+            "duration_ms": round(self.elapsed() * 1000, 2),
+            "queries": self.query_count,
+            "sql_ms": round(self.sql_seconds * 1000, 2),
+            **{
+                f"{phase}_ms": round(seconds * 1000, 2)
+                for phase, seconds in self.phases.items()
+            },
+        }
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Return the timings of the request being served, or None if not instrumented."""
+    return _current.get()
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the time spent in the block to a phase of the current request.
+
+    Costs one context variable lookup when instrumentation is disabled.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count the queries and SQL time of the current request on an engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_QUERY_STARTS, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info[_QUERY_STARTS].pop()
+        timings = _current.get()
+        if timings is not None:
+            timings.query_count += 1
+            timings.sql_seconds += time.perf_counter() - started
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context) -> None:
+        # after_cursor_execute does not run for failed statements
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(_QUERY_STARTS):
+            connection.info[_QUERY_STARTS].pop()
+
+
+class InstrumentationMiddleware:
+    """Time each request, add a Server-Timing header and log one JSON record."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Collect timings in a context variable for the duration of the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", timings.server_timing()
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            # Logged after the body is sent, so streamed responses are included
+            logger.info(json.dumps(timings.log_record(scope, status)))
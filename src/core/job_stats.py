@@ -0,0 +1,109 @@
+"""Materialized per-hour job counts, maintained by SQLite triggers."""
+
+import logging
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+STATS_TABLE = "job_stats_hourly"
+
+# Bucket for listings without a listing_date: counted in totals, not timelines
+UNDATED_HOUR = -1
+
+GRANULARITY_SECONDS = {"hour": 3600, "day": 86400}
+
+_CREATE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+    hour INTEGER PRIMARY KEY,
+    job_count INTEGER NOT NULL
+)
+"""
+
+
+def _hour(row: str) -> str:
+    """SQL for the hour bucket (hours since the epoch, UTC) of a listing row."""
+    return (
+        f"COALESCE(CAST(strftime('%s', {row}.listing_date) AS INTEGER) / 3600, "
+        f"{UNDATED_HOUR})"
+    )
+
+
+def _increment(row: str) -> str:
+    """SQL counting a listing row into its bucket."""
+    return f"""
+        INSERT INTO {STATS_TABLE} (hour, job_count) VALUES ({_hour(row)}, 1)
+        ON CONFLICT (hour) DO UPDATE SET job_count = job_count + 1;
+    """
+
+
+def _decrement(row: str) -> str:
+    """SQL removing a listing row from its bucket, dropping empty buckets."""
+    return f"""
+        UPDATE {STATS_TABLE} SET job_count = job_count - 1 WHERE hour = {_hour(row)};
+        DELETE FROM {STATS_TABLE} WHERE hour = {_hour(row)} AND job_count <= 0;
+    """
+
+
+# Note: INSERT OR REPLACE only fires the delete trigger with recursive_triggers
+# on; writers using it should run src.admin.rebuild_job_stats afterwards.
+_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ai
+    AFTER INSERT ON job_listings BEGIN
+        {_increment("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_au
+    AFTER UPDATE OF listing_date ON job_listings
+    WHEN {_hour("old")} IS NOT {_hour("new")} BEGIN
+        {_decrement("old")}
+        {_increment("new")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ad
+    AFTER DELETE ON job_listings BEGIN
+        {_decrement("old")}
+    END
+    """,
+]
+
+
+def ensure_job_stats(engine: Engine) -> bool:
+    """Create the bucket table and its triggers if missing, return True if usable."""
+    if engine.dialect.name != "sqlite":
+        return False
+
+    try:
+        with engine.begin() as connection:
+            exists = connection.execute(
+                text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+                ),
+                {"name": STATS_TABLE},
+            ).first()
+            connection.exec_driver_sql(_CREATE_TABLE)
+            for trigger in _TRIGGERS:
+                connection.exec_driver_sql(trigger)
+            # Same transaction as the triggers, so no write is counted twice
+            if not exists:
+                rebuild_job_stats(connection)
+    except DBAPIError as e:
+        logger.error(f"Failed to create materialized job statistics: {e}")
+        return False
+    return True
+
+
+def rebuild_job_stats(connection: Connection) -> int:
+    """Recount every bucket from job_listings, return the number of buckets."""
+    connection.exec_driver_sql(f"DELETE FROM {STATS_TABLE}")
+    result = connection.exec_driver_sql(f"""
+        INSERT INTO {STATS_TABLE} (hour, job_count)
+        SELECT {_hour("job_listings")} AS bucket, count(*)
+        FROM job_listings
+        GROUP BY bucket
+        """)
+    return result.rowcount
@@ -0,0 +1,468 @@
+"""Prometheus metrics kept in-process, with a file-backed mode for several workers."""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency buckets in seconds (the upper bound of each bucket)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+Labels = tuple[tuple[str, str], ...]
+# (name, type, help, labels, value) produced by collectors at scrape time
+Sample = tuple[str, str, str, dict[str, str], float]
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    """Normalize label keyword arguments into a hashable, ordered key."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class _Metric:
+    """A named metric holding one value per label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """Create a metric without samples."""
+        self.name = name
+        self.help = help_text
+        self._values: dict[Labels, Any] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy of the metric."""
+        with self._lock:
+            samples = [
+                [list(labels), list(value) if isinstance(value, list) else value]
+                for labels, value in self._values.items()
+            ]
+        return {"type": self.kind, "help": self.help, "samples": samples}
+
+
+class Counter(_Metric):
+    """A monotonically increasing total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add to the total of a label set."""
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, such as requests in flight."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Raise the value of a label set."""
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Lower the value of a label set."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed buckets, plus their sum.
+
+    Each label set holds one count per bucket (non-cumulative, the last one
+    being +Inf) followed by the sum, so an observation is a bisect and two
+    additions under the lock.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        """Create a histogram with the given bucket upper bounds."""
+        super().__init__(name, help_text)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Count one observation."""
+        key = _labels(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable copy including the bucket bounds."""
+        return {**super().snapshot(), "buckets": list(self.buckets)}
+
+
+class MetricsRegistry:
+    """Metrics of this process, optionally shared with other workers through files.
+
+    With ``multiprocess_dir`` set, every worker writes its snapshot to
+    ``<dir>/<pid>.json`` (atomically, every ``flush_interval_seconds`` and on
+    shutdown) and a scrape served by any worker merges all of them: counters
+    and histograms are summed over every file, gauges only over workers that
+    are still running. Clear the directory before starting the server.
+    """
+
+    def __init__(
+        self,
+        multiprocess_dir: Optional[str] = None,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        """Create an empty registry."""
+        self.multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+        self.flush_interval_seconds = flush_interval_seconds
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """Register and return a counter."""
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        """Register and return a gauge."""
+        return self._register(Gauge(name, help_text))
+
+    def histogram(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Register and return a histogram."""
+        return self._register(Histogram(name, help_text, buckets))
+
+    def _register(self, metric: _Metric) -> Any:
+        """Add a metric under its name."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(
+        self, key: str, collector: Callable[[], Iterable[Sample]]
+    ) -> None:
+        """Register (or replace) a callback that reports samples at scrape time."""
+        self._collectors[key] = collector
+
+    def snapshot(self) -> dict:
+        """Return this process's metrics, including collected samples."""
+        metrics = {name: metric.snapshot() for name, metric in self._metrics.items()}
+        for collector in list(self._collectors.values()):
+            try:
+                samples = list(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+                continue
+            for name, kind, help_text, labels, value in samples:
+                metric = metrics.setdefault(
+                    name, {"type": kind, "help": help_text, "samples": []}
+                )
+                metric["samples"].append([list(_labels(labels)), value])
+        return {"pid": os.getpid(), "metrics": metrics}
+
+    def write_snapshot(self) -> None:
+        """Write this process's snapshot to the multiprocess directory."""
+        if self.multiprocess_dir is None:
+            return
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+        path = self.multiprocess_dir / f"{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, path)
+
+    def _snapshots(self) -> list[tuple[dict, bool]]:
+        """Return (snapshot, is_live) for this process and, if shared, all others."""
+        own = self.snapshot()
+        if self.multiprocess_dir is None or not self.multiprocess_dir.is_dir():
+            return [(own, True)]
+
+        snapshots = [(own, True)]
+        for path in self.multiprocess_dir.glob("*.json"):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # being replaced or removed
+            if snapshot.get("pid") != own["pid"]:
+                snapshots.append((snapshot, _is_running(snapshot.get("pid"))))
+        return snapshots
+
+    def render(self) -> str:
+        """Render the merged metrics in the Prometheus text exposition format."""
+        merged: dict[str, dict] = {}
+        for snapshot, live in self._snapshots():
+            for name, metric in snapshot["metrics"].items():
+                if metric["type"] == "gauge" and not live:
+                    continue
+                target = merged.setdefault(
+                    name, {**metric, "samples": {}, "buckets": metric.get("buckets")}
+                )
+                for labels, value in metric["samples"]:
+                    key = tuple(tuple(pair) for pair in labels)
+                    target["samples"][key] = _add(target["samples"].get(key), value)
+
+        _add_hit_ratios(merged)
+        lines = []
+        for name in sorted(merged):
+            metric = merged[name]
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            for labels, value in sorted(metric["samples"].items()):
+                if metric["type"] == "histogram":
+                    lines.extend(
+                        _histogram_lines(name, labels, metric["buckets"], value)
+                    )
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        """Start writing snapshots in the background (multiprocess mode only)."""
+        if self.multiprocess_dir is None or self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and write a final snapshot."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        self.write_snapshot()
+
+    def _run(self) -> None:
+        """Write a snapshot every flush interval."""
+        while not self._stopping.wait(self.flush_interval_seconds):
+            try:
+                self.write_snapshot()
+            except OSError as e:
+                logger.error(f"Failed to write metrics snapshot: {e}")
+
+
+def _is_running(pid: Optional[int]) -> bool:
+    """Check whether a worker process still exists."""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _add(total: Any, value: Any) -> Any:
+    """Sum two sample values (numbers or histogram bucket lists)."""
+    if total is None:
+        return list(value) if isinstance(value, list) else value
+    if isinstance(total, list):
+        return [a + b for a, b in zip(total, value)]
+    return total + value
+
+
+def _add_hit_ratios(merged: dict[str, dict]) -> None:
+    """Derive per-cache hit ratios from the merged hit and miss totals."""
+    hits = merged.get("jobs_api_cache_hits_total", {}).get("samples", {})
+    misses = merged.get("jobs_api_cache_misses_total", {}).get("samples", {})
+    ratios = {}
+    for labels, hit_count in hits.items():
+        lookups = hit_count + misses.get(labels, 0)
+        ratios[labels] = hit_count / lookups if lookups else 0.0
+    if ratios:
+        merged["jobs_api_cache_hit_ratio"] = {
+            "type": "gauge",
+            "help": "Cache hits divided by lookups since start.",
+            "samples": ratios,
+        }
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format a label set as {name="value",...}."""
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _histogram_lines(
+    name: str, labels: Labels, buckets: list[float], value: list
+) -> list[str]:
+    """Format one histogram label set as cumulative buckets, sum and count."""
+    lines = []
+    cumulative = 0
+    for bound, count in zip([*buckets, float("inf")], value[:-1]):
+        cumulative += count
+        bucket_labels = labels + (("le", _number(bound)),)
+        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_number(value[-1])}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return lines
+
+
+registry = MetricsRegistry(
+    multiprocess_dir=settings.metrics_multiprocess_dir,
+    flush_interval_seconds=settings.metrics_flush_interval_seconds,
+)
+
+requests_total = registry.counter(
+    "jobs_api_requests_total", "HTTP requests by method, route and status."
+)
+request_duration = registry.histogram(
+    "jobs_api_request_duration_seconds", "HTTP request latency by method and route."
+)
+requests_in_flight = registry.gauge(
+    "jobs_api_requests_in_flight", "HTTP requests currently being served."
+)
+pool_checkout_duration = registry.histogram(
+    "jobs_api_db_pool_checkout_seconds",
+    "Time to check a connection out of the pool, including waits for a free one.",
+    POOL_WAIT_BUCKETS,
+)
+auth_total = registry.counter(
+    "jobs_api_auth_total",
+    "API key authentications by result (cache_hit, verified, rejected).",
+)
+
+
+def cache_samples(name: str, stats: dict[str, float]) -> list[Sample]:
+    """Report a cache's stats() as hit, miss and size samples."""
+    labels = {"cache": name}
+    return [
+        ("jobs_api_cache_hits_total", "counter", "Cache hits.", labels, stats["hits"]),
+        (
+            "jobs_api_cache_misses_total",
+            "counter",
+            "Cache misses.",
+            labels,
+            stats["misses"],
+        ),
+        ("jobs_api_cache_entries", "gauge", "Cached entries.", labels, stats["size"]),
+    ]
+
+
+def _time_pool_connect(pool, name: str) -> None:
+    """Wrap a pool's ``connect`` to observe how long each checkout takes."""
+    connect = pool.connect
+
+    def timed_connect():
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            pool_checkout_duration.observe(time.perf_counter() - started, pool=name)
+
+    pool.connect = timed_connect
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """Time every checkout from an engine's connection pool.
+
+    Pool events only fire once a connection is handed out, so the pool's
+    ``connect`` is wrapped to include the time spent waiting for one. The
+    number of checkouts is the histogram's count. ``engine.dispose()``
+    replaces the pool, so the new one is wrapped from the engine_disposed
+    event.
+    """
+    _time_pool_connect(engine.pool, name)
+
+    @event.listens_for(engine, "engine_disposed")
+    def _pool_recreated(disposed: Engine) -> None:
+        _time_pool_connect(disposed.pool, name)
+
+    def checked_out() -> list[Sample]:
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return []
+        return [
+            (
+                "jobs_api_db_pool_checked_out",
+                "gauge",
+                "Connections currently checked out of the pool.",
+                {"pool": name},
+                pool.checkedout(),
+            )
+        ]
+
+    registry.add_collector(f"pool:{name}", checked_out)
+
+
+def track_repository(repository, prefix: str = "") -> None:
+    """Report the connection pools and read cache of a repository."""
+    instrument_pool(repository.engine, f"{prefix}write")
+    if repository.read_engine is not repository.engine:
+        instrument_pool(repository.read_engine, f"{prefix}read")
+    registry.add_collector(
+        f"cache:{prefix}read",
+        lambda: cache_samples(f"{prefix}read", repository.read_cache.stats()),
+    )
+
+
+class MetricsMiddleware:
+    """Count requests and observe their latency per route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request until its body has been sent."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight.dec()
+            # Route templates keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            requests_total.inc(method=method, route=route, status=status)
+            request_duration.observe(
+                time.perf_counter() - started, method=method, route=route
+            )
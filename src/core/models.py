@@ -1,12 +1,13 @@
 """Database models for job listings, details, and API keys."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -17,6 +18,11 @@ from sqlalchemy.orm import declarative_base, relationship
 Base = declarative_base()
 
 
+def utc_now() -> datetime:
+    """Return the current time in UTC, as used for column defaults."""
+    return datetime.now(timezone.utc)
+
+
 class JobListingModel(Base):
     """Job listing information from job sites."""
 
@@ -39,6 +45,45 @@ class JobListingModel(Base):
     # Relationship to JobDetailsModel
     details = relationship("JobDetailsModel", back_populates="listing", uselist=False)
 
+    # Secondary indexes matching the /jobs/ filters, which all sort by
+    # (listing_date DESC, job_id DESC). The table is created by jobs-scraper,
+    # so SQLiteRepository.ensure_indexes() adds these to existing databases.
+    __table_args__ = (
+        Index("ix_job_listings_listing_date", "listing_date", "job_id"),
+        Index(
+            "ix_job_listings_classification",
+            "job_classification",
+            "listing_date",
+            "job_id",
+        ),
+        Index(
+            "ix_job_listings_classification_sub",
+            "job_classification",
+            "job_sub_classification",
+            "listing_date",
+            "job_id",
+        ),
+        Index(
+            "ix_job_listings_sub_classification",
+            "job_sub_classification",
+            "listing_date",
+            "job_id",
+        ),
+        Index(
+            "ix_job_listings_work_arrangements",
+            "work_arrangements",
+            "listing_date",
+            "job_id",
+        ),
+        # Covers the single-pass GROUP BY behind /jobs/facets
+        Index(
+            "ix_job_listings_facets",
+            "job_classification",
+            "job_sub_classification",
+            "work_arrangements",
+        ),
+    )
+
 
 class JobDetailsModel(Base):
     """Detailed job information and metadata."""
@@ -55,6 +100,20 @@ class JobDetailsModel(Base):
     # Relationship back to JobListingModel
     listing = relationship("JobListingModel", back_populates="details")
 
+    # Cached HTML rendering of details, filled lazily by the API
+    rendered = relationship("RenderedDetailsModel", uselist=False, viewonly=True)
+
+
+class RenderedDetailsModel(Base):
+    """Pre-rendered HTML for job details markdown."""
+
+    __tablename__ = "job_details_html"
+
+    job_id = Column(String, ForeignKey("job_details.job_id"), primary_key=True)
+    content_hash = Column(String, nullable=False)
+    html = Column(Text, nullable=False)
+    rendered_at = Column(DateTime, default=utc_now)
+
 
 class APIKeyModel(Base):
     """API key for authentication and authorization."""
@@ -64,6 +123,7 @@ class APIKeyModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     key_hash = Column(String, unique=True, nullable=False, index=True)
     key_prefix = Column(String(12), nullable=False)
+    lookup_id = Column(String, unique=True, nullable=True, index=True)
     name = Column(String, nullable=False)
     email = Column(String, nullable=False, index=True)
     company = Column(String, nullable=True)
@@ -86,7 +146,7 @@ class FavoriteJobModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     api_key_id = Column(Integer, ForeignKey("api_keys.id"), nullable=False)
     job_id = Column(String, ForeignKey("job_listings.job_id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
     notes = Column(Text, nullable=True)
 
     # Relationships
@@ -94,4 +154,7 @@ class FavoriteJobModel(Base):
     job = relationship("JobListingModel")
 
     # Unique constraint: each user can favorite a job only once
-    __table_args__ = (UniqueConstraint("api_key_id", "job_id", name="unique_favorite"),)
+    __table_args__ = (
+        UniqueConstraint("api_key_id", "job_id", name="unique_favorite"),
+        Index("ix_favorite_jobs_api_key_created", "api_key_id", "created_at", "id"),
+    )
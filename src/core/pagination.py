@@ -0,0 +1,54 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable
+
+from src.core.exceptions import InvalidInputError
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a sort key value to a JSON-safe representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(kind: str, *values: Any) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor."""
+    payload = json.dumps([kind, *map(_encode_value, values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, kind: str, *converters: Callable[[Any], Any]
+) -> tuple[Any, ...]:
+    """Decode a cursor produced by encode_cursor for the same listing kind.
+
+    Each converter turns one JSON value back into its sort key type; None
+    values are passed through unchanged.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_kind, *values = payload
+        if cursor_kind != kind or len(values) != len(converters):
+            raise ValueError("cursor does not belong to this listing")
+        return tuple(
+            None if value is None else convert(value)
+            for convert, value in zip(converters, values)
+        )
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidInputError("Invalid pagination cursor") from e
+
+
+def validate_page(skip: int, limit: int, cursor: str | None) -> None:
+    """Check the skip/limit/cursor parameters shared by list endpoints."""
+    if skip < 0:
+        raise InvalidInputError("skip must be a non-negative integer")
+    if limit < 1 or limit > 1000:
+        raise InvalidInputError("limit must be between 1 and 1000")
+    if cursor and skip:
+        raise InvalidInputError("skip cannot be combined with cursor")
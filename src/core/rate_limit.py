@@ -0,0 +1,252 @@
+"""Per-API-key rate limiting with pluggable sliding-window backends."""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.exceptions import RateLimitExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitStatus(NamedTuple):
+    """Outcome of counting one request against a key's limit."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: int
+    retry_after: int
+
+    def headers(self) -> dict[str, str]:
+        """Return the X-RateLimit-* headers describing this status."""
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_after),
+        }
+
+
+def _sliding_window(
+    previous: int,
+    current: int,
+    limit: int,
+    now: float,
+    window_start: int,
+    window_seconds: int,
+) -> RateLimitStatus:
+    """Evaluate the sliding-window counter for one incoming request.
+
+    The previous fixed window's count is weighted by how much of it still
+    overlaps the sliding window, which approximates a true sliding log with
+    two integers per key.
+    """
+    elapsed = now - window_start
+    used = previous * (1 - elapsed / window_seconds) + current
+    reset_after = max(1, math.ceil(window_seconds - elapsed))
+
+    if used + 1 <= limit:
+        remaining = max(0, math.floor(limit - used - 1))
+        return RateLimitStatus(True, limit, remaining, reset_after, 0)
+
+    if current + 1 <= limit and previous > 0:
+        # Wait until the previous window's share has decayed enough
+        wait = window_seconds * (1 - (limit - current - 1) / previous) - elapsed
+    else:
+        # The current window alone is full: wait for it to roll over and decay
+        wait = (window_seconds - elapsed) + window_seconds * max(
+            0.0, 1 - (limit - 1) / max(current, 1)
+        )
+    retry_after = min(max(1, math.ceil(wait)), 2 * window_seconds)
+    return RateLimitStatus(False, limit, 0, reset_after, retry_after)
+
+
+class RateLimitBackend(ABC):
+    """Storage for per-key sliding-window counters."""
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitStatus:
+        """Count a request for the key if it is within the limit."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local counters; each uvicorn worker enforces limits separately."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        # key -> (window_start, previous_count, current_count)
+        self._windows: dict[str, tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitStatus:
+        """Count a request for the key if it is within the limit."""
+        now = time.time()
+        window_start = int(now // window_seconds) * window_seconds
+
+        with self._lock:
+            stored_start, stored_previous, stored_current = self._windows.get(
+                key, (window_start, 0, 0)
+            )
+            if stored_start == window_start:
+                previous, current = stored_previous, stored_current
+            elif stored_start == window_start - window_seconds:
+                previous, current = stored_current, 0
+            else:
+                previous, current = 0, 0
+
+            status = _sliding_window(
+                previous, current, limit, now, window_start, window_seconds
+            )
+            if status.allowed:
+                current += 1
+            self._windows[key] = (window_start, previous, current)
+            return status
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Counters in a small SQLite file shared by all workers on the host."""
+
+    # Purge expired windows once every this many requests
+    PURGE_EVERY = 1000
+
+    def __init__(self, path: str) -> None:
+        """Open (or create) the shared counter database."""
+        self.path = path
+        self._connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_windows ("
+            "key TEXT NOT NULL, window_start INTEGER NOT NULL, "
+            "count INTEGER NOT NULL, PRIMARY KEY (key, window_start)"
+            ") WITHOUT ROWID"
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitStatus:
+        """Count a request for the key if it is within the limit."""
+        now = time.time()
+        window_start = int(now // window_seconds) * window_seconds
+        previous_start = window_start - window_seconds
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                counts = dict(
+                    self._connection.execute(
+                        "SELECT window_start, count FROM rate_limit_windows "
+                        "WHERE key = ? AND window_start >= ?",
+                        (key, previous_start),
+                    ).fetchall()
+                )
+                status = _sliding_window(
+                    counts.get(previous_start, 0),
+                    counts.get(window_start, 0),
+                    limit,
+                    now,
+                    window_start,
+                    window_seconds,
+                )
+                if status.allowed:
+                    self._connection.execute(
+                        "INSERT INTO rate_limit_windows (key, window_start, count) "
+                        "VALUES (?, ?, 1) ON CONFLICT (key, window_start) "
+                        "DO UPDATE SET count = count + 1",
+                        (key, window_start),
+                    )
+
+                self._hits += 1
+                if self._hits % self.PURGE_EVERY == 0:
+                    self._connection.execute(
+                        "DELETE FROM rate_limit_windows WHERE window_start < ?",
+                        (previous_start,),
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+            return status
+
+
+class RateLimiter:
+    """Enforce each API key's requests-per-window limit."""
+
+    def __init__(
+        self, backend: RateLimitBackend, window_seconds: int, enabled: bool = True
+    ) -> None:
+        """Initialize limiter with a counter backend."""
+        self.backend = backend
+        self.window_seconds = window_seconds
+        self.enabled = enabled
+
+    def check(self, api_key_id: int, limit: int) -> RateLimitStatus | None:
+        """Count a request, raising RateLimitExceededError when over the limit.
+
+        Returns None when limiting is disabled or the key has no positive limit.
+        Database errors in the backend are logged and the request is allowed.
+        """
+        if not self.enabled or limit <= 0:
+            return None
+
+        try:
+            status = self.backend.hit(str(api_key_id), limit, self.window_seconds)
+        except sqlite3.Error as e:
+            logger.error(f"Rate limit backend failed for key {api_key_id}: {e}")
+            return None
+
+        if not status.allowed:
+            raise RateLimitExceededError(status)
+        return status
+
+
+def create_rate_limit_backend(name: str) -> RateLimitBackend:
+    """Create the backend selected by RATE_LIMIT_BACKEND."""
+    if name == "memory":
+        return InMemoryRateLimitBackend()
+    if name == "sqlite":
+        return SQLiteRateLimitBackend(settings.rate_limit_sqlite_path)
+    raise ValueError(f"Unknown rate limit backend: {name!r}")
+
+
+class RateLimitHeadersMiddleware:
+    """Add X-RateLimit-* headers for requests that were counted by the limiter."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Copy the status stored on request.state into the response headers."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_headers(message: Message) -> None:
+            status = state.get("rate_limit")
+            if message["type"] == "http.response.start" and status is not None:
+                headers = MutableHeaders(scope=message)
+                for name, value in status.headers().items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+rate_limiter = RateLimiter(
+    backend=create_rate_limit_backend(settings.rate_limit_backend),
+    window_seconds=settings.rate_limit_window_seconds,
+    enabled=settings.rate_limit_enabled,
+)
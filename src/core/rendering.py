@@ -0,0 +1,68 @@
+"""Markdown rendering of job details with a persistent HTML cache."""
+
+import hashlib
+import logging
+from typing import Optional
+
+import markdown
+from sqlalchemy.exc import DBAPIError
+
+from src.core.exceptions import DatabaseError
+from src.core.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+# Bump when rendering output changes (extensions, options) to re-render
+RENDERER_VERSION = "1"
+
+
+def details_hash(details: str) -> str:
+    """Hash details text together with the renderer version."""
+    digest = hashlib.sha256(f"{RENDERER_VERSION}\0{details}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_details(details: str) -> str:
+    """Convert job details markdown to HTML."""
+    return markdown.markdown(details)
+
+
+def render_batch(rows: list[tuple[str, str]]) -> list[tuple[str, str, str]]:
+    """Render (job_id, details) rows to (job_id, content_hash, html) rows."""
+    return [
+        (job_id, details_hash(details), render_details(details))
+        for job_id, details in rows
+    ]
+
+
+def get_details_html(repository, job_details) -> Optional[str]:
+    """Return cached HTML for job details, rendering and storing it on a miss."""
+    return get_details_html_batch(repository, [job_details])[job_details.job_id]
+
+
+def get_details_html_batch(repository, job_details_list) -> dict[str, Optional[str]]:
+    """Return HTML per job_id for many job details, storing all misses in one write."""
+    html: dict[str, Optional[str]] = {}
+    stale = []
+    for job_details in job_details_list:
+        if not job_details.details:
+            html[job_details.job_id] = None
+            continue
+
+        content_hash = details_hash(job_details.details)
+        rendered = job_details.rendered
+        if rendered is not None and rendered.content_hash == content_hash:
+            html[job_details.job_id] = rendered.html
+            continue
+
+        with timed("render"):
+            html[job_details.job_id] = render_details(job_details.details)
+        stale.append((job_details.job_id, content_hash, html[job_details.job_id]))
+
+    if stale:
+        try:
+            repository.save_rendered_details(stale)
+        except (DBAPIError, DatabaseError) as e:
+            # The cache is best effort; serve the fresh rendering regardless
+            logger.warning(f"Failed to cache rendered details: {e}")
+    return html
@@ -1,43 +1,505 @@
 """Repository for job and API key data access."""
 
 import logging
+import time
+from collections import Counter
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import (
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
-from sqlalchemy import create_engine, or_
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    DateTime,
+    Engine,
+    Integer,
+    String,
+    and_,
+    bindparam,
+    column,
+    create_engine,
+    delete,
+    exists,
+    false,
+    func,
+    inspect,
+    literal_column,
+    null,
+    or_,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import Select
 
+from src.core.cache import QueryCache
+from src.core.change_feed import CHANGES_TABLE, ensure_change_feed
+from src.core.dataset_version import (
+    FAVORITES_TRACKED_TABLES,
+    FAVORITES_VERSION_TABLE,
+    DatasetVersionProbe,
+)
 from src.core.exceptions import DatabaseError
+from src.core.instrumentation import instrument_engine
+from src.core.job_stats import (
+    GRANULARITY_SECONDS,
+    STATS_TABLE,
+    UNDATED_HOUR,
+    ensure_job_stats,
+    rebuild_job_stats,
+)
 from src.core.models import (
     APIKeyModel,
     Base,
     FavoriteJobModel,
     JobDetailsModel,
     JobListingModel,
+    RenderedDetailsModel,
+    utc_now,
+)
+from src.core.search_index import (
+    BM25_WEIGHTS,
+    SEARCH_TABLE,
+    build_fts_query,
+    ensure_search_index,
+    rebuild_search_index,
+)
+from src.core.slow_queries import slow_query_log
+from src.core.sqlite_profile import (
+    PragmaValue,
+    apply_sqlite_profile,
+    is_sqlite_file_url,
+    read_only_url,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# IDs per IN (...) list, well under SQLite's default 999 bound parameters
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Columns reported by get_job_facets, in GROUP BY order
+FACET_COLUMNS = (
+    JobListingModel.job_classification,
+    JobListingModel.job_sub_classification,
+    JobListingModel.work_arrangements,
+)
+
+# Trigger-maintained log behind /jobs/changes (see src.core.change_feed)
+job_changes = table(
+    CHANGES_TABLE,
+    column("seq", Integer),
+    column("job_id", String),
+    column("change", String),
+    column("changed_at", DateTime),
+)
+
+# Details columns stored by upsert_jobs (job_id comes from the listing)
+DETAILS_COLUMNS = (
+    JobDetailsModel.status,
+    JobDetailsModel.is_expired,
+    JobDetailsModel.details,
+    JobDetailsModel.is_verified,
+    JobDetailsModel.expires_at,
+)
+
+# Listing columns streamed by iter_jobs, in JobListingResponse order
+EXPORT_COLUMNS = (
+    JobListingModel.job_id,
+    JobListingModel.title,
+    JobListingModel.job_details_url,
+    JobListingModel.job_summary,
+    JobListingModel.company_name,
+    JobListingModel.location,
+    JobListingModel.country_code,
+    JobListingModel.listing_date,
+    JobListingModel.salary_label,
+    JobListingModel.work_type,
+    JobListingModel.job_classification,
+    JobListingModel.job_sub_classification,
+    JobListingModel.work_arrangements,
 )
 
 
+class JobListingResult(NamedTuple):
+    """A job listing flagged with whether the requesting key favorited it."""
+
+    job: JobListingModel
+    is_favorite: bool
+
+
+class JobSearchResult(NamedTuple):
+    """A search hit with its highlighted snippet and bm25 rank (FTS5 only)."""
+
+    job: JobListingModel
+    snippet: Optional[str]
+    rank: Optional[float]
+    is_favorite: bool = False
+
+
+def _upsert_insert(engine: Engine, model):
+    """Return an INSERT with ON CONFLICT support for SQLite or PostgreSQL."""
+    if engine.dialect.name == "postgresql":
+        return postgresql_insert(model)
+    if engine.dialect.name != "sqlite":
+        raise DatabaseError(
+            f"Upserts are not supported on {engine.dialect.name} databases"
+        )
+    return sqlite_insert(model)
+
+
+def _job_filters(
+    job_classification: Optional[str],
+    job_sub_classification: Optional[str],
+    work_arrangements: Optional[str],
+) -> list:
+    """Build the WHERE clauses shared by the job listing filters."""
+    conditions = []
+    if job_classification:
+        conditions.append(JobListingModel.job_classification == job_classification)
+    if job_sub_classification:
+        conditions.append(
+            JobListingModel.job_sub_classification == job_sub_classification
+        )
+    if work_arrangements:
+        conditions.append(JobListingModel.work_arrangements == work_arrangements)
+    return conditions
+
+
+def export_jobs_statement(
+    job_classification: Optional[str] = None,
+    job_sub_classification: Optional[str] = None,
+    work_arrangements: Optional[str] = None,
+):
+    """Select EXPORT_COLUMNS for the filtered jobs, newest first."""
+    return (
+        select(*EXPORT_COLUMNS)
+        .where(
+            *_job_filters(job_classification, job_sub_classification, work_arrangements)
+        )
+        .order_by(JobListingModel.listing_date.desc(), JobListingModel.job_id.desc())
+    )
+
+
+def _is_favorite(api_key_id: Optional[int]):
+    """Select whether each job row is a favorite of the given API key.
+
+    The correlated EXISTS probes the (api_key_id, job_id) unique index once
+    per returned row, so its cost follows the page size rather than the
+    number of favorites the key has.
+    """
+    if api_key_id is None:
+        return false().label("is_favorite")
+    return (
+        exists()
+        .where(
+            FavoriteJobModel.api_key_id == api_key_id,
+            FavoriteJobModel.job_id == JobListingModel.job_id,
+        )
+        .label("is_favorite")
+    )
+
+
+def _after_descending(date_column, id_column, after_date, after_id):
+    """Filter rows sorting after a (date, id) key in DESC order, NULL dates last."""
+    if after_date is None:
+        return and_(date_column.is_(None), id_column < after_id)
+    return or_(
+        date_column < after_date,
+        and_(date_column == after_date, id_column < after_id),
+        date_column.is_(None),
+    )
+
+
+def _listing_statement(
+    entities: tuple,
+    api_key_id: Optional[int],
+    filters: list,
+    skip: int,
+    limit: int,
+    after: Optional[tuple[Optional[datetime], str]],
+) -> Select:
+    """Select a page of filtered jobs, newest first, with an is_favorite flag."""
+    statement = select(*entities, _is_favorite(api_key_id)).where(*filters)
+    if after is not None:
+        statement = statement.where(
+            _after_descending(
+                JobListingModel.listing_date, JobListingModel.job_id, *after
+            )
+        )
+    return (
+        statement.order_by(
+            JobListingModel.listing_date.desc(), JobListingModel.job_id.desc()
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+# Same replacements as html.escape(); "&" must come first
+_HTML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#x27;"),
+)
+
+
+def _fts_statement(
+    entities: tuple,
+    fts_query: str,
+    skip: int,
+    limit: int,
+    after: Optional[tuple[float, str]],
+    api_key_id: Optional[int],
+) -> Select:
+    """Select FTS5 matches ordered by bm25 relevance, with snippet and rank."""
+    search = table(SEARCH_TABLE, column("job_id"))
+    # snippet() copies the indexed text verbatim, so highlight with control
+    # characters, HTML-escape the text and only then turn them into <mark> tags
+    snippet = literal_column(f"snippet({SEARCH_TABLE}, -1, char(2), char(3), '…', 16)")
+    for character, entity in _HTML_ESCAPES:
+        snippet = func.replace(snippet, character, entity)
+    snippet = func.replace(
+        func.replace(snippet, func.char(2), "<mark>"), func.char(3), "</mark>"
+    )
+    rank = literal_column(f"bm25({SEARCH_TABLE}, {', '.join(map(str, BM25_WEIGHTS))})")
+
+    statement = (
+        select(
+            *entities,
+            snippet.label("snippet"),
+            rank.label("rank"),
+            _is_favorite(api_key_id),
+        )
+        .select_from(JobListingModel)
+        .join(search, search.c.job_id == JobListingModel.job_id)
+        .where(literal_column(SEARCH_TABLE).op("MATCH")(fts_query))
+    )
+
+    if after is not None:
+        after_rank, after_id = after
+        statement = statement.where(
+            or_(
+                rank > after_rank,
+                and_(rank == after_rank, JobListingModel.job_id > after_id),
+            )
+        )
+
+    return statement.order_by(rank, JobListingModel.job_id).offset(skip).limit(limit)
+
+
+def _like_statement(
+    entities: tuple,
+    keyword: str,
+    skip: int,
+    limit: int,
+    after: Optional[tuple[Optional[datetime], str]],
+    api_key_id: Optional[int],
+) -> Select:
+    """Select case-insensitive substring matches (full scan), newest first."""
+    search_term = f"%{keyword}%"
+    statement = (
+        select(
+            *entities,
+            null().label("snippet"),
+            null().label("rank"),
+            _is_favorite(api_key_id),
+        )
+        .select_from(JobListingModel)
+        .outerjoin(JobDetailsModel)
+        .where(
+            or_(
+                JobListingModel.title.ilike(search_term),
+                JobListingModel.job_summary.ilike(search_term),
+                JobListingModel.company_name.ilike(search_term),
+                JobListingModel.location.ilike(search_term),
+                JobDetailsModel.details.ilike(search_term),
+            )
+        )
+    )
+
+    if after is not None:
+        statement = statement.where(
+            _after_descending(
+                JobListingModel.listing_date, JobListingModel.job_id, *after
+            )
+        )
+
+    return (
+        statement.order_by(
+            JobListingModel.listing_date.desc(), JobListingModel.job_id.desc()
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+
+
 class SQLiteRepository:
     """Database repository for job listings, details, and API keys."""
 
-    def __init__(self, db_url: str) -> None:
-        """Initialize repository and create database tables."""
+    def __init__(
+        self,
+        db_url: str,
+        full_text_search: bool = True,
+        create_indexes: bool = True,
+        cache_ttl_seconds: float = 300.0,
+        version_check_seconds: float = 1.0,
+        sqlite_pragmas: Optional[dict[str, PragmaValue]] = None,
+        read_only_pool: bool = False,
+        instrument_queries: bool = False,
+        log_slow_queries: bool = False,
+        engine: Optional[Engine] = None,
+        read_engine: Optional[Engine] = None,
+    ) -> None:
+        """Initialize repository and create database tables.
+
+        ``sqlite_pragmas`` are applied to every new connection. With
+        ``read_only_pool`` the read queries behind GET endpoints use a second,
+        read-only pool on the same SQLite file. ``instrument_queries`` counts
+        queries and SQL time for request instrumentation; ``log_slow_queries``
+        feeds slow statements to the slow query log. ``engine``/``read_engine``
+        replace the engines built from ``db_url``; AsyncRepository passes the
+        sync facades of its async engines here.
+        """
         self.db_url = db_url
+        # Small read results (facets, stats, distinct values) keyed by dataset version
+        self.read_cache = QueryCache(max_entries=1024, ttl_seconds=cache_ttl_seconds)
+        # Bumped on every in-process key revocation so caches can react at once
+        self.api_key_revision = 0
 
         try:
-            self.engine = create_engine(self.db_url)
+            self.engine = engine if engine is not None else create_engine(self.db_url)
+            apply_sqlite_profile(self.engine, sqlite_pragmas or {})
             Base.metadata.create_all(self.engine)
+            self._migrate_api_keys_table()
+            if create_indexes:
+                self.ensure_indexes()
+            self.dataset_version = DatasetVersionProbe(
+                self.engine, check_interval_seconds=version_check_seconds
+            )
+            self.dataset_version.install()
+            self.favorites_version = DatasetVersionProbe(
+                self.engine,
+                check_interval_seconds=version_check_seconds,
+                version_table=FAVORITES_VERSION_TABLE,
+                tracked_tables=FAVORITES_TRACKED_TABLES,
+            )
+            self.favorites_version.install()
+            self.change_feed = ensure_change_feed(self.engine)
+            # Falls back to counting job_listings directly for other backends
+            self.job_stats = ensure_job_stats(self.engine)
+            # Falls back to LIKE search when SQLite lacks FTS5 or for other backends
+            self.full_text_search = full_text_search and ensure_search_index(
+                self.engine
+            )
+            # Opened after the schema exists, since mode=ro cannot create it
+            if read_engine is None and read_only_pool:
+                if is_sqlite_file_url(self.db_url):
+                    read_engine = create_engine(read_only_url(self.db_url))
+                else:
+                    logger.warning("Read-only pool needs a SQLite file database")
+            if read_engine is not None:
+                apply_sqlite_profile(read_engine, sqlite_pragmas or {}, read_only=True)
+            self.read_engine = read_engine if read_engine is not None else self.engine
+            engines = [self.engine]
+            if self.read_engine is not self.engine:
+                engines.append(self.read_engine)
+            for instrumented in engines:
+                if instrument_queries:
+                    instrument_engine(instrumented)
+                if log_slow_queries:
+                    slow_query_log.install(instrumented)
         except Exception as e:
-            logging.error(f"Failed to initialize database at {self.db_url}: {e}")
+            logger.error(f"Failed to initialize database at {self.db_url}: {e}")
             raise DatabaseError(
                 f"Failed to initialize database at {self.db_url}"
             ) from e
 
+    def _migrate_api_keys_table(self) -> None:
+        """Add api_keys columns and indexes introduced after the initial schema."""
+        columns = {c["name"] for c in inspect(self.engine).get_columns("api_keys")}
+        if "lookup_id" not in columns:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    text("ALTER TABLE api_keys ADD COLUMN lookup_id VARCHAR")
+                )
+
+        for index in APIKeyModel.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+    def ensure_indexes(self) -> list[str]:
+        """Create any declared index missing from the database, return their names.
+
+        create_all() only adds indexes when it creates a table, so tables that
+        already exist (e.g. written by jobs-scraper) are checked one by one.
+        """
+        existing_tables = set(inspect(self.engine).get_table_names())
+        created = []
+        for table_model in Base.metadata.sorted_tables:
+            if table_model.name not in existing_tables:
+                continue
+            existing = {
+                index["name"]
+                for index in inspect(self.engine).get_indexes(table_model.name)
+            }
+            for index in sorted(table_model.indexes, key=lambda i: i.name):
+                if index.name not in existing:
+                    index.create(self.engine, checkfirst=True)
+                    created.append(index.name)
+
+        if created:
+            logger.info(f"Created database indexes: {', '.join(created)}")
+        return created
+
+    def analyze(self) -> None:
+        """Refresh the query planner's statistics."""
+        with self.engine.begin() as connection:
+            connection.execute(text("ANALYZE"))
+
     def close(self):
         """Close database connection."""
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
         self.engine.dispose()
 
+    def get_dataset_version(self) -> Optional[int]:
+        """Return a version number that changes whenever job data is written.
+
+        Read caches include it in their keys. The underlying counter is
+        maintained by SQLite triggers and polled at most once per
+        ``version_check_seconds``; None means changes cannot be detected and
+        cached entries only expire through their TTL.
+        """
+        return self.dataset_version.current()
+
+    def get_favorites_version(self) -> Optional[int]:
+        """Return a version number that changes whenever any favorite is written.
+
+        Tracked separately from the dataset version so favorite writes do not
+        invalidate the shared read caches, only per-user responses.
+        """
+        return self.favorites_version.current()
+
+    def _cached(self, key: tuple, compute: Callable[[], T]) -> T:
+        """Return a read result cached for the current dataset version."""
+        return self.read_cache.get_or_compute(
+            (self.get_dataset_version(), *key), compute
+        )
+
     def get_all_jobs(
         self,
         job_classification: Optional[str] = None,
@@ -45,35 +507,116 @@ class SQLiteRepository:
         work_arrangements: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[tuple[Optional[datetime], str]] = None,
     ) -> list[JobListingModel]:
-        """Get job listings with optional filters and pagination."""
-        with Session(self.engine) as session:
-            query = session.query(JobListingModel)
+        """Get job listings, newest first, with optional filters and pagination.
 
-            if job_classification:
-                query = query.filter(
-                    JobListingModel.job_classification == job_classification
-                )
+        ``after`` is the ``(listing_date, job_id)`` of the last row of the
+        previous page; it seeks directly to the next page instead of
+        counting past ``skip`` rows.
+        """
+        return [
+            result.job
+            for result in self.get_all_jobs_with_favorites(
+                None,
+                job_classification=job_classification,
+                job_sub_classification=job_sub_classification,
+                work_arrangements=work_arrangements,
+                skip=skip,
+                limit=limit,
+                after=after,
+            )
+        ]
 
-            if job_sub_classification:
-                query = query.filter(
-                    JobListingModel.job_sub_classification == job_sub_classification
-                )
+    def get_all_jobs_with_favorites(
+        self,
+        api_key_id: Optional[int],
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple[Optional[datetime], str]] = None,
+    ) -> list[JobListingResult]:
+        """Get a page of job listings (as get_all_jobs) with an is_favorite flag."""
+        statement = _listing_statement(
+            (JobListingModel,),
+            api_key_id,
+            _job_filters(job_classification, job_sub_classification, work_arrangements),
+            skip,
+            limit,
+            after,
+        )
+        with Session(self.read_engine) as session:
+            rows = session.execute(statement).all()
+            return [JobListingResult(job, bool(flag)) for job, flag in rows]
 
-            if work_arrangements:
-                query = query.filter(
-                    JobListingModel.work_arrangements == work_arrangements
-                )
+    def get_job_rows(
+        self,
+        api_key_id: Optional[int],
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple[Optional[datetime], str]] = None,
+    ) -> list[Row]:
+        """Get the same page as get_all_jobs_with_favorites as plain Core rows.
 
-            jobs = query.offset(skip).limit(limit).all()
-            return jobs
+        Rows carry EXPORT_COLUMNS plus ``is_favorite`` and skip ORM object
+        hydration, for endpoints that serialize them directly.
+        """
+        statement = _listing_statement(
+            EXPORT_COLUMNS,
+            api_key_id,
+            _job_filters(job_classification, job_sub_classification, work_arrangements),
+            skip,
+            limit,
+            after,
+        )
+        with self.read_engine.connect() as connection:
+            return connection.execute(statement).all()
+
+    def iter_jobs(
+        self,
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        """Stream filtered job listing rows (EXPORT_COLUMNS), newest first.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor,
+        so memory use does not grow with the size of the catalog.
+        """
+        statement = export_jobs_statement(
+            job_classification, job_sub_classification, work_arrangements
+        )
+        with self.read_engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(statement)
+            yield from result
 
     def get_job_stats(self) -> dict[str, int]:
-        """Get job statistics (total and new jobs)."""
-        with Session(self.engine) as session:
+        """Get job statistics (total and new jobs), cached for up to a minute."""
+        minute = int(time.time() // 60)
+        return self._cached(("stats", minute), self._count_job_stats)
+
+    def _count_job_stats(self) -> dict[str, int]:
+        """Count all jobs and jobs listed in the last 24 hours."""
+        cutoff_date = datetime.now(timezone.utc) - timedelta(hours=24)
+        if self.job_stats:
+            try:
+                return self._sum_job_stats(cutoff_date)
+            except OperationalError as e:
+                # jobs.db was replaced by a copy without the bucket table
+                logger.warning(f"Materialized job stats unavailable: {e}")
+                self.job_stats = ensure_job_stats(self.engine)
+
+        with Session(self.read_engine) as session:
             total_jobs = session.query(JobListingModel).count()
 
-            cutoff_date = datetime.now(timezone.utc) - timedelta(hours=24)
             new_jobs = (
                 session.query(JobListingModel)
                 .filter(JobListingModel.listing_date >= cutoff_date)
@@ -82,49 +625,211 @@ class SQLiteRepository:
 
             return {"total_jobs": total_jobs, "new_jobs": new_jobs}
 
+    def _sum_job_stats(self, cutoff_date: datetime) -> dict[str, int]:
+        """Count jobs from the hourly buckets instead of scanning job_listings.
+
+        Whole hours after the cutoff come from the buckets; the partial hour
+        containing the cutoff is counted exactly through the listing_date index.
+        """
+        cutoff_hour = int(cutoff_date.timestamp() // 3600)
+        boundary = datetime.fromtimestamp((cutoff_hour + 1) * 3600, timezone.utc)
+        with Session(self.read_engine) as session:
+            total_jobs, recent_jobs = session.execute(
+                text(
+                    "SELECT coalesce(sum(job_count), 0), "
+                    "coalesce(sum(CASE WHEN hour > :hour THEN job_count END), 0) "
+                    f"FROM {STATS_TABLE}"
+                ),
+                {"hour": cutoff_hour},
+            ).one()
+            partial_hour_jobs = (
+                session.query(JobListingModel)
+                .filter(
+                    JobListingModel.listing_date >= cutoff_date,
+                    JobListingModel.listing_date < boundary,
+                )
+                .count()
+            )
+            return {
+                "total_jobs": total_jobs,
+                "new_jobs": recent_jobs + partial_hour_jobs,
+            }
+
+    def get_job_stats_timeline(
+        self, granularity: str, since: datetime
+    ) -> list[tuple[datetime, int]]:
+        """Get (bucket start, job count) pairs from ``since``, oldest first.
+
+        Buckets are UTC hours or days; empty buckets are omitted. ``since`` is
+        rounded down to the start of its bucket, naive values are read as UTC.
+        """
+        seconds = GRANULARITY_SECONDS[granularity]
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        start = int(since.timestamp()) // seconds * seconds
+        return self._cached(
+            ("timeline", granularity, start),
+            lambda: self._count_job_timeline(seconds, start),
+        )
+
+    def _count_job_timeline(
+        self, seconds: int, start: int
+    ) -> list[tuple[datetime, int]]:
+        """Sum hourly buckets into buckets of ``seconds`` starting at ``start``."""
+        if self.job_stats:
+            with Session(self.read_engine) as session:
+                rows = session.execute(
+                    text(
+                        "SELECT hour * 3600 / :seconds AS bucket, sum(job_count) "
+                        f"FROM {STATS_TABLE} "
+                        "WHERE hour >= :start_hour AND hour != :undated "
+                        "GROUP BY bucket ORDER BY bucket"
+                    ),
+                    {
+                        "seconds": seconds,
+                        "start_hour": start // 3600,
+                        "undated": UNDATED_HOUR,
+                    },
+                ).all()
+        else:
+            since = datetime.fromtimestamp(start, timezone.utc)
+            with Session(self.read_engine) as session:
+                dates = session.scalars(
+                    select(JobListingModel.listing_date).where(
+                        JobListingModel.listing_date >= since
+                    )
+                )
+                counts = Counter(
+                    int(d.replace(tzinfo=d.tzinfo or timezone.utc).timestamp())
+                    // seconds
+                    for d in dates
+                )
+            rows = sorted(counts.items())
+
+        return [
+            (datetime.fromtimestamp(bucket * seconds, timezone.utc), count)
+            for bucket, count in rows
+        ]
+
+    def rebuild_job_stats(self) -> int:
+        """Recount the materialized hourly buckets, return the number of buckets."""
+        if not self.job_stats:
+            raise DatabaseError("Materialized job statistics need a SQLite database")
+        with self.engine.begin() as connection:
+            buckets = rebuild_job_stats(connection)
+        self.read_cache.clear()
+        return buckets
+
+    def get_job_facets(
+        self,
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+    ) -> dict[str, dict[str, int]]:
+        """Get value -> count maps for every facet column, cached per filter set."""
+        return self._cached(
+            ("facets", job_classification, job_sub_classification, work_arrangements),
+            lambda: self._count_job_facets(
+                job_classification, job_sub_classification, work_arrangements
+            ),
+        )
+
+    def _count_job_facets(
+        self,
+        job_classification: Optional[str],
+        job_sub_classification: Optional[str],
+        work_arrangements: Optional[str],
+    ) -> dict[str, dict[str, int]]:
+        """Count facet values for the filtered jobs in one GROUP BY pass."""
+        with Session(self.read_engine) as session:
+            query = (
+                session.query(*FACET_COLUMNS, func.count())
+                .filter(
+                    *_job_filters(
+                        job_classification, job_sub_classification, work_arrangements
+                    )
+                )
+                .group_by(*FACET_COLUMNS)
+            )
+
+            facets: dict[str, dict[str, int]] = {c.key: {} for c in FACET_COLUMNS}
+            for *values, count in query.all():
+                for facet_column, value in zip(FACET_COLUMNS, values):
+                    if value:
+                        counts = facets[facet_column.key]
+                        counts[value] = counts.get(value, 0) + count
+            return facets
+
     def get_job_by_id(self, job_id: str) -> Optional[JobListingModel]:
         """Get job listing with details by ID."""
-        with Session(self.engine) as session:
+        with Session(self.read_engine) as session:
             job = (
                 session.query(JobListingModel)
                 .filter(JobListingModel.job_id == job_id)
-                .options(joinedload(JobListingModel.details))
+                .options(
+                    joinedload(JobListingModel.details).joinedload(
+                        JobDetailsModel.rendered
+                    )
+                )
                 .first()
             )
             return job
 
+    def get_jobs_by_ids(
+        self, job_ids: Sequence[str], include_details: bool = False
+    ) -> list[JobListingModel]:
+        """Get many job listings, optionally with details, skipping unknown ids.
+
+        Ids are resolved with one ``IN (...)`` query per IN_CLAUSE_CHUNK_SIZE
+        ids; results are in no particular order.
+        """
+        jobs: list[JobListingModel] = []
+        with Session(self.read_engine) as session:
+            for start in range(0, len(job_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = job_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                query = session.query(JobListingModel).filter(
+                    JobListingModel.job_id.in_(chunk)
+                )
+                if include_details:
+                    query = query.options(
+                        joinedload(JobListingModel.details).joinedload(
+                            JobDetailsModel.rendered
+                        )
+                    )
+                jobs.extend(query.all())
+        return jobs
+
     def get_all_job_classifications(self) -> list[str]:
         """Get all unique job classifications."""
-        with Session(self.engine) as session:
-            classifications = (
-                session.query(JobListingModel.job_classification)
-                .distinct()
-                .filter(JobListingModel.job_classification.isnot(None))
-                .all()
-            )
-            return [c[0] for c in classifications if c[0]]
+        return self._cached(
+            ("classifications",),
+            lambda: self._distinct_values(JobListingModel.job_classification),
+        )
 
     def get_all_work_arrangements(self) -> list[str]:
         """Get all unique work arrangements."""
-        with Session(self.engine) as session:
-            arrangements = (
-                session.query(JobListingModel.work_arrangements)
-                .distinct()
-                .filter(JobListingModel.work_arrangements.isnot(None))
-                .all()
-            )
-            return [a[0] for a in arrangements if a[0]]
+        return self._cached(
+            ("work_arrangements",),
+            lambda: self._distinct_values(JobListingModel.work_arrangements),
+        )
 
     def get_all_job_sub_classifications(self) -> list[str]:
         """Get all unique job sub classifications."""
-        with Session(self.engine) as session:
-            sub_classifications = (
-                session.query(JobListingModel.job_sub_classification)
+        return self._cached(
+            ("sub_classifications",),
+            lambda: self._distinct_values(JobListingModel.job_sub_classification),
+        )
+
+    def _distinct_values(self, job_column) -> list[str]:
+        """Get the distinct non-empty values of a job_listings column."""
+        with Session(self.read_engine) as session:
+            values = (
+                session.query(job_column)
                 .distinct()
-                .filter(JobListingModel.job_sub_classification.isnot(None))
+                .filter(job_column.isnot(None))
                 .all()
             )
-            return [s[0] for s in sub_classifications if s[0]]
+            return [v[0] for v in values if v[0]]
 
     def search_jobs(
         self,
@@ -133,23 +838,258 @@ class SQLiteRepository:
         limit: int = 100,
     ) -> list[JobListingModel]:
         """Search jobs by keyword in title, summary, company, location, and details."""
+        return [
+            result.job
+            for result in self.search_jobs_with_snippets(keyword, skip, limit)
+        ]
+
+    def search_jobs_with_snippets(
+        self,
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple] = None,
+        api_key_id: Optional[int] = None,
+    ) -> list[JobSearchResult]:
+        """Search jobs ranked by relevance, with highlighted snippets when available.
+
+        Results are ordered by ``(rank, job_id)`` when the FTS5 index is used
+        and by ``(listing_date DESC, job_id DESC)`` otherwise; ``after`` is the
+        matching sort key of the last row of the previous page. With
+        ``api_key_id`` each result is flagged if that key favorited the job.
+        """
+        with Session(self.read_engine) as session:
+            rows = self._search(
+                session, (JobListingModel,), keyword, skip, limit, after, api_key_id
+            )
+            return [
+                JobSearchResult(job, snippet, rank, bool(flag))
+                for job, snippet, rank, flag in rows
+            ]
+
+    def search_job_rows(
+        self,
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple] = None,
+        api_key_id: Optional[int] = None,
+    ) -> list[Row]:
+        """Run search_jobs_with_snippets returning plain Core rows.
+
+        Rows carry EXPORT_COLUMNS plus ``snippet``, ``rank`` and
+        ``is_favorite``.
+        """
+        with self.read_engine.connect() as connection:
+            return self._search(
+                connection, EXPORT_COLUMNS, keyword, skip, limit, after, api_key_id
+            )
+
+    def get_search_query(self, keyword: str) -> Optional[str]:
+        """Return the FTS5 expression used for a keyword, or None for LIKE search."""
+        return build_fts_query(keyword) if self.full_text_search else None
+
+    def _search(
+        self,
+        executor: Union[Session, Connection],
+        entities: tuple,
+        keyword: str,
+        skip: int,
+        limit: int,
+        after: Optional[tuple],
+        api_key_id: Optional[int],
+    ) -> list[Row]:
+        """Select (*entities, snippet, rank, is_favorite) rows for a keyword."""
+        fts_query = self.get_search_query(keyword)
+        if fts_query:
+            try:
+                return executor.execute(
+                    _fts_statement(entities, fts_query, skip, limit, after, api_key_id)
+                ).all()
+            except OperationalError as e:
+                logger.warning(f"Full-text search failed, falling back to LIKE: {e}")
+                if after is not None:
+                    raise DatabaseError("Full-text search is unavailable") from e
+                executor.rollback()
+
+        return executor.execute(
+            _like_statement(entities, keyword, skip, limit, after, api_key_id)
+        ).all()
+
+    def rebuild_search_index(self) -> int:
+        """Rebuild the full-text index from scratch, return rows indexed."""
+        if not self.full_text_search:
+            raise DatabaseError("Full-text search is not available for this database")
+        with self.engine.begin() as connection:
+            return rebuild_search_index(connection)
+
+    def save_rendered_details(self, rows: list[tuple[str, str, str]]) -> None:
+        """Upsert (job_id, content_hash, html) rows into the rendered cache."""
+        if not rows:
+            return
+        statement = _upsert_insert(self.engine, RenderedDetailsModel)
+        statement = statement.on_conflict_do_update(
+            index_elements=[RenderedDetailsModel.job_id],
+            set_={
+                "content_hash": statement.excluded.content_hash,
+                "html": statement.excluded.html,
+                "rendered_at": statement.excluded.rendered_at,
+            },
+        )
+        rendered_at = utc_now()
+        params = [
+            {
+                "job_id": job_id,
+                "content_hash": content_hash,
+                "html": html,
+                "rendered_at": rendered_at,
+            }
+            for job_id, content_hash, html in rows
+        ]
+        with self.engine.begin() as connection:
+            connection.execute(statement, params)
+
+    def get_rendered_details_hashes(self) -> dict[str, str]:
+        """Get the content hash of every rendered details row by job_id."""
         with Session(self.engine) as session:
-            search_term = f"%{keyword}%"
-            query = (
-                session.query(JobListingModel)
-                .outerjoin(JobDetailsModel)
+            rows = session.query(
+                RenderedDetailsModel.job_id, RenderedDetailsModel.content_hash
+            ).all()
+            return dict(rows)
+
+    def iter_job_details(self, batch_size: int = 500):
+        """Yield batches of (job_id, details) for jobs with non-empty details."""
+        after = None
+        while True:
+            with Session(self.engine) as session:
+                query = session.query(JobDetailsModel.job_id, JobDetailsModel.details)
+                query = query.filter(
+                    JobDetailsModel.details.isnot(None), JobDetailsModel.details != ""
+                )
+                if after is not None:
+                    query = query.filter(JobDetailsModel.job_id > after)
+                rows = query.order_by(JobDetailsModel.job_id).limit(batch_size).all()
+            if not rows:
+                return
+            yield [(job_id, details) for job_id, details in rows]
+            after = rows[-1][0]
+
+    def delete_orphaned_rendered_details(self) -> int:
+        """Delete rendered rows whose job details no longer exist."""
+        with Session(self.engine) as session:
+            deleted = (
+                session.query(RenderedDetailsModel)
                 .filter(
-                    or_(
-                        JobListingModel.title.ilike(search_term),
-                        JobListingModel.job_summary.ilike(search_term),
-                        JobListingModel.company_name.ilike(search_term),
-                        JobListingModel.location.ilike(search_term),
-                        JobDetailsModel.details.ilike(search_term),
-                    )
+                    ~session.query(JobDetailsModel)
+                    .filter(JobDetailsModel.job_id == RenderedDetailsModel.job_id)
+                    .exists()
                 )
+                .delete(synchronize_session=False)
             )
-            jobs = query.offset(skip).limit(limit).all()
-            return jobs
+            session.commit()
+            return deleted
+
+    def get_job_changes(self, since: int, limit: int) -> list[Row]:
+        """Get up to ``limit`` change-log rows after sequence number ``since``.
+
+        Rows carry ``seq``, ``job_id``, ``change`` and ``changed_at``, oldest
+        first. Whether a job was removed or expired is read from its current
+        state (get_job_snapshots), not from the log.
+        """
+        if not self.change_feed:
+            raise DatabaseError("The change feed needs a SQLite database")
+        statement = (
+            select(job_changes)
+            .where(job_changes.c.seq > since)
+            .order_by(job_changes.c.seq)
+            .limit(limit)
+        )
+        with self.read_engine.connect() as connection:
+            return connection.execute(statement).all()
+
+    def get_change_feed_bounds(self) -> tuple[int, int]:
+        """Return (oldest retained seq, latest seq) of the change log.
+
+        The oldest seq is latest + 1 when the log is empty; a consumer whose
+        position is before the oldest retained change has to resync.
+        """
+        if not self.change_feed:
+            raise DatabaseError("The change feed needs a SQLite database")
+        with self.read_engine.connect() as connection:
+            oldest = connection.execute(select(func.min(job_changes.c.seq))).scalar()
+            latest = connection.execute(
+                text("SELECT seq FROM sqlite_sequence WHERE name = :name"),
+                {"name": CHANGES_TABLE},
+            ).scalar()
+        latest = latest or 0
+        return (oldest if oldest is not None else latest + 1), latest
+
+    def prune_job_changes(self, before: datetime) -> int:
+        """Delete change-log rows recorded before a UTC time, return rows deleted."""
+        if not self.change_feed:
+            raise DatabaseError("The change feed needs a SQLite database")
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                job_changes.delete().where(job_changes.c.changed_at < before)
+            )
+            return result.rowcount
+
+    def get_job_snapshots(self, job_ids: Sequence[str]) -> list[Row]:
+        """Get the stored listing and details columns of the given jobs.
+
+        Rows carry EXPORT_COLUMNS, DETAILS_COLUMNS and ``has_details``; jobs
+        that do not exist are left out.
+        """
+        rows: list[Row] = []
+        with self.engine.connect() as connection:
+            for start in range(0, len(job_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = job_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                statement = (
+                    select(
+                        *EXPORT_COLUMNS,
+                        *DETAILS_COLUMNS,
+                        JobDetailsModel.job_id.isnot(None).label("has_details"),
+                    )
+                    .outerjoin(
+                        JobDetailsModel,
+                        JobDetailsModel.job_id == JobListingModel.job_id,
+                    )
+                    .where(JobListingModel.job_id.in_(chunk))
+                )
+                rows.extend(connection.execute(statement).all())
+        return rows
+
+    def upsert_jobs(self, listings: list[dict], details: list[dict]) -> None:
+        """Insert or update details, then listings, in one transaction.
+
+        Rows are written with one executemany of ``INSERT ... ON CONFLICT
+        (job_id) DO UPDATE`` per set of columns, and a conflict only updates
+        the columns the row supplies. On SQLite details go first so the
+        search index trigger on job_listings picks them up and each new job
+        is tokenized once; foreign keys are checked at commit instead. Other
+        databases check them per statement, so listings go first there.
+        """
+        tables = [(JobDetailsModel, details), (JobListingModel, listings)]
+        with self.engine.begin() as connection:
+            if self.engine.dialect.name == "sqlite":
+                connection.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+            else:
+                tables.reverse()
+            for model, rows in tables:
+                by_columns: dict[tuple[str, ...], list[dict]] = {}
+                for row in rows:
+                    by_columns.setdefault(tuple(row), []).append(row)
+                for columns, group in by_columns.items():
+                    statement = _upsert_insert(self.engine, model)
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[model.job_id],
+                        set_={
+                            name: statement.excluded[name]
+                            for name in columns
+                            if name != "job_id"
+                        },
+                    )
+                    connection.execute(statement, group)
 
     def create_api_key(
         self,
@@ -160,12 +1100,14 @@ class SQLiteRepository:
         company: str | None = None,
         rate_limit: int = 1000,
         expires_at: datetime | None = None,
+        lookup_id: str | None = None,
     ) -> APIKeyModel:
         """Create and store a new API key."""
         with Session(self.engine) as session:
             api_key = APIKeyModel(
                 key_hash=key_hash,
                 key_prefix=key_prefix,
+                lookup_id=lookup_id,
                 name=name,
                 email=email,
                 company=company,
@@ -183,6 +1125,36 @@ class SQLiteRepository:
             api_keys = session.query(APIKeyModel).filter(APIKeyModel.is_active).all()
             return api_keys
 
+    def get_api_key_by_lookup_id(self, lookup_id: str) -> APIKeyModel | None:
+        """Get active API key by its non-secret lookup identifier."""
+        with Session(self.engine) as session:
+            api_key = (
+                session.query(APIKeyModel)
+                .filter(APIKeyModel.lookup_id == lookup_id)
+                .filter(APIKeyModel.is_active)
+                .first()
+            )
+            return api_key
+
+    def get_legacy_api_keys(self) -> list[APIKeyModel]:
+        """Get active API keys created before lookup identifiers existed."""
+        with Session(self.engine) as session:
+            api_keys = (
+                session.query(APIKeyModel)
+                .filter(APIKeyModel.lookup_id.is_(None))
+                .filter(APIKeyModel.is_active)
+                .all()
+            )
+            return api_keys
+
+    def set_api_key_lookup_id(self, api_key_id: int, lookup_id: str) -> None:
+        """Backfill the lookup identifier of a legacy API key."""
+        with Session(self.engine) as session:
+            session.query(APIKeyModel).filter(APIKeyModel.id == api_key_id).update(
+                {APIKeyModel.lookup_id: lookup_id}
+            )
+            session.commit()
+
     def get_api_key_by_email(self, email: str) -> APIKeyModel | None:
         """Get active API key by email."""
         with Session(self.engine) as session:
@@ -194,20 +1166,22 @@ class SQLiteRepository:
             )
             return api_key
 
-    def update_api_key_last_used(self, api_key_id: int) -> None:
-        """Update last_used_at and increment request count."""
-        with Session(self.engine) as session:
-            api_key = (
-                session.query(APIKeyModel).filter(APIKeyModel.id == api_key_id).first()
+    def bulk_update_api_key_usage(self, usage: dict[int, tuple[int, datetime]]) -> None:
+        """Apply buffered request counts and last-used times in one transaction."""
+        statement = (
+            update(APIKeyModel)
+            .where(APIKeyModel.id == bindparam("key_id"))
+            .values(
+                request_count=APIKeyModel.request_count + bindparam("increment"),
+                last_used_at=bindparam("used_at"),
             )
-            if api_key:
-                session.query(APIKeyModel).filter(APIKeyModel.id == api_key_id).update(
-                    {
-                        APIKeyModel.last_used_at: datetime.now(timezone.utc),
-                        APIKeyModel.request_count: APIKeyModel.request_count + 1,
-                    }
-                )
-                session.commit()
+        )
+        params = [
+            {"key_id": api_key_id, "increment": count, "used_at": used_at}
+            for api_key_id, (count, used_at) in usage.items()
+        ]
+        with self.engine.begin() as connection:
+            connection.execute(statement, params)
 
     def get_all_api_keys(self) -> list[APIKeyModel]:
         """Get all API keys including inactive ones."""
@@ -226,9 +1200,19 @@ class SQLiteRepository:
                     {APIKeyModel.is_active: False}
                 )
                 session.commit()
+                self.api_key_revision += 1
                 return True
             return False
 
+    def count_revoked_api_keys(self) -> int:
+        """Count deactivated API keys, used to detect revocations by other processes."""
+        with Session(self.engine) as session:
+            return (
+                session.query(APIKeyModel)
+                .filter(APIKeyModel.is_active.is_(False))
+                .count()
+            )
+
     def add_favorite_job(
         self, api_key_id: int, job_id: str, notes: str | None = None
     ) -> FavoriteJobModel:
@@ -241,6 +1225,7 @@ class SQLiteRepository:
                 session.add(favorite)
                 session.commit()
                 session.refresh(favorite)
+                self.favorites_version.invalidate()
 
                 # Load the job relationship
                 favorite = (
@@ -278,19 +1263,133 @@ class SQLiteRepository:
             if favorite:
                 session.delete(favorite)
                 session.commit()
+                self.favorites_version.invalidate()
                 return True
             return False
 
+    def add_favorite_jobs(
+        self, api_key_id: int, job_ids: Sequence[str], notes: str | None = None
+    ) -> tuple[list[str], list[str]]:
+        """Favorite many jobs in one transaction, return (added, not found) job IDs.
+
+        Per chunk of ids, one ``IN (...)`` query finds the jobs that exist and
+        one finds those already favorited; the new rows are then written with
+        an executemany of ``INSERT ... ON CONFLICT DO NOTHING``, so each
+        statement binds a handful of parameters per row rather than per chunk.
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        added: list[str] = []
+        missing: list[str] = []
+        with self.engine.begin() as connection:
+            for start in range(0, len(job_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = job_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                existing = set(
+                    connection.scalars(
+                        select(JobListingModel.job_id).where(
+                            JobListingModel.job_id.in_(chunk)
+                        )
+                    )
+                )
+                missing.extend(job_id for job_id in chunk if job_id not in existing)
+                favorited = self._favorited_job_ids(connection, api_key_id, chunk)
+                new_ids = [
+                    job_id
+                    for job_id in chunk
+                    if job_id in existing and job_id not in favorited
+                ]
+                if not new_ids:
+                    continue
+                statement = _upsert_insert(
+                    self.engine, FavoriteJobModel
+                ).on_conflict_do_nothing(
+                    index_elements=[
+                        FavoriteJobModel.api_key_id,
+                        FavoriteJobModel.job_id,
+                    ]
+                )
+                connection.execute(
+                    statement,
+                    [
+                        {"api_key_id": api_key_id, "job_id": job_id, "notes": notes}
+                        for job_id in new_ids
+                    ],
+                )
+                added.extend(new_ids)
+        if added:
+            self.favorites_version.invalidate()
+        return added, missing
+
+    def remove_favorite_jobs(
+        self, api_key_id: int, job_ids: Sequence[str]
+    ) -> list[str]:
+        """Remove many jobs from user's favorites in one transaction, return the removed IDs."""
+        job_ids = list(dict.fromkeys(job_ids))
+        removed: list[str] = []
+        with self.engine.begin() as connection:
+            for start in range(0, len(job_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = job_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                favorited = self._favorited_job_ids(connection, api_key_id, chunk)
+                if not favorited:
+                    continue
+                connection.execute(
+                    delete(FavoriteJobModel).where(
+                        FavoriteJobModel.api_key_id == api_key_id,
+                        FavoriteJobModel.job_id.in_(chunk),
+                    )
+                )
+                removed.extend(job_id for job_id in chunk if job_id in favorited)
+        if removed:
+            self.favorites_version.invalidate()
+        return removed
+
+    @staticmethod
+    def _favorited_job_ids(
+        connection: Connection, api_key_id: int, job_ids: Sequence[str]
+    ) -> set[str]:
+        """Return which of up to IN_CLAUSE_CHUNK_SIZE job IDs a key has favorited."""
+        return set(
+            connection.scalars(
+                select(FavoriteJobModel.job_id).where(
+                    FavoriteJobModel.api_key_id == api_key_id,
+                    FavoriteJobModel.job_id.in_(job_ids),
+                )
+            )
+        )
+
     def get_favorite_jobs(
-        self, api_key_id: int, skip: int = 0, limit: int = 100
+        self,
+        api_key_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[FavoriteJobModel]:
-        """Get user's favorite jobs with pagination."""
-        with Session(self.engine) as session:
+        """Get user's favorite jobs, newest first, with pagination.
+
+        ``after`` is the ``(created_at, id)`` of the last favorite of the
+        previous page.
+        """
+        with Session(self.read_engine) as session:
+            query = session.query(FavoriteJobModel).filter(
+                FavoriteJobModel.api_key_id == api_key_id
+            )
+
+            if after is not None:
+                after_created_at, after_id = after
+                query = query.filter(
+                    or_(
+                        FavoriteJobModel.created_at < after_created_at,
+                        and_(
+                            FavoriteJobModel.created_at == after_created_at,
+                            FavoriteJobModel.id < after_id,
+                        ),
+                    )
+                )
+
             favorites = (
-                session.query(FavoriteJobModel)
-                .filter(FavoriteJobModel.api_key_id == api_key_id)
-                .options(joinedload(FavoriteJobModel.job))
-                .order_by(FavoriteJobModel.created_at.desc())
+                query.options(joinedload(FavoriteJobModel.job))
+                .order_by(
+                    FavoriteJobModel.created_at.desc(), FavoriteJobModel.id.desc()
+                )
                 .offset(skip)
                 .limit(limit)
                 .all()
@@ -299,7 +1398,7 @@ class SQLiteRepository:
 
     def is_job_favorited(self, api_key_id: int, job_id: str) -> bool:
         """Check if a job is favorited by the user."""
-        with Session(self.engine) as session:
+        with Session(self.read_engine) as session:
             favorite = (
                 session.query(FavoriteJobModel)
                 .filter(
@@ -310,12 +1409,21 @@ class SQLiteRepository:
             )
             return favorite is not None
 
-    def get_user_favorite_job_ids(self, api_key_id: int) -> set[str]:
-        """Get set of all job IDs favorited by the user."""
-        with Session(self.engine) as session:
-            favorites = (
-                session.query(FavoriteJobModel.job_id)
-                .filter(FavoriteJobModel.api_key_id == api_key_id)
-                .all()
+    def get_user_favorite_job_ids(
+        self, api_key_id: int, job_ids: Optional[Sequence[str]] = None
+    ) -> set[str]:
+        """Get set of job IDs favorited by the user, optionally only among job_ids."""
+        with Session(self.read_engine) as session:
+            query = session.query(FavoriteJobModel.job_id).filter(
+                FavoriteJobModel.api_key_id == api_key_id
             )
-            return {f[0] for f in favorites}
+            if job_ids is None:
+                return {f[0] for f in query.all()}
+
+            favorite_ids: set[str] = set()
+            # Stay under SQLite's bound parameter limit for long ID lists
+            for start in range(0, len(job_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = job_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                favorites = query.filter(FavoriteJobModel.job_id.in_(chunk)).all()
+                favorite_ids.update(f[0] for f in favorites)
+            return favorite_ids
@@ -0,0 +1,74 @@
+"""Shared cache of serialized /jobs/ and /jobs/search pages."""
+
+from typing import NamedTuple, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
+
+from src.core.cache import QueryCache
+from src.core.config import settings
+from src.core.instrumentation import timed
+
+_NOT_FAVORITE = b'"is_favorite":false'
+_FAVORITE = b'"is_favorite":true'
+
+# Rough per-row bookkeeping on top of the JSON bytes (tuple slots, bytes headers)
+_ROW_OVERHEAD_BYTES = 120
+
+
+class CachedPage(NamedTuple):
+    """A user-agnostic page: one JSON object per row, all with is_favorite false."""
+
+    rows: tuple[bytes, ...]
+    job_ids: tuple[str, ...]
+    next_cursor: Optional[str]
+
+    @property
+    def size(self) -> int:
+        """Approximate memory held by the page, charged against the budget."""
+        return sum(len(row) + _ROW_OVERHEAD_BYTES for row in self.rows)
+
+
+def build_page(
+    adapter: TypeAdapter, rows: list[Row], next_cursor: Optional[str]
+) -> CachedPage:
+    """Serialize rows once, with every is_favorite flag cleared."""
+    with timed("serialize"):
+        return CachedPage(
+            rows=tuple(
+                adapter.dump_json(
+                    {**row._asdict(), "is_favorite": False}, warnings=False
+                )
+                for row in rows
+            ),
+            job_ids=tuple(row.job_id for row in rows),
+            next_cursor=next_cursor,
+        )
+
+
+def page_content(page: CachedPage, favorite_ids: set[str]) -> bytes:
+    """Assemble the JSON array, flagging the caller's favorites.
+
+    Quotes inside string values are escaped, so the only unescaped
+    ``"is_favorite":false`` in a row is the field itself.
+    """
+    with timed("serialize"):
+        return (
+            b"["
+            + b",".join(
+                (
+                    row.replace(_NOT_FAVORITE, _FAVORITE, 1)
+                    if job_id in favorite_ids
+                    else row
+                )
+                for row, job_id in zip(page.rows, page.job_ids)
+            )
+            + b"]"
+        )
+
+
+response_cache = QueryCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    max_bytes=settings.response_cache_max_bytes,
+)
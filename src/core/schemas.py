@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypedDict
 
 from pydantic import BaseModel, ConfigDict
 
@@ -54,6 +54,56 @@ class JobListingResponse(BaseModel):
     is_favorite: bool = False
 
 
+class JobChange(BaseModel):
+    """One entry of the job change feed; job is None for tombstones."""
+
+    seq: int
+    job_id: str
+    change: str
+    changed_at: datetime
+    job: Optional[JobListingResponse] = None
+
+
+class JobChangesResponse(BaseModel):
+    """A page of the job change feed."""
+
+    changes: list[JobChange]
+    next_since: int
+    latest_seq: int
+    has_more: bool
+
+
+class JobSearchResultResponse(JobListingResponse):
+    """Job search result with a highlighted snippet of the best matching text."""
+
+    snippet: Optional[str] = None
+
+
+class JobListingRow(TypedDict):
+    """JobListingResponse fields as a plain row, serialized without validation."""
+
+    job_id: str
+    title: str
+    job_details_url: str
+    job_summary: str
+    company_name: str
+    location: str
+    country_code: str
+    listing_date: datetime
+    salary_label: Optional[str]
+    work_type: Optional[str]
+    job_classification: Optional[str]
+    job_sub_classification: Optional[str]
+    work_arrangements: Optional[str]
+    is_favorite: bool
+
+
+class JobSearchResultRow(JobListingRow):
+    """JobSearchResultResponse fields as a plain row."""
+
+    snippet: Optional[str]
+
+
 class JobWithDetailsResponse(BaseModel):
     """Job listing with full details response schema."""
 
@@ -104,8 +154,97 @@ class FavoriteStatusResponse(BaseModel):
     is_favorited: bool
 
 
+class FavoriteBatchCreate(BaseModel):
+    """Schema for favoriting many jobs at once."""
+
+    job_ids: list[str]
+    notes: Optional[str] = None
+
+
+class FavoriteBatchDelete(BaseModel):
+    """Schema for removing many jobs from favorites at once."""
+
+    job_ids: list[str]
+
+
+class FavoriteBatchAddResponse(BaseModel):
+    """Outcome of a bulk favorite, per job ID."""
+
+    added: list[str]
+    already_favorited: list[str]
+    not_found: list[str]
+
+
+class FavoriteBatchRemoveResponse(BaseModel):
+    """Outcome of a bulk favorite removal, per job ID."""
+
+    removed: list[str]
+    not_favorited: list[str]
+
+
+class JobBatchRequest(BaseModel):
+    """Job ids to resolve in one call."""
+
+    job_ids: list[str]
+    include_details: bool = False
+
+
+class JobBatchResponse(BaseModel):
+    """Jobs found for a batch request, in request order, plus unknown ids."""
+
+    jobs: list[JobWithDetailsResponse]
+    missing: list[str]
+
+
+class JobFacetsResponse(BaseModel):
+    """Value -> job count maps for each filterable job field."""
+
+    job_classification: dict[str, int]
+    job_sub_classification: dict[str, int]
+    work_arrangements: dict[str, int]
+
+
 class JobStatsResponse(BaseModel):
     """Job statistics response schema."""
 
     total_jobs: int
     new_jobs: int
+
+
+class JobStatsBucket(BaseModel):
+    """Number of jobs listed in one timeline bucket."""
+
+    start: datetime
+    job_count: int
+
+
+class JobStatsTimelineResponse(BaseModel):
+    """Job posting volume per hour or day."""
+
+    granularity: str
+    since: datetime
+    buckets: list[JobStatsBucket]
+
+
+class SlowQueryEntry(BaseModel):
+    """One statement fingerprint recorded by the slow query log."""
+
+    fingerprint: str
+    statement: str
+    parameters: list
+    count: int
+    total_ms: float
+    max_ms: float
+    last_ms: float
+    first_seen: datetime
+    last_seen: datetime
+    plan: list[str]
+    full_scan: bool
+
+
+class SlowQueriesResponse(BaseModel):
+    """Slow query log contents, most recently seen first."""
+
+    enabled: bool
+    threshold_ms: float
+    entries: list[SlowQueryEntry]
@@ -0,0 +1,195 @@
+"""SQLite FTS5 full-text index over job listings and details."""
+
+import logging
+import re
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = "job_search"
+
+# Relative weights for bm25(): job_id, title, summary, company, location, details
+BM25_WEIGHTS = (0.0, 10.0, 2.0, 5.0, 3.0, 1.0)
+
+_CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    job_id UNINDEXED,
+    title,
+    job_summary,
+    company_name,
+    location,
+    details,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+# Explicit INTEGER PRIMARY KEY ids survive VACUUM and REPLACE, unlike the
+# implicit job_listings.rowid, so the index rowid is keyed on job_id through them
+KEYS_TABLE = f"{SEARCH_TABLE}_keys"
+
+_CREATE_KEYS_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {KEYS_TABLE} (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE
+)
+"""
+
+# Not INSERT OR IGNORE: an outer INSERT OR REPLACE would override the conflict
+# clause and give the job a new key, leaving its old index row behind
+_INDEX_LISTING = f"""
+INSERT INTO {KEYS_TABLE} (job_id)
+SELECT new.job_id
+WHERE NOT EXISTS (SELECT 1 FROM {KEYS_TABLE} WHERE job_id = new.job_id);
+DELETE FROM {SEARCH_TABLE}
+WHERE rowid = (SELECT id FROM {KEYS_TABLE} WHERE job_id = new.job_id);
+INSERT INTO {SEARCH_TABLE}
+    (rowid, job_id, title, job_summary, company_name, location, details)
+VALUES (
+    (SELECT id FROM {KEYS_TABLE} WHERE job_id = new.job_id),
+    new.job_id, new.title, new.job_summary, new.company_name, new.location,
+    (SELECT details FROM job_details WHERE job_id = new.job_id)
+);
+"""
+
+_UNINDEX_OLD_LISTING = f"""
+DELETE FROM {SEARCH_TABLE}
+WHERE rowid = (SELECT id FROM {KEYS_TABLE} WHERE job_id = old.job_id);
+"""
+
+_SET_DETAILS = f"""
+UPDATE {SEARCH_TABLE} SET details = {{value}}
+WHERE rowid = (SELECT id FROM {KEYS_TABLE} WHERE job_id = {{row}}.job_id);
+"""
+
+_TRIGGERS = {
+    "listing_ai": f"AFTER INSERT ON job_listings BEGIN {_INDEX_LISTING} END",
+    "listing_au": f"""
+    AFTER UPDATE ON job_listings BEGIN
+        {_UNINDEX_OLD_LISTING}
+        DELETE FROM {KEYS_TABLE}
+        WHERE job_id = old.job_id AND old.job_id IS NOT new.job_id;
+        {_INDEX_LISTING}
+    END
+    """,
+    "listing_ad": f"""
+    AFTER DELETE ON job_listings BEGIN
+        {_UNINDEX_OLD_LISTING}
+        DELETE FROM {KEYS_TABLE} WHERE job_id = old.job_id;
+    END
+    """,
+    "details_ai": f"""
+    AFTER INSERT ON job_details BEGIN
+        {_SET_DETAILS.format(value="new.details", row="new")}
+    END
+    """,
+    "details_au": f"""
+    AFTER UPDATE OF details ON job_details BEGIN
+        {_SET_DETAILS.format(value="new.details", row="new")}
+    END
+    """,
+    "details_ad": f"""
+    AFTER DELETE ON job_details BEGIN
+        {_SET_DETAILS.format(value="NULL", row="old")}
+    END
+    """,
+}
+
+_WORD_PATTERN = re.compile(r"\w+")
+_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+# Symbols the tokenizer discards but that change meaning ("c++", "c#")
+_SIGNIFICANT_SYMBOLS = re.compile(r"[+#@&]")
+
+
+def fts5_available(engine: Engine) -> bool:
+    """Check whether the SQLite library behind the engine was built with FTS5."""
+    if engine.dialect.name != "sqlite":
+        return False
+    with engine.connect() as connection:
+        options = connection.exec_driver_sql("PRAGMA compile_options").fetchall()
+    return any(option[0] == "ENABLE_FTS5" for option in options)
+
+
+def ensure_search_index(engine: Engine) -> bool:
+    """Create the index and its sync triggers if missing, return True if usable."""
+    if not fts5_available(engine):
+        return False
+
+    try:
+        with engine.begin() as connection:
+            keyed = connection.execute(
+                text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+                ),
+                {"name": KEYS_TABLE},
+            ).first()
+            if not keyed:
+                # Drop an index keyed on job_listings.rowid, triggers included
+                for name in _TRIGGERS:
+                    connection.exec_driver_sql(
+                        f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{name}"
+                    )
+                connection.exec_driver_sql(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+            connection.exec_driver_sql(_CREATE_TABLE)
+            connection.exec_driver_sql(_CREATE_KEYS_TABLE)
+            for name, body in _TRIGGERS.items():
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_{name} {body}"
+                )
+            if not keyed:
+                rebuild_search_index(connection)
+    except DBAPIError as e:
+        logger.error(f"Failed to create full-text search index: {e}")
+        return False
+    return True
+
+
+def rebuild_search_index(connection: Connection) -> int:
+    """Repopulate the index from job_listings/job_details, return rows indexed."""
+    connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE}")
+    connection.exec_driver_sql(
+        f"DELETE FROM {KEYS_TABLE} "
+        "WHERE job_id NOT IN (SELECT job_id FROM job_listings)"
+    )
+    connection.exec_driver_sql(
+        f"INSERT OR IGNORE INTO {KEYS_TABLE} (job_id) SELECT job_id FROM job_listings"
+    )
+    result = connection.exec_driver_sql(
+        f"""
+        INSERT INTO {SEARCH_TABLE}
+            (rowid, job_id, title, job_summary, company_name, location, details)
+        SELECT k.id, l.job_id, l.title, l.job_summary, l.company_name,
+               l.location, d.details
+        FROM job_listings AS l
+        JOIN {KEYS_TABLE} AS k ON k.job_id = l.job_id
+        LEFT JOIN job_details AS d ON d.job_id = l.job_id
+        """
+    )
+    connection.exec_driver_sql(
+        f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')"
+    )
+    return result.rowcount
+
+
+def build_fts_query(keyword: str) -> str | None:
+    """Translate a user keyword into a safe FTS5 MATCH expression.
+
+    ``"quoted text"`` becomes an exact phrase; every other word is matched as
+    a token prefix (so ``develop`` finds ``developer``, mirroring the old
+    substring search). Words must all match. Returns None if the keyword
+    contains no searchable tokens or symbols the tokenizer would drop, in
+    which case callers should fall back to substring search.
+    """
+    if _SIGNIFICANT_SYMBOLS.search(keyword):
+        return None
+
+    terms = []
+    for phrase, word in _TERM_PATTERN.findall(keyword):
+        tokens = _WORD_PATTERN.findall(phrase or word)
+        if not tokens:
+            continue
+        quoted = '"' + " ".join(tokens) + '"'
+        terms.append(quoted if phrase else quoted + "*")
+    return " ".join(terms) or None
@@ -4,6 +4,9 @@ import secrets
 
 import bcrypt
 
+# Length of the non-secret key identifier: "sk_live_" plus 16 token characters.
+LOOKUP_ID_LENGTH = 24
+
 
 def generate_api_key(prefix: str = "sk_live") -> str:
     """Generate a secure API key with the given prefix."""
@@ -27,3 +30,8 @@ def verify_api_key(api_key: str, key_hash: str) -> bool:
 def get_key_prefix(api_key: str) -> str:
     """Extract first 12 characters of API key for display."""
     return api_key[:12] + "..."
+
+
+def get_key_lookup_id(api_key: str) -> str:
+    """Extract the non-secret identifier used to look up an API key row."""
+    return api_key[:LOOKUP_ID_LENGTH]
@@ -0,0 +1,239 @@
+"""Slow query log: statement fingerprints, redacted parameters and SQLite plans."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import DBAPIError
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_QUERY_STARTS = "slow_query_starts"
+
+# A table scan without an index (virtual tables such as FTS5 do their own lookups)
+FULL_SCAN = re.compile(r"\bSCAN (?!CONSTANT ROW)\w+\b(?! USING| VIRTUAL TABLE)")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Expanded IN lists differ in length per call; collapse them to one shape
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Statements on these tables carry key hashes and emails; hide all their strings
+_SENSITIVE_TABLES = ("api_keys",)
+_MAX_PARAMETERS = 20
+_MAX_STRING_LENGTH = 100
+
+
+def normalize_statement(statement: str) -> str:
+    """Strip literals and IN-list lengths so equivalent statements compare equal."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("?, ...", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint(statement: str) -> str:
+    """Return a short, stable identifier for a statement's normalized form."""
+    return hashlib.sha1(normalize_statement(statement).encode()).hexdigest()[:16]
+
+
+def redact_parameters(statement: str, parameters: Any) -> list:
+    """Make bound parameters safe to display.
+
+    Strings are truncated, and hidden entirely for statements on tables
+    holding credentials; only the first parameters of long lists are kept.
+    """
+    if isinstance(parameters, dict):
+        parameters = list(parameters.values())
+    elif isinstance(parameters, (list, tuple)) and parameters:
+        # executemany: show the first row
+        if isinstance(parameters[0], (list, tuple, dict)):
+            return redact_parameters(statement, parameters[0])
+    if not isinstance(parameters, (list, tuple)):
+        return []
+
+    sensitive = any(table in statement for table in _SENSITIVE_TABLES)
+    redacted = []
+    for value in list(parameters)[:_MAX_PARAMETERS]:
+        if value is None or isinstance(value, (bool, int, float)):
+            redacted.append(value)
+        elif sensitive:
+            redacted.append("<redacted>")
+        else:
+            text = str(value)
+            if len(text) > _MAX_STRING_LENGTH:
+                text = text[:_MAX_STRING_LENGTH] + "..."
+            redacted.append(text)
+    if len(parameters) > _MAX_PARAMETERS:
+        redacted.append(f"... {len(parameters) - _MAX_PARAMETERS} more")
+    return redacted
+
+
+def _explain(engine: Engine, statement: str, parameters: Any) -> list[str]:
+    """Run EXPLAIN QUERY PLAN on a pooled connection, one indented line per step."""
+    if isinstance(parameters, list) and parameters:
+        parameters = parameters[0]  # executemany
+    # A raw DBAPI cursor, so the statement is not timed by our own listeners
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    finally:
+        connection.close()
+
+    depths: dict[int, int] = {}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depths[node_id] = depths.get(parent, -1) + 1
+        lines.append("  " * depths[node_id] + detail)
+    return lines
+
+
+class SlowQueryLog:
+    """Bounded, fingerprint-deduplicated log of statements slower than a threshold.
+
+    Each fingerprint keeps one entry with its occurrence count and timings,
+    the statement and redacted parameters of its slowest run and, on SQLite,
+    the plan of its first run. Plans are captured when the log is read, not
+    while the slow statement's connection is still in use. The least recently
+    seen fingerprint is dropped once ``max_entries`` are held.
+    """
+
+    def __init__(
+        self, threshold_ms: float, max_entries: int, explain: bool = True
+    ) -> None:
+        """Create an empty log."""
+        self.threshold_ms = threshold_ms
+        self.max_entries = max_entries
+        self.explain = explain
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        # Fingerprint -> (engine, statement, parameters) still waiting for a plan
+        self._pending_plans: dict[str, tuple[Engine, str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """Time every statement run by an engine."""
+        can_explain = engine.dialect.name == "sqlite"
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault(_QUERY_STARTS, []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            duration_ms = (time.perf_counter() - conn.info[_QUERY_STARTS].pop()) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.record(
+                    statement,
+                    parameters,
+                    duration_ms,
+                    engine if can_explain and self.explain else None,
+                )
+
+        @event.listens_for(engine, "handle_error")
+        def _error(exception_context):
+            connection = exception_context.connection
+            if connection is not None and connection.info.get(_QUERY_STARTS):
+                connection.info[_QUERY_STARTS].pop()
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        duration_ms: float,
+        engine: Optional[Engine] = None,
+    ) -> None:
+        """Add one slow execution; a new fingerprint's plan is taken from engine."""
+        key = fingerprint(statement)
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get(key)
+            is_new = entry is None
+            if is_new:
+                entry = {
+                    "fingerprint": key,
+                    "statement": statement,
+                    "parameters": [],
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "last_ms": 0.0,
+                    "first_seen": now,
+                    "last_seen": now,
+                    "plan": [],
+                    "full_scan": False,
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["last_ms"] = duration_ms
+            entry["last_seen"] = now
+            if duration_ms >= entry["max_ms"]:
+                entry["max_ms"] = duration_ms
+                entry["statement"] = statement
+                entry["parameters"] = redact_parameters(statement, parameters)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if is_new and engine is not None:
+                self._pending_plans[key] = (engine, statement, parameters)
+            while len(self._entries) > self.max_entries:
+                dropped, _ = self._entries.popitem(last=False)
+                self._pending_plans.pop(dropped, None)
+
+        if is_new:
+            logger.warning(
+                f"Slow query {key} ({duration_ms:.1f} ms): "
+                f"{normalize_statement(statement)[:300]}"
+            )
+
+    def _capture_plans(self) -> None:
+        """EXPLAIN the statements of fingerprints seen since the last read."""
+        with self._lock:
+            pending = list(self._pending_plans.items())
+            self._pending_plans.clear()
+
+        for key, (engine, statement, parameters) in pending:
+            try:
+                plan = _explain(engine, statement, parameters)
+            except (DBAPIError, sqlite3.Error) as e:
+                plan = [f"EXPLAIN QUERY PLAN failed: {e}"]
+            full_scan = any(FULL_SCAN.search(line) for line in plan)
+            if full_scan:
+                logger.warning(f"Slow query {key} scans a full table")
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry["plan"] = plan
+                    entry["full_scan"] = full_scan
+
+    def entries(self) -> list[dict]:
+        """Return copies of the entries, most recently seen first."""
+        self._capture_plans()
+        with self._lock:
+            return [dict(entry) for entry in reversed(self._entries.values())]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._pending_plans.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_threshold_ms,
+    max_entries=settings.slow_query_log_size,
+    explain=settings.slow_query_explain,
+)
@@ -0,0 +1,76 @@
+"""Per-connection SQLite tuning and read-only connection URLs."""
+
+import logging
+from typing import Union
+
+from sqlalchemy import Engine, event, make_url
+
+logger = logging.getLogger(__name__)
+
+PragmaValue = Union[str, int]
+
+# Applied in this order; journal_mode first so it is set before any reads
+PRAGMA_ORDER = (
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "busy_timeout",
+)
+
+# PRAGMAs that need write access and are skipped on read-only connections
+_WRITE_PRAGMAS = {"journal_mode"}
+
+
+def is_sqlite_file_url(db_url: str) -> bool:
+    """Return True for SQLite URLs that point at a file on disk."""
+    url = make_url(db_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def read_only_url(db_url: str) -> str:
+    """Return a URL opening the same SQLite file with mode=ro."""
+    url = make_url(db_url)
+    query = {**url.query, "mode": "ro", "uri": "true"}
+    url = url.set(database=f"file:{url.database}", query=query)
+    return url.render_as_string(hide_password=False)
+
+
+def apply_sqlite_profile(
+    engine: Engine, pragmas: dict[str, PragmaValue], read_only: bool = False
+) -> None:
+    """Run the given PRAGMAs on every new connection made by an engine.
+
+    Read-only engines also get ``query_only`` and skip PRAGMAs that would
+    write to the database file.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    statements = [
+        f"PRAGMA {name}={pragmas[name]}"
+        for name in PRAGMA_ORDER
+        if name in pragmas and not (read_only and name in _WRITE_PRAGMAS)
+    ]
+    if read_only:
+        statements.append("PRAGMA query_only=ON")
+
+    dbapi_error = engine.dialect.loaded_dbapi.Error
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                # One rejected PRAGMA must not skip the ones after it
+                try:
+                    cursor.execute(statement)
+                except dbapi_error as e:
+                    logger.warning(f"Failed to apply SQLite profile ({statement}): {e}")
+        finally:
+            cursor.close()
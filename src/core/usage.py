@@ -0,0 +1,114 @@
+"""Write-behind buffering of API key usage counters."""
+
+import logging
+import threading
+from datetime import datetime, timezone
+
+from src.core.config import settings
+from src.core.repositories import SQLiteRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UsageBuffer:
+    """Accumulate API key usage in memory and flush it to the database in bulk.
+
+    Authenticated requests only touch an in-process dict; a background thread
+    writes the accumulated ``request_count`` increments and latest
+    ``last_used_at`` values in a single transaction every
+    ``flush_interval_seconds`` or as soon as ``flush_max_events`` requests
+    have been recorded, whichever comes first.
+    """
+
+    def __init__(self, flush_interval_seconds: float, flush_max_events: int) -> None:
+        """Initialize an empty buffer."""
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_max_events = flush_max_events
+        self._pending: dict[int, tuple[int, datetime]] = {}
+        self._events = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._repository: SQLiteRepository | None = None
+
+    def record(self, api_key_id: int) -> None:
+        """Record one request for the given API key."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            count, _ = self._pending.get(api_key_id, (0, now))
+            self._pending[api_key_id] = (count + 1, now)
+            self._events += 1
+            if self._events >= self.flush_max_events:
+                self._wakeup.set()
+
+    def drain(self) -> dict[int, tuple[int, datetime]]:
+        """Remove and return all pending usage as {api_key_id: (count, last_used_at)}."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._events = 0
+            return pending
+
+    def flush(self, repository: SQLiteRepository) -> int:
+        """Write pending usage in one transaction and return the number of keys updated."""
+        usage = self.drain()
+        if not usage:
+            return 0
+
+        try:
+            repository.bulk_update_api_key_usage(usage)
+        except Exception as e:
+            logger.error(f"Failed to flush API key usage for {len(usage)} keys: {e}")
+            self._restore(usage)
+            return 0
+        return len(usage)
+
+    def _restore(self, usage: dict[int, tuple[int, datetime]]) -> None:
+        """Merge usage that failed to flush back into the pending buffer."""
+        with self._lock:
+            for api_key_id, (count, last_used_at) in usage.items():
+                pending_count, pending_used_at = self._pending.get(
+                    api_key_id, (0, last_used_at)
+                )
+                self._pending[api_key_id] = (
+                    pending_count + count,
+                    max(pending_used_at, last_used_at),
+                )
+                self._events += count
+
+    def start(self, repository: SQLiteRepository) -> None:
+        """Start the background flush thread."""
+        if self._thread is not None:
+            return
+        self._repository = repository
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="usage-buffer-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and write any remaining usage."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+        if self._repository is not None:
+            self.flush(self._repository)
+            self._repository = None
+
+    def _run(self) -> None:
+        """Flush periodically, or early when woken by a full buffer."""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            if self._repository is not None:
+                self.flush(self._repository)
+
+
+usage_buffer = UsageBuffer(
+    flush_interval_seconds=settings.usage_flush_interval_seconds,
+    flush_max_events=settings.usage_flush_max_events,
+)
@@ -0,0 +1,32 @@
+"""Operator endpoints, protected by the admin token."""
+
+from fastapi import APIRouter, Depends
+
+from ..core.auth import require_admin_token
+from ..core.config import settings
+from ..core.schemas import SlowQueriesResponse, SlowQueryEntry
+from ..core.slow_queries import slow_query_log
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+    include_in_schema=False,
+)
+
+
+@router.get("/slow-queries", response_model=SlowQueriesResponse)
+def get_slow_queries() -> SlowQueriesResponse:
+    """Get the statements recorded by this worker's slow query log."""
+    return SlowQueriesResponse(
+        enabled=settings.slow_query_log,
+        threshold_ms=slow_query_log.threshold_ms,
+        entries=[SlowQueryEntry(**entry) for entry in slow_query_log.entries()],
+    )
+
+
+@router.delete("/slow-queries", response_model=SlowQueriesResponse)
+def clear_slow_queries() -> SlowQueriesResponse:
+    """Clear this worker's slow query log."""
+    slow_query_log.clear()
+    return get_slow_queries()
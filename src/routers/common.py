@@ -0,0 +1,412 @@
+"""Request validation and response building shared by the job routes."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from fastapi import Depends, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
+
+from src.core.async_repositories import RepositoryAdapter
+from src.core.auth import get_api_key, get_optional_api_key
+from src.core.conditional import check_conditional_get, validator_versions
+from src.core.config import settings
+from src.core.exceptions import ChangeFeedExpiredError, InvalidInputError
+from src.core.models import APIKeyModel, JobListingModel
+from src.core.pagination import decode_cursor, encode_cursor, validate_page
+from src.core.repositories import EXPORT_COLUMNS
+from src.core.response_cache import (
+    CachedPage,
+    build_page,
+    page_content,
+    response_cache,
+)
+from src.core.schemas import (
+    FavoriteBatchAddResponse,
+    FavoriteBatchRemoveResponse,
+    JobBatchResponse,
+    JobChange,
+    JobChangesResponse,
+    JobListingResponse,
+    JobListingRow,
+    JobSearchResultRow,
+    JobStatsBucket,
+    JobStatsTimelineResponse,
+    JobWithDetailsResponse,
+)
+
+# Window returned by /jobs/stats/timeline when no ``since`` is given
+TIMELINE_DEFAULT_WINDOWS = {"hour": timedelta(hours=48), "day": timedelta(days=30)}
+
+# Rows encoded per chunk written to the export stream
+EXPORT_CHUNK_ROWS = 500
+
+# Most job ids accepted by one batch request
+MAX_BATCH_JOB_IDS = 1000
+
+# Serializers for the list endpoints' fast path (no model validation)
+_JOB_LISTING_ROW = TypeAdapter(JobListingRow)
+_JOB_SEARCH_ROW = TypeAdapter(JobSearchResultRow)
+
+
+# Conditional API key dependency
+def optional_api_key() -> list:
+    """Return API key dependency list if authentication is required."""
+    if settings.require_api_key:
+        return [Depends(get_api_key)]
+    return []
+
+
+def conditional_get(
+    repository_dependency: Callable,
+    per_user: bool = False,
+    time_bucket_seconds: int = 0,
+) -> list:
+    """Return the ETag dependency for a job route.
+
+    per_user marks responses carrying is_favorite; time_bucket_seconds makes
+    results that age without writes (e.g. stats) change ETag on that period.
+    """
+
+    async def check(
+        request: Request,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+        api_key: APIKeyModel | None = Depends(get_optional_api_key),
+    ) -> None:
+        if not settings.http_caching:
+            return
+        favorites_version = (
+            await repository.get_favorites_version() if per_user and api_key else None
+        )
+        _check_versions(
+            request,
+            await repository.get_dataset_version(),
+            favorites_version,
+            api_key,
+            per_user,
+            time_bucket_seconds,
+        )
+
+    return [Depends(check)]
+
+
+def _check_versions(
+    request: Request,
+    dataset_version: Optional[int],
+    favorites_version: Optional[int],
+    api_key: APIKeyModel | None,
+    per_user: bool,
+    time_bucket_seconds: int,
+) -> None:
+    """Run the conditional GET check once the data versions are known."""
+    validators = validator_versions(
+        dataset_version,
+        favorites_version,
+        api_key.id if api_key else None,
+        per_user,
+        time_bucket_seconds,
+    )
+    if validators is None:
+        return
+    check_conditional_get(
+        request,
+        validators,
+        private=settings.require_api_key or api_key is not None,
+        per_user=per_user,
+    )
+
+
+def validate_keyword(keyword: str) -> None:
+    """Check a search keyword is long enough to be useful."""
+    if not keyword or len(keyword.strip()) < 2:
+        raise InvalidInputError("Search keyword must be at least 2 characters long")
+
+
+def validate_job_ids(job_ids: list[str]) -> list[str]:
+    """Check a batch of job ids and drop repeats, keeping request order."""
+    if not job_ids or len(job_ids) > MAX_BATCH_JOB_IDS:
+        raise InvalidInputError(
+            f"job_ids must contain between 1 and {MAX_BATCH_JOB_IDS} ids"
+        )
+    return list(dict.fromkeys(job_ids))
+
+
+def query_job_ids(job_ids: list[str]) -> list[str]:
+    """Split comma-separated ``job_ids`` query values and validate the result."""
+    return validate_job_ids(
+        [job_id for value in job_ids for job_id in value.split(",") if job_id]
+    )
+
+
+def favorite_batch_add_response(
+    job_ids: list[str], added: list[str], missing: list[str]
+) -> FavoriteBatchAddResponse:
+    """Sort requested IDs into added, already favorited and unknown jobs."""
+    added_ids = set(added)
+    missing_ids = set(missing)
+    return FavoriteBatchAddResponse(
+        added=[job_id for job_id in job_ids if job_id in added_ids],
+        already_favorited=[
+            job_id
+            for job_id in job_ids
+            if job_id not in added_ids and job_id not in missing_ids
+        ],
+        not_found=missing,
+    )
+
+
+def favorite_batch_remove_response(
+    job_ids: list[str], removed: list[str]
+) -> FavoriteBatchRemoveResponse:
+    """Sort requested IDs into removed and not favorited jobs."""
+    removed_ids = set(removed)
+    return FavoriteBatchRemoveResponse(
+        removed=[job_id for job_id in job_ids if job_id in removed_ids],
+        not_favorited=[job_id for job_id in job_ids if job_id not in removed_ids],
+    )
+
+
+def timeline_since(granularity: str, since: Optional[datetime]) -> datetime:
+    """Validate a timeline granularity and default ``since`` to its window."""
+    if granularity not in TIMELINE_DEFAULT_WINDOWS:
+        raise InvalidInputError("granularity must be one of: hour, day")
+    if since is None:
+        return datetime.now(timezone.utc) - TIMELINE_DEFAULT_WINDOWS[granularity]
+    return since
+
+
+def timeline_response(
+    granularity: str, since: datetime, buckets: list[tuple[datetime, int]]
+) -> JobStatsTimelineResponse:
+    """Build the timeline response from (bucket start, job count) pairs."""
+    return JobStatsTimelineResponse(
+        granularity=granularity,
+        since=since,
+        buckets=[
+            JobStatsBucket(start=start, job_count=count) for start, count in buckets
+        ],
+    )
+
+
+def check_feed_position(since: int, limit: int, bounds: tuple[int, int]) -> None:
+    """Validate a change feed request against the retained log."""
+    validate_page(0, limit, None)
+    if since < 0:
+        raise InvalidInputError("since must be greater than or equal to 0")
+    oldest, latest = bounds
+    if since + 1 < oldest and since < latest:
+        raise ChangeFeedExpiredError(
+            f"Changes after {since} are no longer retained; "
+            "resync from /jobs/export and continue from latest_seq"
+        )
+
+
+def job_changes_response(
+    changes: list[Row], snapshots: list[Row], since: int, limit: int, latest: int
+) -> JobChangesResponse:
+    """Collapse a page of change-log rows to the latest entry per job.
+
+    Jobs that no longer exist become ``delete`` tombstones and expired jobs
+    ``expire`` tombstones; everything else carries the job's current listing.
+    """
+    current = {row.job_id: row for row in snapshots}
+    last_change = {}
+    for change in changes:
+        last_change.pop(change.job_id, None)
+        last_change[change.job_id] = change
+
+    entries = []
+    for change in last_change.values():
+        row = current.get(change.job_id)
+        if row is None:
+            kind, job = "delete", None
+        elif row.has_details and row.is_expired:
+            kind, job = "expire", None
+        else:
+            kind, job = change.change, JobListingResponse.model_validate(row._asdict())
+        entries.append(
+            JobChange(
+                seq=change.seq,
+                job_id=change.job_id,
+                change=kind,
+                changed_at=change.changed_at,
+                job=job,
+            )
+        )
+
+    next_since = changes[-1].seq if changes else since
+    return JobChangesResponse(
+        changes=entries,
+        next_since=next_since,
+        latest_seq=max(latest, next_since),
+        has_more=len(changes) == limit and next_since < latest,
+    )
+
+
+def decode_jobs_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """Decode a /jobs/ cursor into its (listing_date, job_id) sort key."""
+    if not cursor:
+        return None
+    return decode_cursor(cursor, "jobs", datetime.fromisoformat, str)
+
+
+def next_jobs_cursor(rows: list[Row], limit: int) -> Optional[str]:
+    """Return the cursor for the page after a full page of job rows."""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor("jobs", last.listing_date, last.job_id)
+
+
+def decode_search_cursor(cursor: Optional[str], ranked: bool) -> Optional[tuple]:
+    """Decode a search cursor; ranked and substring searches sort on different keys."""
+    if not cursor:
+        return None
+    if ranked:
+        return decode_cursor(cursor, "search-rank", float, str)
+    return decode_cursor(cursor, "search-date", datetime.fromisoformat, str)
+
+
+def next_search_cursor(rows: list[Row], limit: int, ranked: bool) -> Optional[str]:
+    """Return the cursor for the page after a full page of search rows."""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    if ranked:
+        return encode_cursor("search-rank", last.rank, last.job_id)
+    return encode_cursor("search-date", last.listing_date, last.job_id)
+
+
+def job_rows_page(rows: list[Row], limit: int) -> CachedPage:
+    """Serialize listing rows from get_job_rows into a cacheable page."""
+    return build_page(_JOB_LISTING_ROW, rows, next_jobs_cursor(rows, limit))
+
+
+def search_rows_page(rows: list[Row], limit: int, ranked: bool) -> CachedPage:
+    """Serialize search rows from search_job_rows into a cacheable page."""
+    return build_page(_JOB_SEARCH_ROW, rows, next_search_cursor(rows, limit, ranked))
+
+
+def cache_page(key: tuple, page: CachedPage) -> None:
+    """Store a page in the shared response cache."""
+    if settings.response_cache_max_bytes > 0:
+        response_cache.put(key, page, page.size)
+
+
+def page_response(page: CachedPage, favorite_ids: set[str], hit: bool) -> Response:
+    """Build the JSON response for a page with the caller's favorites flagged."""
+    response = Response(
+        content=page_content(page, favorite_ids), media_type="application/json"
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    response.headers["X-Cache"] = "HIT" if hit else "MISS"
+    return response
+
+
+def job_details_response(
+    job: JobListingModel, details_html: Optional[str], include_details: bool = True
+) -> JobWithDetailsResponse:
+    """Combine a listing, its details and the rendered details HTML.
+
+    With ``include_details`` off, details are not touched (they need not be
+    loaded) and only the listing fields are returned.
+    """
+    job_data = {
+        "job_id": job.job_id,
+        "title": job.title,
+        "job_details_url": job.job_details_url,
+        "job_summary": job.job_summary,
+        "company_name": job.company_name,
+        "location": job.location,
+        "country_code": job.country_code,
+        "listing_date": job.listing_date,
+        "salary_label": job.salary_label,
+        "work_type": job.work_type,
+        "job_classification": job.job_classification,
+        "job_sub_classification": job.job_sub_classification,
+        "work_arrangements": job.work_arrangements,
+    }
+
+    # Add details if available
+    if include_details and job.details:
+        job_data.update(
+            {
+                "status": job.details.status,
+                "is_expired": job.details.is_expired,
+                "details": details_html,
+                "is_verified": job.details.is_verified,
+                "expires_at": job.details.expires_at,
+            }
+        )
+
+    return JobWithDetailsResponse(**job_data)
+
+
+def job_batch_response(
+    job_ids: list[str],
+    jobs: list[JobListingModel],
+    include_details: bool,
+    details_html: dict[str, Optional[str]],
+) -> JobBatchResponse:
+    """Order found jobs as requested and list the ids that were not found."""
+    found = {job.job_id: job for job in jobs}
+    return JobBatchResponse(
+        jobs=[
+            job_details_response(
+                found[job_id], details_html.get(job_id), include_details
+            )
+            for job_id in job_ids
+            if job_id in found
+        ],
+        missing=[job_id for job_id in job_ids if job_id not in found],
+    )
+
+
+def _ndjson_chunk(rows: list[Row], first: bool) -> str:
+    """Encode job rows as newline-delimited JSON."""
+    return "".join(
+        json.dumps(row._asdict(), default=datetime.isoformat) + "\n" for row in rows
+    )
+
+
+def _csv_chunk(rows: list[Row], first: bool) -> str:
+    """Encode job rows as CSV, starting with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if first:
+        writer.writerow(column.key for column in EXPORT_COLUMNS)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+EXPORT_FORMATS: dict[str, tuple[str, Callable[[list[Row], bool], str]]] = {
+    "ndjson": ("application/x-ndjson", _ndjson_chunk),
+    "csv": ("text/csv; charset=utf-8", _csv_chunk),
+}
+
+
+def export_media_type(export_format: str) -> str:
+    """Return the content type of an export format, rejecting unknown formats."""
+    if export_format not in EXPORT_FORMATS:
+        raise InvalidInputError("format must be one of: ndjson, csv")
+    return EXPORT_FORMATS[export_format][0]
+
+
+async def export_chunks(
+    rows: AsyncIterable[Row], export_format: str
+) -> AsyncIterator[str]:
+    """Encode rows from an async stream in chunks of EXPORT_CHUNK_ROWS."""
+    encode = EXPORT_FORMATS[export_format][1]
+    batch, first = [], True
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield encode(batch, first)
+            batch, first = [], False
+    if batch or first:
+        yield encode(batch, first)
@@ -1,92 +1,176 @@
 """Favorite jobs endpoints."""
 
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.responses import JSONResponse
 
+from ..core.async_repositories import RepositoryAdapter
 from ..core.auth import get_api_key
-from ..core.database import get_repository
-from ..core.exceptions import InvalidInputError, JobNotFoundError
+from ..core.database import get_async_repository, get_threadpool_repository
+from ..core.exceptions import JobNotFoundError
 from ..core.models import APIKeyModel
-from ..core.repositories import SQLiteRepository
+from ..core.pagination import decode_cursor, encode_cursor, validate_page
 from ..core.schemas import (
+    FavoriteBatchAddResponse,
+    FavoriteBatchCreate,
+    FavoriteBatchDelete,
+    FavoriteBatchRemoveResponse,
     FavoriteJobCreate,
     FavoriteJobResponse,
     FavoriteStatusResponse,
 )
-
-router = APIRouter(prefix="/favorites", tags=["favorites"])
-
-
-@router.post(
-    "/{job_id}", response_model=FavoriteJobResponse, status_code=status.HTTP_201_CREATED
+from .common import (
+    favorite_batch_add_response,
+    favorite_batch_remove_response,
+    query_job_ids,
+    validate_job_ids,
 )
-def add_favorite_job(
-    job_id: str,
-    favorite_data: FavoriteJobCreate,
-    api_key: APIKeyModel = Depends(get_api_key),
-    repository: SQLiteRepository = Depends(get_repository),
-) -> FavoriteJobResponse:
-    """Add a job to user's favorites."""
-    # Check if job exists
-    job = repository.get_job_by_id(job_id)
-    if not job:
-        raise JobNotFoundError(f"Job with ID '{job_id}' not found")
-
-    # Add to favorites
-    favorite = repository.add_favorite_job(
-        api_key_id=api_key.id,
-        job_id=job_id,
-        notes=favorite_data.notes,
-    )
-
-    return FavoriteJobResponse.model_validate(favorite)
-
 
-@router.delete("/{job_id}", status_code=status.HTTP_200_OK)
-def remove_favorite_job(
-    job_id: str,
-    api_key: APIKeyModel = Depends(get_api_key),
-    repository: SQLiteRepository = Depends(get_repository),
-) -> JSONResponse:
-    """Remove a job from user's favorites."""
-    removed = repository.remove_favorite_job(api_key_id=api_key.id, job_id=job_id)
 
-    if not removed:
-        raise JobNotFoundError(f"Job with ID '{job_id}' not found in your favorites")
+def create_router(repository_dependency: Callable) -> APIRouter:
+    """Build the favorites routes on a repository adapter dependency."""
+    router = APIRouter(prefix="/favorites", tags=["favorites"])
 
-    return JSONResponse(
-        content={"message": f"Job '{job_id}' removed from favorites"},
+    @router.post(
+        "/batch",
+        response_model=FavoriteBatchAddResponse,
         status_code=status.HTTP_200_OK,
     )
-
-
-@router.get("/", response_model=list[FavoriteJobResponse])
-def get_favorite_jobs(
-    skip: int = 0,
-    limit: int = 100,
-    api_key: APIKeyModel = Depends(get_api_key),
-    repository: SQLiteRepository = Depends(get_repository),
-) -> list[FavoriteJobResponse]:
-    """Get all favorite jobs for the authenticated user."""
-    if skip < 0:
-        raise InvalidInputError("skip must be a non-negative integer")
-    if limit < 1 or limit > 1000:
-        raise InvalidInputError("limit must be between 1 and 1000")
-
-    favorites = repository.get_favorite_jobs(
-        api_key_id=api_key.id, skip=skip, limit=limit
+    async def add_favorite_jobs(
+        favorite_data: FavoriteBatchCreate,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> FavoriteBatchAddResponse:
+        """Add many jobs to user's favorites in one transaction."""
+        job_ids = validate_job_ids(favorite_data.job_ids)
+        added, missing = await repository.add_favorite_jobs(
+            api_key_id=api_key.id, job_ids=job_ids, notes=favorite_data.notes
+        )
+        return favorite_batch_add_response(job_ids, added, missing)
+
+    @router.delete("/batch", response_model=FavoriteBatchRemoveResponse)
+    async def remove_favorite_jobs(
+        favorite_data: FavoriteBatchDelete,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> FavoriteBatchRemoveResponse:
+        """Remove many jobs from user's favorites in one transaction."""
+        job_ids = validate_job_ids(favorite_data.job_ids)
+        removed = await repository.remove_favorite_jobs(
+            api_key_id=api_key.id, job_ids=job_ids
+        )
+        return favorite_batch_remove_response(job_ids, removed)
+
+    @router.get("/status", response_model=list[FavoriteStatusResponse])
+    async def check_favorite_statuses(
+        job_ids: list[str] = Query(...),
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> list[FavoriteStatusResponse]:
+        """Check which of many jobs are in user's favorites.
+
+        ``job_ids`` may be repeated or comma-separated.
+        """
+        job_ids = query_job_ids(job_ids)
+        favorite_ids = await repository.get_user_favorite_job_ids(api_key.id, job_ids)
+        return [
+            FavoriteStatusResponse(job_id=job_id, is_favorited=job_id in favorite_ids)
+            for job_id in job_ids
+        ]
+
+    @router.post(
+        "/{job_id}",
+        response_model=FavoriteJobResponse,
+        status_code=status.HTTP_201_CREATED,
     )
-
-    return [FavoriteJobResponse.model_validate(fav) for fav in favorites]
-
-
-@router.get("/{job_id}/status", response_model=FavoriteStatusResponse)
-def check_favorite_status(
-    job_id: str,
-    api_key: APIKeyModel = Depends(get_api_key),
-    repository: SQLiteRepository = Depends(get_repository),
-) -> FavoriteStatusResponse:
-    """Check if a specific job is in user's favorites."""
-    is_favorited = repository.is_job_favorited(api_key_id=api_key.id, job_id=job_id)
-
-    return FavoriteStatusResponse(job_id=job_id, is_favorited=is_favorited)
+    async def add_favorite_job(
+        job_id: str,
+        favorite_data: FavoriteJobCreate,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> FavoriteJobResponse:
+        """Add a job to user's favorites."""
+        # Check if job exists
+        job = await repository.get_job_by_id(job_id)
+        if not job:
+            raise JobNotFoundError(f"Job with ID '{job_id}' not found")
+
+        # Add to favorites
+        favorite = await repository.add_favorite_job(
+            api_key_id=api_key.id,
+            job_id=job_id,
+            notes=favorite_data.notes,
+        )
+
+        return FavoriteJobResponse.model_validate(favorite)
+
+    @router.delete("/{job_id}", status_code=status.HTTP_200_OK)
+    async def remove_favorite_job(
+        job_id: str,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JSONResponse:
+        """Remove a job from user's favorites."""
+        removed = await repository.remove_favorite_job(
+            api_key_id=api_key.id, job_id=job_id
+        )
+
+        if not removed:
+            raise JobNotFoundError(
+                f"Job with ID '{job_id}' not found in your favorites"
+            )
+
+        return JSONResponse(
+            content={"message": f"Job '{job_id}' removed from favorites"},
+            status_code=status.HTTP_200_OK,
+        )
+
+    @router.get("/", response_model=list[FavoriteJobResponse])
+    async def get_favorite_jobs(
+        response: Response,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> list[FavoriteJobResponse]:
+        """Get all favorite jobs for the authenticated user."""
+        validate_page(skip, limit, cursor)
+
+        after = (
+            decode_cursor(cursor, "favorites", datetime.fromisoformat, int)
+            if cursor
+            else None
+        )
+        favorites = await repository.get_favorite_jobs(
+            api_key_id=api_key.id, skip=skip, limit=limit, after=after
+        )
+
+        if len(favorites) == limit:
+            last = favorites[-1]
+            response.headers["X-Next-Cursor"] = encode_cursor(
+                "favorites", last.created_at, last.id
+            )
+
+        return [FavoriteJobResponse.model_validate(fav) for fav in favorites]
+
+    @router.get("/{job_id}/status", response_model=FavoriteStatusResponse)
+    async def check_favorite_status(
+        job_id: str,
+        api_key: APIKeyModel = Depends(get_api_key),
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> FavoriteStatusResponse:
+        """Check if a specific job is in user's favorites."""
+        is_favorited = await repository.is_job_favorited(
+            api_key_id=api_key.id, job_id=job_id
+        )
+
+        return FavoriteStatusResponse(job_id=job_id, is_favorited=is_favorited)
+
+    return router
+
+
+router = create_router(get_threadpool_repository)
+async_router = create_router(get_async_repository)
@@ -1,175 +1,330 @@
 """Job listing endpoints."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Callable, Optional
 
-import markdown
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 
-from src.core.auth import get_api_key, get_optional_api_key
-from src.core.config import settings
-from src.core.database import get_repository
-from src.core.exceptions import InvalidInputError, JobNotFoundError
+from src.core.async_repositories import RepositoryAdapter
+from src.core.auth import get_optional_api_key
+from src.core.database import get_async_repository, get_threadpool_repository
+from src.core.exceptions import JobNotFoundError
 from src.core.models import APIKeyModel
-from src.core.repositories import SQLiteRepository
+from src.core.pagination import validate_page
+from src.core.rendering import get_details_html, get_details_html_batch
+from src.core.response_cache import response_cache
 from src.core.schemas import (
+    JobBatchRequest,
+    JobBatchResponse,
+    JobChangesResponse,
+    JobFacetsResponse,
     JobListingResponse,
+    JobSearchResultResponse,
     JobStatsResponse,
+    JobStatsTimelineResponse,
     JobWithDetailsResponse,
 )
+from src.routers.common import (
+    cache_page,
+    check_feed_position,
+    conditional_get,
+    decode_jobs_cursor,
+    decode_search_cursor,
+    export_chunks,
+    export_media_type,
+    job_batch_response,
+    job_changes_response,
+    job_details_response,
+    job_rows_page,
+    optional_api_key,
+    page_response,
+    search_rows_page,
+    timeline_response,
+    timeline_since,
+    validate_job_ids,
+    validate_keyword,
+)
 
-router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+def create_router(repository_dependency: Callable) -> APIRouter:
+    """Build the job routes on a repository adapter dependency."""
+    router = APIRouter(prefix="/jobs", tags=["jobs"])
 
-# Conditional API key dependency
-def optional_api_key() -> list:
-    """Return API key dependency list if authentication is required."""
-    if settings.require_api_key:
-        return [Depends(get_api_key)]
-    return []
+    @router.get(
+        "/",
+        response_model=list[JobListingResponse],
+        dependencies=optional_api_key()
+        + conditional_get(repository_dependency, per_user=True),
+    )
+    async def get_all_jobs(
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+        api_key: APIKeyModel | None = Depends(get_optional_api_key),
+    ) -> Response:
+        """Get job listings, newest first, with optional filters and pagination."""
+        validate_page(skip, limit, cursor)
 
+        key = (
+            "jobs",
+            await repository.get_dataset_version(),
+            job_classification or None,
+            job_sub_classification or None,
+            work_arrangements or None,
+            skip,
+            limit,
+            cursor,
+        )
+        page = response_cache.get(key)
+        if page is not None:
+            # Shared pages are user-agnostic; overlay this caller's favorites
+            favorite_ids = (
+                await repository.get_user_favorite_job_ids(api_key.id, page.job_ids)
+                if api_key and page.job_ids
+                else set()
+            )
+            return page_response(page, favorite_ids, hit=True)
 
-@router.get(
-    "/", response_model=list[JobListingResponse], dependencies=optional_api_key()
-)
-def get_all_jobs(
-    job_classification: Optional[str] = None,
-    job_sub_classification: Optional[str] = None,
-    work_arrangements: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 100,
-    repository: SQLiteRepository = Depends(get_repository),
-    api_key: APIKeyModel | None = Depends(get_optional_api_key),
-) -> list[JobListingResponse]:
-    """Get job listings with optional filters and pagination."""
-    if skip < 0:
-        raise InvalidInputError("skip must be a non-negative integer")
-    if limit < 1 or limit > 1000:
-        raise InvalidInputError("limit must be between 1 and 1000")
-
-    jobs = repository.get_all_jobs(
-        job_classification=job_classification,
-        job_sub_classification=job_sub_classification,
-        work_arrangements=work_arrangements,
-        skip=skip,
-        limit=limit,
+        rows = await repository.get_job_rows(
+            api_key.id if api_key else None,
+            job_classification=job_classification,
+            job_sub_classification=job_sub_classification,
+            work_arrangements=work_arrangements,
+            skip=skip,
+            limit=limit,
+            after=decode_jobs_cursor(cursor),
+        )
+
+        # Fast path: rows are serialized directly, response_model only documents
+        page = job_rows_page(rows, limit)
+        cache_page(key, page)
+        favorite_ids = {row.job_id for row in rows if row.is_favorite}
+        return page_response(page, favorite_ids, hit=False)
+
+    @router.get(
+        "/facets",
+        response_model=JobFacetsResponse,
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
     )
+    async def get_job_facets(
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobFacetsResponse:
+        """Get job counts per classification, sub classification and work arrangement."""
+        facets = await repository.get_job_facets(
+            job_classification=job_classification,
+            job_sub_classification=job_sub_classification,
+            work_arrangements=work_arrangements,
+        )
+        return JobFacetsResponse(**facets)
 
-    favorite_job_ids = set()
-    if api_key:
-        favorite_job_ids = repository.get_user_favorite_job_ids(api_key.id)
+    @router.get("/export", dependencies=optional_api_key())
+    async def export_jobs(
+        format: str = "ndjson",
+        job_classification: Optional[str] = None,
+        job_sub_classification: Optional[str] = None,
+        work_arrangements: Optional[str] = None,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> StreamingResponse:
+        """Stream all matching job listings as NDJSON or CSV, newest first."""
+        media_type = export_media_type(format)
 
-    results = []
-    for job in jobs:
-        response = JobListingResponse.model_validate(job)
-        if job.job_id in favorite_job_ids:
-            response.is_favorite = True
-        results.append(response)
+        rows = repository.iter_jobs(
+            job_classification=job_classification,
+            job_sub_classification=job_sub_classification,
+            work_arrangements=work_arrangements,
+        )
+        return StreamingResponse(
+            export_chunks(rows, format),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+        )
 
-    return results
+    @router.get(
+        "/classifications",
+        response_model=list[str],
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
+    )
+    async def get_job_classifications(
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> list[str]:
+        """Get all unique job classifications."""
+        return await repository.get_all_job_classifications()
 
+    @router.get(
+        "/work-arrangements",
+        response_model=list[str],
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
+    )
+    async def get_work_arrangements(
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> list[str]:
+        """Get all unique work arrangements."""
+        return await repository.get_all_work_arrangements()
 
-@router.get(
-    "/classifications", response_model=list[str], dependencies=optional_api_key()
-)
-def get_job_classifications(
-    repository: SQLiteRepository = Depends(get_repository),
-) -> list[str]:
-    """Get all unique job classifications."""
-    return repository.get_all_job_classifications()
+    @router.get(
+        "/sub-classifications",
+        response_model=list[str],
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
+    )
+    async def get_job_sub_classifications(
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> list[str]:
+        """Get all unique job sub classifications."""
+        return await repository.get_all_job_sub_classifications()
 
+    @router.get(
+        "/search",
+        response_model=list[JobSearchResultResponse],
+        dependencies=optional_api_key()
+        + conditional_get(repository_dependency, per_user=True),
+    )
+    async def search_jobs(
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+        api_key: APIKeyModel | None = Depends(get_optional_api_key),
+    ) -> Response:
+        """Search jobs by keyword, ranked by relevance when full-text search is available."""
+        validate_keyword(keyword)
+        validate_page(skip, limit, cursor)
 
-@router.get(
-    "/work-arrangements", response_model=list[str], dependencies=optional_api_key()
-)
-def get_work_arrangements(
-    repository: SQLiteRepository = Depends(get_repository),
-) -> list[str]:
-    """Get all unique work arrangements."""
-    return repository.get_all_work_arrangements()
+        search_query = await repository.get_search_query(keyword)
+        ranked = search_query is not None
+        # The FTS5 expression is canonical; LIKE patterns must match exactly
+        key = (
+            "search",
+            await repository.get_dataset_version(),
+            search_query or keyword,
+            ranked,
+            skip,
+            limit,
+            cursor,
+        )
+        page = response_cache.get(key)
+        if page is not None:
+            favorite_ids = (
+                await repository.get_user_favorite_job_ids(api_key.id, page.job_ids)
+                if api_key and page.job_ids
+                else set()
+            )
+            return page_response(page, favorite_ids, hit=True)
 
+        rows = await repository.search_job_rows(
+            keyword=keyword,
+            skip=skip,
+            limit=limit,
+            after=decode_search_cursor(cursor, ranked),
+            api_key_id=api_key.id if api_key else None,
+        )
 
-@router.get(
-    "/sub-classifications", response_model=list[str], dependencies=optional_api_key()
-)
-def get_job_sub_classifications(
-    repository: SQLiteRepository = Depends(get_repository),
-) -> list[str]:
-    """Get all unique job sub classifications."""
-    return repository.get_all_job_sub_classifications()
+        page = search_rows_page(rows, limit, ranked)
+        cache_page(key, page)
+        favorite_ids = {row.job_id for row in rows if row.is_favorite}
+        return page_response(page, favorite_ids, hit=False)
 
+    @router.get(
+        "/stats",
+        response_model=JobStatsResponse,
+        dependencies=optional_api_key()
+        + conditional_get(repository_dependency, time_bucket_seconds=60),
+    )
+    async def get_job_stats(
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobStatsResponse:
+        """Get job system statistics."""
+        stats = await repository.get_job_stats()
+        return JobStatsResponse(**stats)
 
-@router.get(
-    "/search", response_model=list[JobListingResponse], dependencies=optional_api_key()
-)
-def search_jobs(
-    keyword: str,
-    skip: int = 0,
-    limit: int = 100,
-    repository: SQLiteRepository = Depends(get_repository),
-) -> list[JobListingResponse]:
-    """Search jobs by keyword in multiple fields."""
-    if not keyword or len(keyword.strip()) < 2:
-        raise InvalidInputError("Search keyword must be at least 2 characters long")
-    if skip < 0:
-        raise InvalidInputError("skip must be a non-negative integer")
-    if limit < 1 or limit > 1000:
-        raise InvalidInputError("limit must be between 1 and 1000")
-
-    jobs = repository.search_jobs(keyword=keyword, skip=skip, limit=limit)
-    return [JobListingResponse.model_validate(job) for job in jobs]
-
-
-@router.get("/stats", response_model=JobStatsResponse, dependencies=optional_api_key())
-def get_job_stats(
-    repository: SQLiteRepository = Depends(get_repository),
-) -> JobStatsResponse:
-    """Get job system statistics."""
-    stats = repository.get_job_stats()
-    return JobStatsResponse(**stats)
-
-
-@router.get(
-    "/{job_id}", response_model=JobWithDetailsResponse, dependencies=optional_api_key()
-)
-def get_job_by_id(
-    job_id: str,
-    repository: SQLiteRepository = Depends(get_repository),
-) -> JobWithDetailsResponse:
-    """Get job listing with full details by ID."""
-    job = repository.get_job_by_id(job_id)
-
-    if not job:
-        raise JobNotFoundError(f"Job with ID '{job_id}' not found")
-
-    # Combine listing and details data
-    job_data = {
-        "job_id": job.job_id,
-        "title": job.title,
-        "job_details_url": job.job_details_url,
-        "job_summary": job.job_summary,
-        "company_name": job.company_name,
-        "location": job.location,
-        "country_code": job.country_code,
-        "listing_date": job.listing_date,
-        "salary_label": job.salary_label,
-        "work_type": job.work_type,
-        "job_classification": job.job_classification,
-        "job_sub_classification": job.job_sub_classification,
-        "work_arrangements": job.work_arrangements,
-    }
-
-    # Add details if available
-    if job.details:
-        job_data.update(
-            {
-                "status": job.details.status,
-                "is_expired": job.details.is_expired,
-                "details": markdown.markdown(job.details.details)
-                if job.details.details
-                else None,
-                "is_verified": job.details.is_verified,
-                "expires_at": job.details.expires_at,
-            }
+    @router.get(
+        "/stats/timeline",
+        response_model=JobStatsTimelineResponse,
+        dependencies=optional_api_key()
+        + conditional_get(repository_dependency, time_bucket_seconds=60),
+    )
+    async def get_job_stats_timeline(
+        granularity: str = "day",
+        since: Optional[datetime] = None,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobStatsTimelineResponse:
+        """Get the number of jobs listed per hour or day since a point in time."""
+        since = timeline_since(granularity, since)
+        buckets = await repository.get_job_stats_timeline(granularity, since)
+        return timeline_response(granularity, since, buckets)
+
+    @router.get(
+        "/changes",
+        response_model=JobChangesResponse,
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
+    )
+    async def get_job_changes(
+        since: int = 0,
+        limit: int = 500,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobChangesResponse:
+        """Get job inserts, updates and tombstones recorded after sequence number since."""
+        bounds = await repository.get_change_feed_bounds()
+        check_feed_position(since, limit, bounds)
+        changes = await repository.get_job_changes(since, limit)
+        snapshots = await repository.get_job_snapshots(
+            list(dict.fromkeys(change.job_id for change in changes))
         )
+        return job_changes_response(changes, snapshots, since, limit, bounds[1])
+
+    @router.post(
+        "/batch",
+        response_model=JobBatchResponse,
+        dependencies=optional_api_key(),
+    )
+    async def get_jobs_batch(
+        request: JobBatchRequest,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobBatchResponse:
+        """Get many jobs by ID in one call, reporting the IDs that were not found."""
+        job_ids = validate_job_ids(request.job_ids)
+        jobs = await repository.get_jobs_by_ids(job_ids, request.include_details)
+        details_html = (
+            await repository.run_sync(
+                get_details_html_batch, [job.details for job in jobs if job.details]
+            )
+            if request.include_details
+            else {}
+        )
+        return job_batch_response(job_ids, jobs, request.include_details, details_html)
+
+    @router.get(
+        "/{job_id}",
+        response_model=JobWithDetailsResponse,
+        dependencies=optional_api_key() + conditional_get(repository_dependency),
+    )
+    async def get_job_by_id(
+        job_id: str,
+        repository: RepositoryAdapter = Depends(repository_dependency),
+    ) -> JobWithDetailsResponse:
+        """Get job listing with full details by ID."""
+        job = await repository.get_job_by_id(job_id)
+
+        if not job:
+            raise JobNotFoundError(f"Job with ID '{job_id}' not found")
+
+        details_html = (
+            await repository.run_sync(get_details_html, job.details)
+            if job.details
+            else None
+        )
+        return job_details_response(job, details_html)
+
+    return router
+
 
-    return JobWithDetailsResponse(**job_data)
+router = create_router(get_threadpool_repository)
+async_router = create_router(get_async_repository)
@@ -0,0 +1,13 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter, Response
+
+from ..core.metrics import CONTENT_TYPE, registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Expose request, database pool, cache and auth metrics to Prometheus."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
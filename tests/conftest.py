@@ -0,0 +1,54 @@
+"""Shared fixtures for the API tests."""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.auth import api_key_cache
+from src.core.database import get_repository
+from src.core.models import JobListingModel
+from src.core.repositories import SQLiteRepository
+from src.core.response_cache import response_cache
+
+
+@pytest.fixture
+def make_repository(tmp_path):
+    """Return a factory for a file-backed repository served by the app.
+
+    ``make_repository(listings, **options)`` creates the repository with
+    ``options``, adds one listing per dict in ``listings`` (fields overriding
+    the defaults for ``job-{index}``) and routes get_repository to it. Caches
+    are cleared around the test and the repository is closed afterwards.
+    """
+    repositories = []
+
+    def make(listings: Iterable[dict] = (), **options) -> SQLiteRepository:
+        repo = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}", **options)
+        repositories.append(repo)
+        with Session(repo.engine) as session:
+            for index, fields in enumerate(listings):
+                listing = {
+                    "job_id": f"job-{index}",
+                    "title": "Python Developer",
+                    "job_details_url": "https://example.com",
+                    "job_summary": "Summary",
+                    "company_name": "Acme",
+                    "location": "Sydney",
+                    "country_code": "AU",
+                    "listing_date": datetime(2025, 1, 1 + index),
+                }
+                session.add(JobListingModel(**{**listing, **fields}))
+            session.commit()
+        response_cache.clear()
+        api_key_cache.clear()
+        app.dependency_overrides[get_repository] = lambda: repo
+        return repo
+
+    yield make
+    app.dependency_overrides = {}
+    response_cache.clear()
+    for repo in repositories:
+        repo.close()
@@ -0,0 +1,182 @@
+"""Tests for the async repository and async routes."""
+
+import asyncio
+import inspect
+import json
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from main import invalid_input_handler, job_not_found_handler
+from src.core.async_repositories import (
+    AsyncRepository,
+    ThreadpoolRepository,
+    async_database_url,
+)
+from src.core.database import get_async_repository, get_repository
+from src.core.exceptions import InvalidInputError, JobNotFoundError
+from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import SQLiteRepository
+from src.core.response_cache import response_cache
+from src.routers import jobs
+
+
+def test_async_repository_mirrors_sync_methods():
+    """Test every public SQLiteRepository method has coroutine counterparts."""
+    for name, _ in inspect.getmembers(SQLiteRepository, inspect.isfunction):
+        if not name.startswith("_") and name not in ("close", "iter_jobs"):
+            assert inspect.iscoroutinefunction(getattr(AsyncRepository, name)), name
+            assert inspect.iscoroutinefunction(getattr(ThreadpoolRepository, name)), (
+                name
+            )
+
+
+def test_async_database_url():
+    """Test database URLs are switched to their async drivers."""
+    assert async_database_url("sqlite:///jobs.db") == "sqlite+aiosqlite:///jobs.db"
+    assert (
+        async_database_url("postgresql://u:p@db/jobs")
+        == "postgresql+asyncpg://u:p@db/jobs"
+    )
+    assert async_database_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Serve the async job routes from a seeded file database."""
+    pytest.importorskip("aiosqlite")
+    db_url = f"sqlite:///{tmp_path / 'jobs.db'}"
+
+    response_cache.clear()
+    seed = SQLiteRepository(db_url=db_url)
+    with Session(seed.engine) as session:
+        for index in range(3):
+            session.add(
+                JobListingModel(
+                    job_id=f"job-{index}",
+                    title=f"Python Developer {index}",
+                    job_details_url="https://example.com",
+                    job_summary="Summary",
+                    company_name="Acme",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=datetime(2025, 1, 1 + index),
+                )
+            )
+        session.add(JobDetailsModel(job_id="job-0", details="**Bold**"))
+        session.commit()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        repository = await AsyncRepository.connect(db_url)
+        # Authentication keeps using the sync repository
+        app.dependency_overrides[get_repository] = lambda: seed
+        app.dependency_overrides[get_async_repository] = lambda: repository
+        yield
+        await repository.close()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(jobs.async_router)
+    app.add_exception_handler(JobNotFoundError, job_not_found_handler)
+    app.add_exception_handler(InvalidInputError, invalid_input_handler)
+    with TestClient(app) as test_client:
+        yield test_client
+    seed.close()
+
+
+def test_async_jobs_listing_and_cursor(client):
+    """Test the async listing returns pages and a next cursor."""
+    response = client.get("/jobs/?limit=2")
+    assert response.status_code == 200
+    assert [job["job_id"] for job in response.json()] == ["job-2", "job-1"]
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/jobs/?limit=2&cursor={cursor}")
+    assert [job["job_id"] for job in response.json()] == ["job-0"]
+
+
+def test_async_job_details_and_search(client):
+    """Test async details rendering, search and not-found handling."""
+    assert "<strong>Bold</strong>" in client.get("/jobs/job-0").json()["details"]
+    assert client.get("/jobs/missing").status_code == 404
+
+    results = client.get("/jobs/search?keyword=python").json()
+    assert len(results) == 3
+
+
+def test_async_export_streams_rows(client):
+    """Test the async export streams every job."""
+    response = client.get("/jobs/export")
+    assert response.status_code == 200
+    jobs = [json.loads(line) for line in response.text.splitlines()]
+    assert [job["job_id"] for job in jobs] == ["job-2", "job-1", "job-0"]
+
+
+def test_async_jobs_batch(client):
+    """Test the async batch endpoint resolves ids and renders details."""
+    response = client.post(
+        "/jobs/batch", json={"job_ids": ["job-0", "nope"], "include_details": True}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [job["job_id"] for job in body["jobs"]] == ["job-0"]
+    assert "<strong>Bold</strong>" in body["jobs"][0]["details"]
+    assert body["missing"] == ["nope"]
+
+
+def test_concurrent_async_version_reads_do_not_block_the_loop(tmp_path):
+    """Test concurrent dataset version reads on one event loop all complete."""
+    pytest.importorskip("aiosqlite")
+    db_url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    SQLiteRepository(db_url=db_url).close()
+    results = []
+
+    async def read_concurrently():
+        repository = await AsyncRepository.connect(db_url)
+        try:
+            for _ in range(3):
+                repository.repository.dataset_version.invalidate()
+                results.append(
+                    await asyncio.gather(
+                        *(repository.get_dataset_version() for _ in range(5))
+                    )
+                )
+        finally:
+            await repository.close()
+
+    # A deadlock blocks the loop thread itself, so watch it from outside
+    thread = threading.Thread(target=asyncio.run, args=(read_concurrently(),))
+    thread.daemon = True
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "event loop blocked on concurrent version reads"
+    assert len(results) == 3
+    assert all(len(set(versions)) == 1 for versions in results)
+
+
+def test_threadpool_repository_streams_jobs_in_batches(tmp_path):
+    """Test the sync adapter streams every job across several batches."""
+    repository = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    with Session(repository.engine) as session:
+        for index in range(5):
+            session.add(
+                JobListingModel(
+                    job_id=f"job-{index}",
+                    title="Developer",
+                    job_details_url="https://example.com",
+                    listing_date=datetime(2025, 1, 1 + index),
+                )
+            )
+        session.commit()
+
+    async def stream():
+        rows = ThreadpoolRepository(repository).iter_jobs(batch_size=2)
+        return [row.job_id async for row in rows]
+
+    assert asyncio.run(stream()) == [f"job-{index}" for index in range(4, -1, -1)]
+    repository.close()
@@ -6,14 +6,48 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.auth import api_key_cache, authenticate_api_key
+from src.core.config import settings
+from src.core.exceptions import UnauthorizedError
+from src.core.repositories import SQLiteRepository
 from src.core.security import (
     generate_api_key,
+    get_key_lookup_id,
     get_key_prefix,
     hash_api_key,
     verify_api_key,
 )
 
 
+@pytest.fixture
+def repository():
+    """Create a repository backed by an in-memory database."""
+    api_key_cache.clear()
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    yield repo
+    repo.close()
+
+
+def _create_key(
+    repository, lookup: bool = True, expires_at: datetime | None = None
+) -> tuple[str, int]:
+    """Store a new API key and return the plain key and its ID."""
+    plain_key = generate_api_key()
+    api_key_model = repository.create_api_key(
+        key_hash=hash_api_key(plain_key),
+        key_prefix=get_key_prefix(plain_key),
+        lookup_id=get_key_lookup_id(plain_key) if lookup else None,
+        name="Test User",
+        email=f"{plain_key[-8:]}@example.com",
+        expires_at=expires_at,
+    )
+    return plain_key, api_key_model.id
+
+
 def test_api_key_generation():
     """Test API key generation."""
     print("Testing API key generation...")
@@ -68,6 +102,83 @@ def test_multiple_keys():
     print()
 
 
+def test_key_lookup_id_is_non_secret_prefix():
+    """Test lookup identifier is a stable prefix shorter than the key."""
+    api_key = generate_api_key()
+    lookup_id = get_key_lookup_id(api_key)
+
+    assert api_key.startswith(lookup_id)
+    assert lookup_id.startswith("sk_live_")
+    assert len(api_key) - len(lookup_id) >= 24
+
+
+def test_get_api_key_by_lookup_id(repository):
+    """Test authentication resolves the key through its lookup identifier."""
+    plain_key, api_key_id = _create_key(repository)
+    _create_key(repository)
+
+    api_key_model = authenticate_api_key(plain_key, repository)
+    assert api_key_model.id == api_key_id
+
+    with pytest.raises(UnauthorizedError):
+        authenticate_api_key(plain_key[:-1] + "x", repository)
+
+
+def test_legacy_keys_are_rejected_by_default(repository):
+    """Test keys without a lookup identifier are not scanned unless enabled."""
+    plain_key, _ = _create_key(repository, lookup=False)
+
+    with pytest.raises(UnauthorizedError):
+        authenticate_api_key(plain_key, repository)
+    assert len(repository.get_legacy_api_keys()) == 1
+
+
+def test_legacy_key_is_backfilled(repository, monkeypatch):
+    """Test keys without a lookup identifier still work and get migrated."""
+    monkeypatch.setattr(settings, "allow_legacy_api_keys", True)
+    plain_key, api_key_id = _create_key(repository, lookup=False)
+
+    assert authenticate_api_key(plain_key, repository).id == api_key_id
+    assert repository.get_legacy_api_keys() == []
+
+    migrated = repository.get_api_key_by_lookup_id(get_key_lookup_id(plain_key))
+    assert migrated is not None and migrated.id == api_key_id
+
+
+def test_verified_key_cache_hits(repository):
+    """Test repeated requests with the same key are served from the cache."""
+    plain_key, api_key_id = _create_key(repository)
+    before = api_key_cache.stats()
+
+    authenticate_api_key(plain_key, repository)
+    authenticate_api_key(plain_key, repository)
+    authenticate_api_key(plain_key, repository)
+
+    after = api_key_cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
+
+
+def test_revoked_key_is_rejected_immediately(repository):
+    """Test revoking a key invalidates its cached verification."""
+    plain_key, api_key_id = _create_key(repository)
+    authenticate_api_key(plain_key, repository)
+
+    repository.deactivate_api_key(api_key_id)
+
+    with pytest.raises(UnauthorizedError):
+        authenticate_api_key(plain_key, repository)
+
+
+def test_expired_key_is_rejected(repository):
+    """Test keys past expires_at are rejected."""
+    expired_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    plain_key, _ = _create_key(repository, expires_at=expired_at)
+
+    with pytest.raises(UnauthorizedError, match="expired"):
+        authenticate_api_key(plain_key, repository)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("API Key Authentication Tests")
@@ -0,0 +1,95 @@
+"""Tests for the trigger-fed job change log and /jobs/changes."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.models import JobDetailsModel, JobListingModel
+
+client = TestClient(app)
+
+
+def _add_job(session: Session, job_id: str) -> None:
+    """Add a listing with details."""
+    session.add(
+        JobListingModel(
+            job_id=job_id,
+            title="Python Developer",
+            job_details_url="https://example.com",
+            job_summary="Summary",
+            company_name="Acme",
+            location="Sydney",
+            country_code="AU",
+            listing_date=datetime(2025, 1, 1),
+        )
+    )
+    session.add(JobDetailsModel(job_id=job_id, status="Active", is_expired=False))
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with the change log installed."""
+    return make_repository(version_check_seconds=0)
+
+
+def test_feed_reports_upserts_and_tombstones(repository):
+    """Test inserts, updates, expirations and deletions appear in the feed."""
+    with Session(repository.engine) as session:
+        for job_id in ("job-1", "job-2", "job-3"):
+            _add_job(session, job_id)
+        session.commit()
+
+    first = client.get("/jobs/changes?since=0").json()
+    assert [c["job_id"] for c in first["changes"]] == ["job-1", "job-2", "job-3"]
+    assert first["changes"][0]["job"]["title"] == "Python Developer"
+    since = first["next_since"]
+    assert since == first["latest_seq"] and not first["has_more"]
+
+    with Session(repository.engine) as session:
+        session.execute(
+            update(JobListingModel)
+            .where(JobListingModel.job_id == "job-1")
+            .values(title="Senior Python Developer")
+        )
+        session.execute(
+            update(JobDetailsModel)
+            .where(JobDetailsModel.job_id == "job-2")
+            .values(is_expired=True)
+        )
+        session.execute(
+            delete(JobDetailsModel).where(JobDetailsModel.job_id == "job-3")
+        )
+        session.execute(
+            delete(JobListingModel).where(JobListingModel.job_id == "job-3")
+        )
+        session.commit()
+
+    changes = client.get(f"/jobs/changes?since={since}").json()["changes"]
+    by_job = {c["job_id"]: c for c in changes}
+    assert len(changes) == 3
+    assert by_job["job-1"]["change"] == "update"
+    assert by_job["job-1"]["job"]["title"] == "Senior Python Developer"
+    assert by_job["job-2"]["change"] == "expire" and by_job["job-2"]["job"] is None
+    assert by_job["job-3"]["change"] == "delete" and by_job["job-3"]["job"] is None
+
+
+def test_feed_pages_and_pruning(repository):
+    """Test bounded pages and 410 for positions pruned from the log."""
+    with Session(repository.engine) as session:
+        for index in range(5):
+            _add_job(session, f"job-{index}")
+        session.commit()
+
+    page = client.get("/jobs/changes?since=0&limit=4").json()
+    assert page["has_more"] and page["next_since"] == 4
+    assert client.get("/jobs/changes?limit=0").status_code == 400
+
+    repository.prune_job_changes(datetime(2999, 1, 1))
+    oldest, latest = repository.get_change_feed_bounds()
+    assert (oldest, latest) == (11, 10)
+    assert client.get("/jobs/changes?since=4").status_code == 410
+    assert client.get(f"/jobs/changes?since={latest}").json()["changes"] == []
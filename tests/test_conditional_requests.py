@@ -0,0 +1,104 @@
+"""Tests for ETag / Last-Modified handling on job read endpoints."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.models import JobListingModel
+from src.core.repositories import SQLiteRepository
+
+client = TestClient(app)
+
+
+def _add_job(repository: SQLiteRepository, job_id: str) -> None:
+    """Insert one listing."""
+    with Session(repository.engine) as session:
+        session.add(
+            JobListingModel(
+                job_id=job_id,
+                title="Python Developer",
+                job_details_url="https://example.com",
+                job_summary="Summary",
+                company_name="Acme",
+                location="Sydney",
+                country_code="AU",
+                listing_date=datetime(2025, 1, 1),
+                job_classification="IT",
+            )
+        )
+        session.commit()
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with one listing."""
+    repo = make_repository(version_check_seconds=0)
+    _add_job(repo, "job-1")
+    return repo
+
+
+def test_matching_etag_returns_304_without_querying(repository, monkeypatch):
+    """Test a repeated poll is answered from the validators alone."""
+    first = client.get("/jobs/?limit=10&job_classification=IT")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("database queried for a 304")
+
+    monkeypatch.setattr(repository, "get_job_rows", fail)
+    # Same parameters in a different order map to the same ETag
+    second = client.get(
+        "/jobs/?job_classification=IT&limit=10", headers={"If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_etag_changes_after_write(repository):
+    """Test a write to the job tables invalidates earlier validators."""
+    first = client.get("/jobs/facets")
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+
+    _add_job(repository, "job-2")
+    second = client.get(
+        "/jobs/facets", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json()["job_classification"]["IT"] == 2
+
+
+def test_if_modified_since_is_ignored(repository):
+    """Test only ETags validate, since dates cannot tell same-second writes apart."""
+    first = client.get("/jobs/classifications")
+    assert "Last-Modified" not in first.headers
+
+    _add_job(repository, "job-2")
+    response = client.get(
+        "/jobs/classifications",
+        headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+    )
+    assert response.status_code == 200
+
+
+def test_favorite_writes_bump_favorites_version(tmp_path):
+    """Test favorites are versioned apart from the job data."""
+    repository = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}", version_check_seconds=3600
+    )
+    _add_job(repository, "job-1")
+    key = repository.create_api_key("hash", "sk_live_x", "Test", "test@example.com")
+    dataset_version = repository.get_dataset_version()
+    favorites_version = repository.get_favorites_version()
+
+    # In-process writes are seen at once despite the long check interval
+    repository.add_favorite_job(key.id, "job-1")
+    assert repository.get_favorites_version() != favorites_version
+    assert repository.get_dataset_version() == dataset_version
+    repository.close()
@@ -0,0 +1,60 @@
+"""Tests for the streaming job export endpoint."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with a few listings."""
+    return make_repository(
+        {
+            "title": f"Job, {index}",
+            "job_summary": "Line one\nline two",
+            "job_classification": "IT" if index % 2 else "Sales",
+        }
+        for index in range(5)
+    )
+
+
+def test_iter_jobs_streams_in_batches(repository):
+    """Test iter_jobs yields every row newest first across small batches."""
+    rows = list(repository.iter_jobs(batch_size=2))
+    assert [row.job_id for row in rows] == [f"job-{i}" for i in range(4, -1, -1)]
+
+
+def test_export_ndjson_applies_filters(repository):
+    """Test NDJSON export returns one JSON object per filtered job."""
+    response = client.get("/jobs/export?job_classification=IT")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    jobs = [json.loads(line) for line in response.text.splitlines()]
+    assert [job["job_id"] for job in jobs] == ["job-3", "job-1"]
+    assert jobs[0]["listing_date"] == "2025-01-04T00:00:00"
+
+
+def test_export_csv_quotes_values(repository):
+    """Test CSV export has a header row and round-trips embedded commas."""
+    response = client.get("/jobs/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 5
+    assert rows[0]["title"] == "Job, 4"
+    assert rows[0]["job_summary"] == "Line one\nline two"
+
+
+def test_export_rejects_unknown_format(repository):
+    """Test an unsupported format is rejected before streaming starts."""
+    response = client.get("/jobs/export?format=xml")
+    assert response.status_code == 400
@@ -0,0 +1,54 @@
+"""Tests for the direct row serialization used by list endpoints."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.schemas import JobListingResponse, JobSearchResultResponse
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with a few listings."""
+    return make_repository(
+        {
+            "title": f"Python Developer {index}",
+            "listing_date": datetime(2025, 1, 1 + index, 9, 30),
+            "salary_label": "$100k" if index else None,
+            "job_classification": "IT",
+        }
+        for index in range(3)
+    )
+
+
+def test_job_rows_match_response_model(repository):
+    """Test the fast path emits exactly what JobListingResponse would."""
+    response = client.get("/jobs/?limit=2")
+    assert response.status_code == 200
+
+    expected = [
+        JobListingResponse.model_validate(job).model_dump(mode="json")
+        for job in repository.get_all_jobs(limit=2)
+    ]
+    assert response.json() == expected
+    assert list(response.json()[0]) == list(JobListingResponse.model_fields)
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_search_rows_match_response_model(repository):
+    """Test search rows carry the snippet and drop the internal rank."""
+    response = client.get("/jobs/search?keyword=python")
+    assert response.status_code == 200
+
+    results = repository.search_jobs_with_snippets("python")
+    expected = []
+    for result in results:
+        job_response = JobSearchResultResponse.model_validate(result.job)
+        job_response.snippet = result.snippet
+        expected.append(job_response.model_dump(mode="json"))
+    assert response.json() == expected
+    assert "rank" not in response.json()[0]
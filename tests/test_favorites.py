@@ -7,7 +7,12 @@ from fastapi.testclient import TestClient
 
 from main import app
 from src.core.database import close_repository, init_repository
-from src.core.security import generate_api_key, get_key_prefix, hash_api_key
+from src.core.security import (
+    generate_api_key,
+    get_key_lookup_id,
+    get_key_prefix,
+    hash_api_key,
+)
 
 
 @pytest.fixture
@@ -40,6 +45,7 @@ def api_key(repository):
     api_key_model = repository.create_api_key(
         key_hash=key_hash,
         key_prefix=get_key_prefix(plain_key),
+        lookup_id=get_key_lookup_id(plain_key),
         name="Test User",
         email=email,
     )
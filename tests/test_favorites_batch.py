@@ -0,0 +1,126 @@
+"""Tests for bulk favorite writes and multi-id favorite status."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.models import FavoriteJobModel, JobListingModel
+from src.core.repositories import IN_CLAUSE_CHUNK_SIZE
+from src.core.security import (
+    generate_api_key,
+    get_key_lookup_id,
+    get_key_prefix,
+    hash_api_key,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with a few listings."""
+    return make_repository({} for _ in range(3))
+
+
+@pytest.fixture
+def headers(repository):
+    """Create an API key and return its request headers."""
+    plain_key = generate_api_key()
+    repository.create_api_key(
+        key_hash=hash_api_key(plain_key),
+        key_prefix=get_key_prefix(plain_key),
+        lookup_id=get_key_lookup_id(plain_key),
+        name="Test User",
+        email="batch@example.com",
+    )
+    return {"X-API-Key": plain_key}
+
+
+def test_bulk_add_status_and_remove(repository, headers):
+    """Test bulk add and remove report per-id outcomes and status reflects them."""
+    client.post("/favorites/job-0", headers=headers, json={})
+
+    response = client.post(
+        "/favorites/batch",
+        headers=headers,
+        json={"job_ids": ["job-0", "job-1", "job-2", "gone", "job-1"], "notes": "n"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "added": ["job-1", "job-2"],
+        "already_favorited": ["job-0"],
+        "not_found": ["gone"],
+    }
+    with Session(repository.engine) as session:
+        assert session.query(FavoriteJobModel).count() == 3
+        # Existing favorites are left untouched
+        notes = dict(session.query(FavoriteJobModel.job_id, FavoriteJobModel.notes))
+        assert notes == {"job-0": None, "job-1": "n", "job-2": "n"}
+
+    response = client.request(
+        "DELETE", "/favorites/batch", headers=headers, json={"job_ids": ["job-2", "x"]}
+    )
+    assert response.json() == {"removed": ["job-2"], "not_favorited": ["x"]}
+
+    response = client.get(
+        "/favorites/status?job_ids=job-2,job-1&job_ids=job-0", headers=headers
+    )
+    assert response.status_code == 200
+    assert [(s["job_id"], s["is_favorited"]) for s in response.json()] == [
+        ("job-2", False),
+        ("job-1", True),
+        ("job-0", True),
+    ]
+
+
+def test_bulk_add_chunks_large_batches(repository):
+    """Test full chunks are written in full, binding few parameters per statement."""
+    key = repository.create_api_key("hash", "sk_live_x", "Test", "test@example.com")
+    bulk_ids = [f"bulk-{n}" for n in range(IN_CLAUSE_CHUNK_SIZE)]
+    with Session(repository.engine) as session:
+        for job_id in bulk_ids:
+            session.add(
+                JobListingModel(
+                    job_id=job_id,
+                    title="Python Developer",
+                    job_details_url="https://example.com",
+                    job_summary="Summary",
+                    company_name="Acme",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=datetime(2025, 2, 1),
+                )
+            )
+        session.commit()
+    job_ids = ["job-1"] + bulk_ids + ["missing", "job-2"]
+    bound = []
+
+    @event.listens_for(repository.engine, "before_cursor_execute")
+    def count_parameters(conn, cursor, statement, parameters, context, executemany):
+        rows = parameters if executemany else [parameters]
+        bound.extend(len(row) for row in rows)
+
+    added, missing = repository.add_favorite_jobs(key.id, job_ids)
+    event.remove(repository.engine, "before_cursor_execute", count_parameters)
+    # Older SQLite builds cap a statement at 999 bound parameters
+    assert max(bound) < 999
+    assert added == ["job-1", *bulk_ids, "job-2"]
+    assert missing == ["missing"]
+    with Session(repository.engine) as session:
+        created = session.query(FavoriteJobModel.created_at).all()
+    assert len(created) == len(added) and all(row.created_at for row in created)
+    assert repository.add_favorite_jobs(key.id, ["job-1"]) == ([], [])
+    assert repository.remove_favorite_jobs(key.id, job_ids) == added
+
+
+def test_bulk_requests_are_validated(repository, headers):
+    """Test empty lists are rejected and authentication is required."""
+    assert (
+        client.post("/favorites/batch", headers=headers, json={"job_ids": []})
+    ).status_code == 400
+    assert client.get("/favorites/status", headers=headers).status_code == 422
+    assert client.get("/favorites/status?job_ids=job-0").status_code == 401
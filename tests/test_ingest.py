@@ -0,0 +1,113 @@
+"""Tests for bulk ingest of jobs-scraper output."""
+
+import json
+
+import pytest
+
+from src.core.ingest import ingest_records, read_jsonl, read_sqlite
+from src.core.repositories import SQLiteRepository
+
+
+def _record(index: int, **overrides) -> dict:
+    """Build one flat JSONL record with listing and details fields."""
+    record = {
+        "job_id": f"job-{index}",
+        "title": f"Python Developer {index}",
+        "job_details_url": "https://example.com",
+        "job_summary": "Summary",
+        "company_name": "Acme",
+        "location": "Sydney",
+        "country_code": "AU",
+        "listing_date": "2025-01-01T09:30:00+10:00",
+        "job_classification": "IT",
+        "status": "Active",
+        "is_expired": False,
+        "details": "**Bold** details",
+    }
+    record.update(overrides)
+    return record
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create an empty file-backed repository."""
+    repo = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}", version_check_seconds=0
+    )
+    yield repo
+    repo.close()
+
+
+def test_jsonl_ingest_skips_unchanged_rows(repository, tmp_path):
+    """Test re-ingesting only writes records whose content changed."""
+    source = tmp_path / "jobs.jsonl"
+    lines = [json.dumps(_record(index)) for index in range(5)]
+    lines += ["not json", json.dumps({"job_id": "job-x"})]
+    source.write_text("\n".join(lines) + "\n")
+
+    errors = []
+    stats = ingest_records(
+        repository,
+        read_jsonl(source),
+        batch_size=2,
+        on_error=lambda n, m: errors.append(n),
+    )
+    assert (stats.read, stats.inserted, stats.invalid) == (7, 5, 2)
+    assert errors == [6, 7]
+
+    job = repository.get_job_by_id("job-0")
+    assert job.details.details == "**Bold** details"
+    # Offsets are stored as naive UTC like the rest of the table
+    assert job.listing_date.hour == 23
+    # Details written before listings still reach the search index
+    assert {j.job_id for j in repository.search_jobs("bold")} == {
+        f"job-{index}" for index in range(5)
+    }
+
+    version = repository.get_dataset_version()
+    stats = ingest_records(repository, read_jsonl(source))
+    assert (stats.inserted, stats.updated, stats.unchanged) == (0, 0, 5)
+    assert repository.get_dataset_version() == version
+
+    changed = [_record(0, title="Senior Python Developer"), _record(1, details="New")]
+    stats = ingest_records(repository, changed)
+    assert (stats.updated, stats.unchanged) == (2, 0)
+    assert repository.get_job_by_id("job-0").title == "Senior Python Developer"
+    assert repository.get_job_by_id("job-1").details.details == "New"
+
+
+def test_sqlite_ingest(repository, tmp_path):
+    """Test another jobs database can be ingested, with and without details."""
+    source = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'source.db'}")
+    listing_only = {
+        k: v
+        for k, v in _record(1).items()
+        if k not in ("status", "is_expired", "details")
+    }
+    ingest_records(source, [_record(0), listing_only])
+    source.close()
+
+    stats = ingest_records(repository, read_sqlite(tmp_path / "source.db"))
+    assert (stats.read, stats.inserted, stats.invalid) == (2, 2, 0)
+    assert repository.get_job_by_id("job-0").details is not None
+    assert repository.get_job_by_id("job-1").details is None
+
+
+def test_partial_records_keep_omitted_columns(repository):
+    """Test a record without optional fields leaves their stored values alone."""
+    full = _record(0, salary_label="$100k", is_verified=True)
+    ingest_records(repository, [full, _record(1)])
+
+    partial = {
+        name: value
+        for name, value in full.items()
+        if name not in ("salary_label", "is_verified")
+    }
+    unchanged = ingest_records(repository, [partial])
+    changed = ingest_records(repository, [dict(partial, details="New details")])
+
+    assert (unchanged.unchanged, changed.updated) == (1, 1)
+    job = repository.get_job_by_id("job-0")
+    assert job.salary_label == "$100k"
+    assert job.details.is_verified is True
+    assert job.details.details == "New details"
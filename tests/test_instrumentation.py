@@ -0,0 +1,87 @@
+"""Tests for the opt-in request instrumentation middleware."""
+
+import json
+import logging
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.core.database import get_repository
+from src.core.instrumentation import (
+    InstrumentationMiddleware,
+    current_timings,
+    timed,
+)
+from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import SQLiteRepository
+from src.core.response_cache import response_cache
+from src.routers import jobs
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Serve the job routes with instrumentation on an instrumented repository."""
+    repository = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}", instrument_queries=True
+    )
+    with Session(repository.engine) as session:
+        session.add(
+            JobListingModel(
+                job_id="job-1",
+                title="Python Developer",
+                job_details_url="https://example.com",
+                job_summary="Summary",
+                company_name="Acme",
+                location="Sydney",
+                country_code="AU",
+                listing_date=datetime(2025, 1, 1),
+            )
+        )
+        session.add(JobDetailsModel(job_id="job-1", details="**Bold**"))
+        session.commit()
+    response_cache.clear()
+
+    app = FastAPI()
+    app.include_router(jobs.router)
+    app.add_middleware(InstrumentationMiddleware)
+    app.dependency_overrides[get_repository] = lambda: repository
+    yield TestClient(app)
+    repository.close()
+
+
+def _server_timing(response) -> dict[str, str]:
+    """Parse a Server-Timing header into {metric: parameters}."""
+    return {
+        entry.split(";", 1)[0].strip(): entry.split(";", 1)[1]
+        for entry in response.headers["Server-Timing"].split(",")
+    }
+
+
+def test_server_timing_and_log_record(client, caplog):
+    """Test SQL, serialization and render time are reported per request."""
+    with caplog.at_level(logging.INFO, logger="src.core.instrumentation"):
+        listing = client.get("/jobs/?limit=5")
+        details = client.get("/jobs/job-1")
+
+    metrics = _server_timing(listing)
+    assert {"total", "sql", "serialize"} <= metrics.keys()
+    assert "queries" in metrics["sql"]
+    assert "render" in _server_timing(details)
+
+    records = [json.loads(record.getMessage()) for record in caplog.records]
+    assert [record["route"] for record in records] == ["/jobs/", "/jobs/{job_id}"]
+    assert records[0]["status"] == 200
+    assert records[0]["queries"] >= 1
+    assert records[0]["sql_ms"] >= 0
+    assert "serialize_ms" in records[0]
+
+
+def test_timed_is_a_no_op_outside_instrumented_requests():
+    """Test phases are only recorded while a request is being instrumented."""
+    assert current_timings() is None
+    with timed("auth"):
+        pass
+    assert current_timings() is None
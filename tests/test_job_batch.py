@@ -0,0 +1,91 @@
+"""Tests for resolving many jobs at once through POST /jobs/batch."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.models import JobDetailsModel, RenderedDetailsModel
+from src.core.repositories import IN_CLAUSE_CHUNK_SIZE
+from src.routers.common import MAX_BATCH_JOB_IDS
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with three listings, two with details."""
+    repo = make_repository({"title": f"Python Developer {index}"} for index in range(3))
+    with Session(repo.engine) as session:
+        session.add(JobDetailsModel(job_id="job-0", status="Active", details="**A**"))
+        session.add(JobDetailsModel(job_id="job-1", status="Active", details="*B*"))
+        session.commit()
+    return repo
+
+
+def test_batch_keeps_request_order_and_reports_missing(repository):
+    """Test jobs come back in request order, deduplicated, with unknown ids listed."""
+    response = client.post(
+        "/jobs/batch", json={"job_ids": ["job-2", "unknown", "job-0", "job-2"]}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [job["job_id"] for job in body["jobs"]] == ["job-2", "job-0"]
+    assert body["missing"] == ["unknown"]
+    # Details are opt-in
+    assert body["jobs"][1]["details"] is None
+    assert body["jobs"][1]["status"] is None
+
+
+def test_batch_details_rendered_and_cached_in_one_write(repository, monkeypatch):
+    """Test details are rendered for the batch and stored with a single call."""
+    calls = []
+    save = repository.save_rendered_details
+    monkeypatch.setattr(
+        repository,
+        "save_rendered_details",
+        lambda rows: calls.append(rows) or save(rows),
+    )
+
+    body = client.post(
+        "/jobs/batch",
+        json={"job_ids": ["job-0", "job-1", "job-2"], "include_details": True},
+    ).json()
+    details = {job["job_id"]: job["details"] for job in body["jobs"]}
+    assert "<strong>A</strong>" in details["job-0"]
+    assert "<em>B</em>" in details["job-1"]
+    assert details["job-2"] is None
+    assert len(calls) == 1 and len(calls[0]) == 2
+
+    with Session(repository.engine) as session:
+        assert session.query(RenderedDetailsModel).count() == 2
+
+    # Second request is served from the rendered cache
+    client.post("/jobs/batch", json={"job_ids": ["job-0"], "include_details": True})
+    assert len(calls) == 1
+
+
+def test_get_jobs_by_ids_chunks_in_clause(repository):
+    """Test large id lists are split into IN queries below the parameter limit."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM job_listings" in statement:
+            statements.append(statement)
+
+    job_ids = ["job-1"] + [f"x-{n}" for n in range(IN_CLAUSE_CHUNK_SIZE + 10)]
+    event.listen(repository.read_engine, "before_cursor_execute", record)
+    try:
+        jobs = repository.get_jobs_by_ids(job_ids)
+    finally:
+        event.remove(repository.read_engine, "before_cursor_execute", record)
+    assert [job.job_id for job in jobs] == ["job-1"]
+    assert len(statements) == 2
+
+
+def test_batch_rejects_empty_and_oversized_lists(repository):
+    """Test the id list must hold between one and MAX_BATCH_JOB_IDS ids."""
+    assert client.post("/jobs/batch", json={"job_ids": []}).status_code == 400
+    too_many = [f"job-{n}" for n in range(MAX_BATCH_JOB_IDS + 1)]
+    assert client.post("/jobs/batch", json={"job_ids": too_many}).status_code == 400
@@ -3,10 +3,12 @@ from unittest import mock
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from main import app
 from src.core.database import get_repository
 from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import SQLiteRepository
 
 client = TestClient(app)
 
@@ -40,6 +42,7 @@ def test_get_job_by_id_markdown_conversion():
 
     # Configure mock
     mock_repo.get_job_by_id.return_value = job
+    mock_repo.get_dataset_version.return_value = None
 
     # Override dependency
     app.dependency_overrides[get_repository] = lambda: mock_repo
@@ -58,3 +61,41 @@ def test_get_job_by_id_markdown_conversion():
     print(data["details"])
     assert "<strong>Markdown Bold</strong>" in data["details"]
     assert "<em>Italic</em>" in data["details"]
+
+
+def test_rendered_details_are_cached_and_refreshed(tmp_path):
+    """Test details HTML is stored on first view and re-rendered after edits."""
+    repo = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    with Session(repo.engine) as session:
+        session.add(
+            JobListingModel(
+                job_id="job-1",
+                title="Job",
+                job_details_url="https://example.com",
+                job_summary="Summary",
+                company_name="Acme",
+                location="Sydney",
+                country_code="AU",
+                listing_date=datetime.now(),
+            )
+        )
+        session.add(JobDetailsModel(job_id="job-1", details="**Bold**"))
+        session.commit()
+
+    app.dependency_overrides[get_repository] = lambda: repo
+    try:
+        assert "<strong>Bold</strong>" in client.get("/jobs/job-1").json()["details"]
+        with mock.patch("src.core.rendering.render_details") as render:
+            cached = client.get("/jobs/job-1").json()["details"]
+        render.assert_not_called()
+        assert "<strong>Bold</strong>" in cached
+
+        with Session(repo.engine) as session:
+            session.get(JobDetailsModel, "job-1").details = "*Edited*"
+            session.commit()
+        assert "<em>Edited</em>" in client.get("/jobs/job-1").json()["details"]
+    finally:
+        app.dependency_overrides = {}
+        repo.close()
+
+    assert list(repo.get_rendered_details_hashes()) == ["job-1"]
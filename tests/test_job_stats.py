@@ -0,0 +1,98 @@
+"""Tests for the materialized job statistics and the timeline endpoint."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from main import app
+from src.core.models import JobListingModel
+from src.core.repositories import SQLiteRepository
+
+client = TestClient(app)
+
+NOW = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _add_jobs(repository: SQLiteRepository, hours_ago: list[float]) -> None:
+    """Insert one listing per entry, listed that many hours ago."""
+    with Session(repository.engine) as session:
+        for index, hours in enumerate(hours_ago):
+            session.add(
+                JobListingModel(
+                    job_id=f"job-{index}",
+                    title="Python Developer",
+                    job_details_url="https://example.com",
+                    job_summary="Summary",
+                    company_name="Acme",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=NOW - timedelta(hours=hours),
+                )
+            )
+        session.commit()
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with listings spread over three days."""
+    repo = make_repository(version_check_seconds=0)
+    _add_jobs(repo, [0, 0.5, 10, 23.5, 24.5, 30, 60])
+    return repo
+
+
+def _scanned_stats(repository: SQLiteRepository) -> dict[str, int]:
+    """Count stats the old way, straight from job_listings."""
+    repository.job_stats = False
+    try:
+        return repository._count_job_stats()
+    finally:
+        repository.job_stats = True
+
+
+def test_buckets_follow_inserts_updates_and_deletes(repository):
+    """Test the triggers keep the buckets equal to a full recount."""
+    assert repository.get_job_stats() == _scanned_stats(repository)
+    assert repository.get_job_stats() == {"total_jobs": 7, "new_jobs": 4}
+
+    with Session(repository.engine) as session:
+        session.execute(
+            update(JobListingModel)
+            .where(JobListingModel.job_id == "job-6")
+            .values(listing_date=NOW)
+        )
+        session.execute(
+            delete(JobListingModel).where(JobListingModel.job_id == "job-0")
+        )
+        session.commit()
+
+    repository.read_cache.clear()
+    assert repository.get_job_stats() == _scanned_stats(repository)
+    assert repository.get_job_stats() == {"total_jobs": 6, "new_jobs": 4}
+
+    before = repository.get_job_stats_timeline("hour", NOW - timedelta(days=5))
+    repository.rebuild_job_stats()
+    assert repository.get_job_stats_timeline("hour", NOW - timedelta(days=5)) == before
+
+
+def test_timeline_endpoint(repository):
+    """Test the timeline sums hourly buckets into days."""
+    response = client.get(
+        "/jobs/stats/timeline",
+        params={"granularity": "day", "since": (NOW - timedelta(days=5)).isoformat()},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["granularity"] == "day"
+    assert sum(bucket["job_count"] for bucket in data["buckets"]) == 7
+    starts = [bucket["start"] for bucket in data["buckets"]]
+    assert starts == sorted(starts)
+
+    hourly = client.get("/jobs/stats/timeline?granularity=hour").json()
+    # Default hourly window is 48 hours
+    assert sum(bucket["job_count"] for bucket in hourly["buckets"]) == 6
+
+    invalid = client.get("/jobs/stats/timeline?granularity=week")
+    assert invalid.status_code == 400
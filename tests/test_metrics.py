@@ -0,0 +1,107 @@
+"""Tests for the Prometheus metrics registry and /metrics."""
+
+import json
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.metrics import MetricsRegistry, registry, track_repository
+from src.core.repositories import SQLiteRepository
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with one listing."""
+    return make_repository([{"job_id": "job-1"}])
+
+
+def _sample(text: str, series: str) -> float:
+    """Read the value of one series from the exposition text, 0 if absent."""
+    match = re.search(f"^{re.escape(series)} (\\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_pool_timing_survives_dispose(tmp_path):
+    """Test checkouts are still timed after engine.dispose() replaces the pool."""
+    repo = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    track_repository(repo, prefix="dispose_")
+    series = 'jobs_api_db_pool_checkout_seconds_count{pool="dispose_write"}'
+
+    repo.engine.dispose()
+    before = _sample(registry.render(), series)
+    repo.get_job_by_id("job-1")
+    after = _sample(registry.render(), series)
+    repo.close()
+
+    assert after > before
+
+
+def test_metrics_endpoint_reports_requests_pools_and_caches(repository):
+    """Test /metrics exposes request, pool and cache metrics per route template."""
+    track_repository(repository, prefix="test_")
+    details = (
+        'jobs_api_requests_total{method="GET",route="/jobs/{job_id}",status="200"}'
+    )
+    before = _sample(client.get("/metrics").text, details)
+
+    client.get("/jobs/job-1")
+    client.get("/jobs/job-1")
+    client.get("/jobs/")
+    client.get("/jobs/")
+    text = client.get("/metrics").text
+
+    assert _sample(text, details) == before + 2
+    assert "# TYPE jobs_api_request_duration_seconds histogram" in text
+    listing = 'method="GET",route="/jobs/"'
+    assert _sample(
+        text, f'jobs_api_request_duration_seconds_bucket{{{listing},le="+Inf"}}'
+    ) == _sample(text, f"jobs_api_request_duration_seconds_count{{{listing}}}")
+    # The /metrics request itself is in flight while rendering
+    assert _sample(text, "jobs_api_requests_in_flight") == 1
+    assert (
+        _sample(text, 'jobs_api_db_pool_checkout_seconds_count{pool="test_write"}') > 0
+    )
+    assert _sample(text, 'jobs_api_cache_hits_total{cache="response"}') >= 1
+    assert 0 < _sample(text, 'jobs_api_cache_hit_ratio{cache="response"}') <= 1
+
+
+def test_histogram_exposition():
+    """Test buckets are cumulative and end with +Inf, sum and count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, route="/x")
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_sum{route="/x"} 4.05' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+
+
+def test_multiprocess_snapshots_are_merged(tmp_path):
+    """Test counters add up across workers while gauges of exited workers drop out."""
+    registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+    requests = registry.counter("requests_total", "Requests.")
+    in_flight = registry.gauge("in_flight", "In flight.")
+    requests.inc(route="/a")
+    in_flight.inc()
+
+    # Snapshot left behind by a worker that has exited
+    other = MetricsRegistry()
+    other.counter("requests_total", "Requests.").inc(2, route="/a")
+    other.gauge("in_flight", "In flight.").inc(5)
+    snapshot = other.snapshot()
+    snapshot["pid"] = 2**22 + 1
+    (tmp_path / "dead.json").write_text(json.dumps(snapshot))
+
+    registry.write_snapshot()
+    assert (tmp_path / f"{registry.snapshot()['pid']}.json").exists()
+    text = registry.render()
+    assert 'requests_total{route="/a"} 3' in text
+    assert "in_flight 1" in text
@@ -0,0 +1,111 @@
+"""Assert repository queries are served by indexes, via EXPLAIN QUERY PLAN."""
+
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from src.core.repositories import SQLiteRepository
+
+# A full scan shows up as "SCAN <table>" without "USING ... INDEX"
+FULL_SCAN = re.compile(r"^SCAN (job_listings|job_details|favorite_jobs)(?! USING)")
+
+REPOSITORY_QUERIES = {
+    "all_jobs": lambda repo: repo.get_all_jobs(),
+    "jobs_by_classification": lambda repo: repo.get_all_jobs(job_classification="IT"),
+    "jobs_by_classification_and_sub": lambda repo: repo.get_all_jobs(
+        job_classification="IT", job_sub_classification="Dev"
+    ),
+    "jobs_by_sub_classification": lambda repo: repo.get_all_jobs(
+        job_sub_classification="Dev"
+    ),
+    "jobs_by_work_arrangements": lambda repo: repo.get_all_jobs(
+        work_arrangements="Remote"
+    ),
+    "jobs_after_cursor": lambda repo: repo.get_all_jobs(
+        job_classification="IT", after=(datetime(2025, 1, 1), "job-1")
+    ),
+    "export_jobs": lambda repo: list(repo.iter_jobs()),
+    "export_jobs_by_classification": lambda repo: list(
+        repo.iter_jobs(job_classification="IT")
+    ),
+    "jobs_with_favorites": lambda repo: repo.get_all_jobs_with_favorites(
+        1, job_classification="IT"
+    ),
+    "search_with_favorites": lambda repo: repo.search_jobs_with_snippets(
+        "python", api_key_id=1
+    ),
+    "facets": lambda repo: repo.get_job_facets(),
+    "facets_by_classification": lambda repo: repo.get_job_facets(
+        job_classification="IT"
+    ),
+    "job_by_id": lambda repo: repo.get_job_by_id("job-1"),
+    "jobs_by_ids": lambda repo: repo.get_jobs_by_ids(["job-1", "job-2"], True),
+    "job_stats": lambda repo: repo.get_job_stats(),
+    "job_stats_timeline": lambda repo: repo.get_job_stats_timeline(
+        "day", datetime(2025, 1, 1)
+    ),
+    "classifications": lambda repo: repo.get_all_job_classifications(),
+    "sub_classifications": lambda repo: repo.get_all_job_sub_classifications(),
+    "work_arrangements": lambda repo: repo.get_all_work_arrangements(),
+    "full_text_search": lambda repo: repo.search_jobs("python"),
+    "favorite_jobs": lambda repo: repo.get_favorite_jobs(api_key_id=1),
+    "favorite_jobs_after_cursor": lambda repo: repo.get_favorite_jobs(
+        api_key_id=1, after=(datetime(2025, 1, 1), 10)
+    ),
+    "is_job_favorited": lambda repo: repo.is_job_favorited(1, "job-1"),
+    "favorite_job_ids": lambda repo: repo.get_user_favorite_job_ids(1),
+    "favorite_job_ids_among": lambda repo: repo.get_user_favorite_job_ids(
+        1, ["job-1", "job-2"]
+    ),
+}
+
+
+@pytest.fixture
+def repository():
+    """Create an in-memory repository with all declared indexes."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    yield repo
+    repo.close()
+
+
+def _capture_queries(repository, run) -> list[tuple[str, tuple]]:
+    """Run a repository call and return the SELECT statements it executed."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(repository.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run(repository)
+    finally:
+        event.remove(repository.engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+@pytest.mark.parametrize("name", REPOSITORY_QUERIES)
+def test_repository_query_uses_index(repository, name):
+    """Test no repository query falls back to a full table scan."""
+    statements = _capture_queries(repository, REPOSITORY_QUERIES[name])
+    assert statements, f"{name} executed no SELECT"
+
+    with repository.engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            details = [row[-1] for row in plan]
+            scans = [detail for detail in details if FULL_SCAN.match(detail)]
+            assert not scans, f"{name} scans a table: {details}"
+
+
+def test_ensure_indexes_adds_missing_indexes(repository):
+    """Test indexes dropped from an existing table are recreated."""
+    with repository.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_job_listings_listing_date")
+
+    assert repository.ensure_indexes() == ["ix_job_listings_listing_date"]
+    assert repository.ensure_indexes() == []
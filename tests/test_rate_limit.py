@@ -0,0 +1,85 @@
+"""Tests for per-API-key rate limiting."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.database import get_repository
+from src.core.rate_limit import (
+    InMemoryRateLimitBackend,
+    SQLiteRateLimitBackend,
+    rate_limiter,
+)
+from src.core.repositories import SQLiteRepository
+from src.core.security import (
+    generate_api_key,
+    get_key_lookup_id,
+    get_key_prefix,
+    hash_api_key,
+)
+
+
+def test_in_memory_backend_enforces_limit():
+    """Test requests beyond the limit are rejected with a retry delay."""
+    backend = InMemoryRateLimitBackend()
+
+    statuses = [backend.hit("1", limit=3, window_seconds=3600) for _ in range(4)]
+
+    assert [s.allowed for s in statuses] == [True, True, True, False]
+    assert [s.remaining for s in statuses[:3]] == [2, 1, 0]
+    assert statuses[3].retry_after >= 1
+    assert backend.hit("2", limit=3, window_seconds=3600).allowed
+
+
+def test_sqlite_backend_shares_counters(tmp_path):
+    """Test two backend instances on one file share the same counters."""
+    path = str(tmp_path / "rate_limits.db")
+    first = SQLiteRateLimitBackend(path)
+    second = SQLiteRateLimitBackend(path)
+
+    assert first.hit("1", limit=2, window_seconds=3600).allowed
+    assert second.hit("1", limit=2, window_seconds=3600).allowed
+    assert not first.hit("1", limit=2, window_seconds=3600).allowed
+
+
+@pytest.fixture
+def limited_client(tmp_path):
+    """Create a client and an API key limited to two requests per window."""
+    repository = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    plain_key = generate_api_key()
+    repository.create_api_key(
+        key_hash=hash_api_key(plain_key),
+        key_prefix=get_key_prefix(plain_key),
+        lookup_id=get_key_lookup_id(plain_key),
+        name="Limited",
+        email="limited@example.com",
+        rate_limit=2,
+    )
+
+    original_backend = rate_limiter.backend
+    rate_limiter.backend = InMemoryRateLimitBackend()
+    app.dependency_overrides[get_repository] = lambda: repository
+    try:
+        yield TestClient(app), plain_key
+    finally:
+        app.dependency_overrides = {}
+        rate_limiter.backend = original_backend
+        repository.close()
+
+
+def test_rate_limited_request_returns_429(limited_client):
+    """Test the third request in the window is rejected with rate limit headers."""
+    client, plain_key = limited_client
+    headers = {"X-API-Key": plain_key}
+
+    response = client.get("/favorites/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Limit"] == "2"
+    assert response.headers["X-RateLimit-Remaining"] == "1"
+
+    assert client.get("/favorites/", headers=headers).status_code == 200
+
+    response = client.get("/favorites/", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.headers["X-RateLimit-Remaining"] == "0"
@@ -1,7 +1,14 @@
 """Simple repository tests."""
 
+from datetime import datetime
+
 import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
+from src.core.exceptions import InvalidInputError
+from src.core.models import JobListingModel
+from src.core.pagination import decode_cursor, encode_cursor
 from src.core.repositories import SQLiteRepository
 
 
@@ -47,3 +54,163 @@ def test_search_jobs_empty(test_repository):
     """Test searching in empty database."""
     jobs = test_repository.search_jobs(keyword="test")
     assert jobs == []
+
+
+def _add_listings(repository, count: int) -> None:
+    """Insert listings where several share a listing date."""
+    with Session(repository.engine) as session:
+        for index in range(count):
+            session.add(
+                JobListingModel(
+                    job_id=f"job-{index:03d}",
+                    title=f"Job {index}",
+                    job_details_url="https://example.com",
+                    job_summary="Summary",
+                    company_name="Acme",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=datetime(2025, 1, 1 + index // 3),
+                    job_classification="IT" if index % 2 else "Sales",
+                )
+            )
+        session.commit()
+
+
+def test_keyset_pagination_walks_all_jobs(test_repository):
+    """Test following (listing_date, job_id) keys visits every job exactly once."""
+    _add_listings(test_repository, 10)
+
+    seen = []
+    after = None
+    while True:
+        page = test_repository.get_all_jobs(limit=4, after=after)
+        seen.extend(job.job_id for job in page)
+        if len(page) < 4:
+            break
+        after = (page[-1].listing_date, page[-1].job_id)
+
+    assert seen == [job.job_id for job in test_repository.get_all_jobs(limit=100)]
+    assert sorted(seen) == [f"job-{index:03d}" for index in range(10)]
+    assert seen[0] == "job-009"
+
+
+def test_cursor_round_trip():
+    """Test cursors decode to the encoded sort key and reject other listings."""
+    listing_date = datetime(2025, 1, 2, 3, 4, 5)
+    cursor = encode_cursor("jobs", listing_date, "job-001")
+
+    assert decode_cursor(cursor, "jobs", datetime.fromisoformat, str) == (
+        listing_date,
+        "job-001",
+    )
+    with pytest.raises(InvalidInputError):
+        decode_cursor(cursor, "favorites", datetime.fromisoformat, int)
+    with pytest.raises(InvalidInputError):
+        decode_cursor("not-a-cursor", "jobs", datetime.fromisoformat, str)
+
+
+def test_job_facets_counts_values(test_repository):
+    """Test facets return counts for every facet column and honour filters."""
+    _add_listings(test_repository, 10)
+
+    facets = test_repository.get_job_facets()
+    assert facets["job_classification"] == {"IT": 5, "Sales": 5}
+    assert facets["job_sub_classification"] == {}
+
+    filtered = test_repository.get_job_facets(job_classification="IT")
+    assert filtered["job_classification"] == {"IT": 5}
+
+
+def test_read_cache_follows_dataset_version(tmp_path):
+    """Test cached reads are reused until job data changes."""
+    repository = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}", version_check_seconds=0
+    )
+    _add_listings(repository, 4)
+
+    first = repository.get_job_facets()
+    assert repository.get_job_facets() is first
+    assert repository.read_cache.stats()["hits"] == 1
+
+    # Writes to unrelated tables keep the version
+    version = repository.get_dataset_version()
+    repository.create_api_key("hash", "sk_live_x", "Test", "test@example.com")
+    assert repository.get_dataset_version() == version
+
+    with Session(repository.engine) as session:
+        session.get(JobListingModel, "job-000").job_classification = "IT"
+        session.commit()
+
+    assert repository.get_dataset_version() != version
+    assert repository.get_job_facets()["job_classification"] == {"IT": 3, "Sales": 1}
+    assert repository.get_all_job_classifications() == ["IT", "Sales"]
+    repository.close()
+
+
+def test_dataset_version_is_throttled(test_repository):
+    """Test the version counter is only re-read after the check interval."""
+    test_repository.dataset_version.check_interval_seconds = 3600
+    version = test_repository.get_dataset_version()
+
+    _add_listings(test_repository, 1)
+    assert test_repository.get_dataset_version() == version
+
+    test_repository.dataset_version.invalidate()
+    assert test_repository.get_dataset_version() == version + 1
+
+
+def test_sqlite_profile_and_read_only_pool(tmp_path):
+    """Test PRAGMAs are applied per connection and the read pool cannot write."""
+    repository = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}",
+        sqlite_pragmas={"journal_mode": "WAL", "busy_timeout": 1234},
+        read_only_pool=True,
+    )
+    _add_listings(repository, 2)
+
+    with repository.read_engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+        assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 1
+        with pytest.raises(OperationalError):
+            connection.exec_driver_sql("DELETE FROM job_listings")
+
+    assert len(repository.get_all_jobs()) == 2
+    repository.close()
+
+
+def test_failed_pragma_does_not_skip_the_rest(tmp_path, caplog):
+    """Test a rejected PRAGMA is logged and later PRAGMAs are still applied."""
+    repository = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}",
+        sqlite_pragmas={"synchronous": "OFF OFF", "busy_timeout": 1234},
+    )
+
+    with repository.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+    assert "PRAGMA synchronous=OFF OFF" in caplog.text
+    repository.close()
+
+
+def test_listings_and_search_flag_favorites(test_repository):
+    """Test is_favorite is computed per page for the requesting key only."""
+    _add_listings(test_repository, 4)
+    owner = test_repository.create_api_key("hash-1", "sk_live_1", "One", "1@x.com")
+    other = test_repository.create_api_key("hash-2", "sk_live_2", "Two", "2@x.com")
+    test_repository.add_favorite_job(owner.id, "job-001")
+    test_repository.add_favorite_job(other.id, "job-002")
+
+    results = test_repository.get_all_jobs_with_favorites(owner.id)
+    flags = {result.job.job_id: result.is_favorite for result in results}
+    assert flags == {
+        "job-000": False,
+        "job-001": True,
+        "job-002": False,
+        "job-003": False,
+    }
+
+    anonymous = test_repository.get_all_jobs_with_favorites(None)
+    assert not any(result.is_favorite for result in anonymous)
+
+    hits = test_repository.search_jobs_with_snippets("Job 1", api_key_id=owner.id)
+    assert [(hit.job.job_id, hit.is_favorite) for hit in hits] == [("job-001", True)]
@@ -0,0 +1,99 @@
+"""Tests for the shared cache of serialized list and search pages."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.cache import QueryCache
+from src.core.repositories import SQLiteRepository
+from src.core.response_cache import response_cache
+from src.core.security import (
+    generate_api_key,
+    get_key_lookup_id,
+    get_key_prefix,
+    hash_api_key,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(make_repository):
+    """Create a file-backed repository with a few listings."""
+    return make_repository(
+        {
+            "title": f'Python "Developer" {index}',
+            "job_summary": '"is_favorite":false',
+            "job_classification": "IT",
+        }
+        for index in range(3)
+    )
+
+
+def _create_key(repository: SQLiteRepository, email: str) -> tuple[str, int]:
+    """Create an API key, return the plain key and its id."""
+    plain_key = generate_api_key()
+    model = repository.create_api_key(
+        key_hash=hash_api_key(plain_key),
+        key_prefix=get_key_prefix(plain_key),
+        lookup_id=get_key_lookup_id(plain_key),
+        name="Test User",
+        email=email,
+    )
+    return plain_key, model.id
+
+
+def test_repeated_page_is_served_from_cache(repository, monkeypatch):
+    """Test a repeated query skips the listing query and returns the same bytes."""
+    # Hit counters are cumulative (they back /metrics), so compare deltas
+    hits = response_cache.stats()["hits"]
+    first = client.get("/jobs/?limit=2&job_classification=IT")
+    assert first.headers["X-Cache"] == "MISS"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("listing query ran on a cache hit")
+
+    monkeypatch.setattr(repository, "get_job_rows", fail)
+    second = client.get("/jobs/?limit=2&job_classification=IT")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert response_cache.stats()["hits"] == hits + 1
+
+
+def test_favorites_are_overlaid_per_caller(repository):
+    """Test shared pages carry each caller's own is_favorite flags."""
+    owner_key, owner_id = _create_key(repository, "owner@example.com")
+    other_key, _ = _create_key(repository, "other@example.com")
+    repository.add_favorite_job(owner_id, "job-1")
+
+    # The owner's miss must not leak their flag into the shared entry
+    owner = client.get("/jobs/", headers={"X-API-Key": owner_key})
+    other = client.get("/jobs/", headers={"X-API-Key": other_key})
+    owner_again = client.get("/jobs/", headers={"X-API-Key": owner_key})
+    search = client.get("/jobs/search?keyword=python", headers={"X-API-Key": owner_key})
+
+    assert owner.headers["X-Cache"] == "MISS"
+    assert other.headers["X-Cache"] == owner_again.headers["X-Cache"] == "HIT"
+    flagged = {job["job_id"] for job in owner.json() if job["is_favorite"]}
+    assert flagged == {"job-1"}
+    assert not any(job["is_favorite"] for job in other.json())
+    assert owner_again.json() == owner.json()
+    assert owner.json()[0]["job_summary"] == '"is_favorite":false'
+    assert {job["job_id"] for job in search.json() if job["is_favorite"]} == {"job-1"}
+
+
+def test_byte_budget_evicts_least_recently_used():
+    """Test the cache stays within its byte budget."""
+    cache = QueryCache(max_entries=100, ttl_seconds=60, max_bytes=100)
+    cache.put("a", "a", size=60)
+    cache.put("b", "b", size=30)
+    cache.get("a")
+    cache.put("c", "c", size=30)
+    cache.put("huge", "x", size=101)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" and cache.get("c") == "c"
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 90
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,173 @@
+"""Tests for full-text job search."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.core.models import JobDetailsModel, JobListingModel
+from src.core.repositories import SQLiteRepository
+from src.core.search_index import KEYS_TABLE, SEARCH_TABLE, build_fts_query
+
+JOBS = [
+    ("job-1", "Python Developer", "Build APIs with FastAPI"),
+    ("job-2", "Senior Java Engineer", "Spring Boot services, some Python scripting"),
+    ("job-3", "Head Chef", "Run a busy kitchen"),
+]
+
+
+def _add_jobs(repository: SQLiteRepository) -> None:
+    """Insert sample listings with details."""
+    with Session(repository.engine) as session:
+        for index, (job_id, title, details) in enumerate(JOBS):
+            session.add(
+                JobListingModel(
+                    job_id=job_id,
+                    title=title,
+                    job_details_url=f"https://example.com/{job_id}",
+                    job_summary="Summary",
+                    company_name="Acme",
+                    location="Sydney",
+                    country_code="AU",
+                    listing_date=datetime(2025, 1, index + 1),
+                )
+            )
+            session.add(
+                JobDetailsModel(
+                    job_id=job_id, status="Active", is_expired=False, details=details
+                )
+            )
+        session.commit()
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "like"])
+def repository(request):
+    """Create an in-memory repository with and without the FTS5 index."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:", full_text_search=request.param)
+    _add_jobs(repo)
+    yield repo
+    repo.close()
+
+
+def test_build_fts_query():
+    """Test keywords become prefix terms and quoted phrases."""
+    assert build_fts_query("python dev") == '"python"* "dev"*'
+    assert build_fts_query('"java engineer" remote') == '"java engineer" "remote"*'
+    assert build_fts_query("c++") is None
+    assert build_fts_query("--") is None
+
+
+def test_search_matches_all_fields(repository):
+    """Test search finds keywords in titles and details."""
+    assert {job.job_id for job in repository.search_jobs("python")} == {
+        "job-1",
+        "job-2",
+    }
+    assert [job.job_id for job in repository.search_jobs("kitchen")] == ["job-3"]
+
+
+def test_fts_ranks_title_matches_first():
+    """Test bm25 ranking prefers title matches and snippets are highlighted."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    _add_jobs(repo)
+
+    results = repo.search_jobs_with_snippets("python")
+
+    assert repo.full_text_search
+    assert [result.job.job_id for result in results] == ["job-1", "job-2"]
+    assert results[0].snippet == "<mark>Python</mark> Developer"
+    assert results[0].rank < results[1].rank
+    assert [job.job_id for job in repo.search_jobs('"java engineer"')] == ["job-2"]
+    repo.close()
+
+
+def test_fts_snippets_escape_job_text():
+    """Test snippets HTML-escape the indexed text and keep only <mark> tags."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    _add_jobs(repo)
+    with Session(repo.engine) as session:
+        session.get(JobListingModel, "job-1").title = 'Python <script>"x"</script> & Co'
+        session.commit()
+
+    result = repo.search_jobs_with_snippets("script")[0]
+
+    assert result.job.job_id == "job-1"
+    assert result.snippet == (
+        "Python &lt;<mark>script</mark>&gt;&quot;x&quot;&lt;/<mark>script</mark>&gt;"
+        " &amp; Co"
+    )
+    repo.close()
+
+
+def test_fts_index_follows_updates():
+    """Test triggers keep the index in sync with listing and detail changes."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    _add_jobs(repo)
+
+    with Session(repo.engine) as session:
+        session.get(JobListingModel, "job-3").title = "Sous Chef"
+        session.get(JobDetailsModel, "job-1").details = "Rust services"
+        session.delete(session.get(JobDetailsModel, "job-2"))
+        session.delete(session.get(JobListingModel, "job-2"))
+        session.commit()
+
+    assert [job.job_id for job in repo.search_jobs("sous")] == ["job-3"]
+    assert [job.job_id for job in repo.search_jobs("rust")] == ["job-1"]
+    assert repo.search_jobs("spring") == []
+    assert repo.rebuild_search_index() == 2
+    repo.close()
+
+
+def _index_rows(repository: SQLiteRepository) -> list[tuple]:
+    """Return (job_id, title) for every row in the full-text index."""
+    with repository.engine.connect() as connection:
+        return connection.exec_driver_sql(
+            f"SELECT job_id, title FROM {SEARCH_TABLE} ORDER BY job_id"
+        ).all()
+
+
+def test_fts_index_survives_replace_and_vacuum(tmp_path):
+    """Test REPLACE and VACUUM, which renumber listing rowids, keep one row per job."""
+    repo = SQLiteRepository(db_url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    _add_jobs(repo)
+
+    with repo.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT OR REPLACE INTO job_listings "
+            "(job_id, title, job_details_url, job_summary, company_name, location,"
+            " country_code, listing_date) "
+            "SELECT job_id, 'Rust Developer', job_details_url, job_summary,"
+            " company_name, location, country_code, listing_date "
+            "FROM job_listings WHERE job_id = 'job-1'"
+        )
+        connection.exec_driver_sql("DELETE FROM job_listings WHERE job_id = 'job-2'")
+    with repo.engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.exec_driver_sql("VACUUM")
+    with Session(repo.engine) as session:
+        session.get(JobListingModel, "job-3").title = "Sous Chef"
+        session.commit()
+
+    assert _index_rows(repo) == [("job-1", "Rust Developer"), ("job-3", "Sous Chef")]
+    assert [job.job_id for job in repo.search_jobs("rust")] == ["job-1"]
+    assert [job.job_id for job in repo.search_jobs("chef")] == ["job-3"]
+    assert repo.search_jobs("python") == []
+    repo.close()
+
+
+def test_fts_index_keyed_on_rowid_is_rebuilt(tmp_path):
+    """Test an index from before job_id keys is dropped and rebuilt on startup."""
+    db_url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    repo = SQLiteRepository(db_url=db_url)
+    _add_jobs(repo)
+    with repo.engine.begin() as connection:
+        connection.exec_driver_sql(f"DROP TABLE {KEYS_TABLE}")
+        connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE}")
+    repo.close()
+
+    repo = SQLiteRepository(db_url=db_url)
+
+    assert [row[0] for row in _index_rows(repo)] == ["job-1", "job-2", "job-3"]
+    assert [job.job_id for job in repo.search_jobs("kitchen")] == ["job-3"]
+    repo.close()
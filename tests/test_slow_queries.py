@@ -0,0 +1,110 @@
+"""Tests for the slow query log and /admin/slow-queries."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from main import app
+from src.core import slow_queries
+from src.core.config import settings
+from src.core.repositories import SQLiteRepository
+from src.core.slow_queries import fingerprint, redact_parameters, slow_query_log
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    """Create a repository whose every statement counts as slow."""
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0.0)
+    repo = SQLiteRepository(
+        db_url=f"sqlite:///{tmp_path / 'jobs.db'}", log_slow_queries=True
+    )
+    slow_query_log.clear()
+    yield repo
+    repo.close()
+    slow_query_log.clear()
+
+
+def _entry(statement_fragment: str) -> dict:
+    """Find the log entry for a statement."""
+    matches = [
+        entry
+        for entry in slow_query_log.entries()
+        if statement_fragment in entry["statement"]
+    ]
+    assert len(matches) == 1
+    return matches[0]
+
+
+def test_slow_statements_are_deduplicated_with_plans(repository):
+    """Test repeats of a statement share one entry that carries its plan."""
+    statement = text("SELECT job_id FROM job_listings WHERE job_summary = :summary")
+    with repository.engine.connect() as connection:
+        connection.execute(statement, {"summary": "first"})
+        connection.execute(statement, {"summary": "second"})
+
+    entry = _entry("WHERE job_summary")
+    assert entry["count"] == 2
+    assert entry["full_scan"] is True
+    assert any(line.strip().startswith("SCAN job_listings") for line in entry["plan"])
+    assert entry["parameters"] in (["first"], ["second"])
+
+    repository.get_job_by_id("job-1")
+    indexed = _entry("WHERE job_listings.job_id = ?")
+    assert indexed["full_scan"] is False
+    assert any("USING" in line for line in indexed["plan"])
+
+
+def test_plans_are_captured_when_the_log_is_read(repository, monkeypatch):
+    """Test EXPLAIN runs when entries() is read, not while the statement runs."""
+    explained = []
+    explain = slow_queries._explain
+
+    def recording_explain(engine, statement, parameters):
+        explained.append(statement)
+        return explain(engine, statement, parameters)
+
+    monkeypatch.setattr(slow_queries, "_explain", recording_explain)
+    with repository.engine.connect() as connection:
+        connection.execute(text("SELECT job_id FROM job_listings WHERE title = 'x'"))
+
+    assert explained == []
+    assert _entry("WHERE title")["full_scan"] is True
+    assert len(explained) == 1
+
+
+def test_fingerprint_and_redaction():
+    """Test IN lists of any length share a fingerprint and secrets are hidden."""
+    assert fingerprint("SELECT 1 FROM t WHERE id IN (?, ?)") == fingerprint(
+        "SELECT 1 FROM t WHERE id IN (?, ?, ?, ?)"
+    )
+    assert fingerprint("SELECT 1 FROM t WHERE id = 5") == fingerprint(
+        "SELECT 1  FROM t WHERE id = 7"
+    )
+    assert redact_parameters(
+        "SELECT * FROM api_keys WHERE lookup_id = ? AND id = ?", ("sk_live_abc", 3)
+    ) == ["<redacted>", 3]
+    assert redact_parameters("SELECT ?", ("x" * 500,)) == ["x" * 100 + "..."]
+    assert redact_parameters("INSERT ...", [(1, "a"), (2, "b")]) == [1, "a"]
+
+
+def test_admin_endpoint_requires_token(repository, monkeypatch):
+    """Test the log is only readable and clearable with the admin token."""
+    with repository.engine.connect() as connection:
+        connection.execute(text("SELECT count(*) FROM job_listings"))
+
+    monkeypatch.setattr(settings, "admin_token", None)
+    assert client.get("/admin/slow-queries").status_code == 401
+
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    assert (
+        client.get("/admin/slow-queries", headers={"X-Admin-Token": "nope"})
+    ).status_code == 401
+    response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["threshold_ms"] == 0.0
+    assert any("count(*)" in entry["statement"] for entry in response.json()["entries"])
+
+    cleared = client.delete("/admin/slow-queries", headers={"X-Admin-Token": "s3cret"})
+    assert cleared.json()["entries"] == []
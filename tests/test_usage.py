@@ -0,0 +1,55 @@
+"""Tests for write-behind API key usage buffering."""
+
+from unittest import mock
+
+import pytest
+
+from src.core.repositories import SQLiteRepository
+from src.core.usage import UsageBuffer
+
+
+@pytest.fixture
+def repository():
+    """Create a repository backed by an in-memory database."""
+    repo = SQLiteRepository(db_url="sqlite:///:memory:")
+    yield repo
+    repo.close()
+
+
+def _create_key(repository, email: str) -> int:
+    """Store an API key and return its ID."""
+    api_key = repository.create_api_key(
+        key_hash=f"hash-{email}", key_prefix="sk_live_test", name="Test", email=email
+    )
+    return api_key.id
+
+
+def test_flush_applies_buffered_counts(repository):
+    """Test buffered requests are written as one increment per key."""
+    first = _create_key(repository, "first@example.com")
+    second = _create_key(repository, "second@example.com")
+    buffer = UsageBuffer(flush_interval_seconds=60, flush_max_events=1000)
+
+    for _ in range(3):
+        buffer.record(first)
+    buffer.record(second)
+
+    assert buffer.flush(repository) == 2
+    assert buffer.flush(repository) == 0
+
+    keys = {key.id: key for key in repository.get_all_api_keys()}
+    assert keys[first].request_count == 3
+    assert keys[second].request_count == 1
+    assert keys[first].last_used_at is not None
+
+
+def test_failed_flush_keeps_usage():
+    """Test usage is retained when the bulk update fails."""
+    repository = mock.Mock()
+    repository.bulk_update_api_key_usage.side_effect = RuntimeError("locked")
+    buffer = UsageBuffer(flush_interval_seconds=60, flush_max_events=1000)
+    buffer.record(7)
+    buffer.record(7)
+
+    assert buffer.flush(repository) == 0
+    assert buffer.drain()[7][0] == 2